@@ -1,8 +1,16 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import uuid
 import os
+import sys
+from pathlib import Path
+
+# IdFactory lives with the generators in src/python, imported by module name
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / 'src' / 'python'))
+from id_factory import IdFactory
+
+# Seed for the ID factory, so every run issues the same IDs
+RANDOM_SEED = 42
 
 print("Starting script execution...")
 
@@ -11,6 +19,9 @@ output_dir = 'transformed_data/water_utilities_data'
 print(f"Creating directory: {output_dir}")
 os.makedirs(output_dir, exist_ok=True)
 
+# Sequential asset IDs and distinct random serial numbers
+ids = IdFactory(RANDOM_SEED)
+
 def generate_water_utility_assets(num_assets=100):
     print(f"Generating {num_assets} water utilities assets...")
     asset_types = ['Pump', 'Valve', 'Filter', 'Tank', 'Meter', 'Sensor', 'Treatment Plant']
@@ -24,7 +35,7 @@ def generate_water_utility_assets(num_assets=100):
     next_maintenance_dates = [date + timedelta(days=np.random.randint(30, 365)) for date in last_maintenance_dates]
     
     data = {
-        'asset_id': [f'ASSET_{str(uuid.uuid4())[:8]}' for _ in range(num_assets)],
+        'asset_id': ids.sequential('ASSET_', num_assets),
         'asset_name': [f'Asset_{i+1}' for i in range(num_assets)],
         'asset_type': np.random.choice(asset_types, num_assets),
         'location': np.random.choice(locations, num_assets),
@@ -34,7 +45,7 @@ def generate_water_utility_assets(num_assets=100):
         'next_maintenance_date': [date.strftime('%Y-%m-%d') for date in next_maintenance_dates],
         'manufacturer': [f'Manufacturer_{np.random.randint(1, 6)}' for _ in range(num_assets)],
         'model_number': [f'MODEL_{np.random.randint(1000, 9999)}' for _ in range(num_assets)],
-        'serial_number': [f'SERIAL_{str(uuid.uuid4())[:8]}' for _ in range(num_assets)],
+        'serial_number': ids.random('SERIAL_', num_assets),
         'expected_lifetime_hours': np.random.randint(10000, 50000, num_assets),
         'expected_lifetime_years': np.random.randint(5, 30, num_assets),
         'purchase_cost': np.random.randint(1000, 100000, num_assets),
@@ -1,13 +1,24 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import uuid
 import os
+import sys
+from pathlib import Path
+
+# IdFactory lives with the generators in src/python, imported by module name
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / 'src' / 'python'))
+from id_factory import IdFactory
+
+# Seed for the ID factory, so every run issues the same IDs
+RANDOM_SEED = 42
 
 # Create output directory if it doesn't exist
 os.makedirs('transformed_data/industrial_data', exist_ok=True)
 os.makedirs('transformed_data/workforce_data', exist_ok=True)
 
+# Sequential primary keys and distinct random references for every table
+ids = IdFactory(RANDOM_SEED)
+
 # Industrial IoT Data
 def generate_iot_data(num_devices=100):
     device_types = ['Sensor', 'Camera', 'Controller', 'Monitor', 'Actuator']
@@ -15,7 +26,7 @@ def generate_iot_data(num_devices=100):
     statuses = ['Active', 'Inactive', 'Maintenance', 'Error']
     
     data = {
-        'device_id': [f'DEV_{str(uuid.uuid4())[:8]}' for _ in range(num_devices)],
+        'device_id': ids.sequential('DEV_', num_devices),
         'device_name': [f'Device_{i+1}' for i in range(num_devices)],
         'device_type': np.random.choice(device_types, num_devices),
         'location': np.random.choice(locations, num_devices),
@@ -33,13 +44,13 @@ def generate_maintenance_data(device_ids, num_records=200):
     statuses = ['Scheduled', 'In Progress', 'Completed', 'Cancelled']
     
     data = {
-        'maintenance_id': [f'MAINT_{str(uuid.uuid4())[:8]}' for _ in range(num_records)],
+        'maintenance_id': ids.sequential('MAINT_', num_records),
         'device_id': np.random.choice(device_ids, num_records),
         'maintenance_type': np.random.choice(maintenance_types, num_records),
         'scheduled_date': [datetime.now().date() + timedelta(days=np.random.randint(-30, 30)) for _ in range(num_records)],
         'completed_date': [datetime.now().date() + timedelta(days=np.random.randint(-30, 30)) for _ in range(num_records)],
         'status': np.random.choice(statuses, num_records),
-        'technician_id': [f'TECH_{str(uuid.uuid4())[:8]}' for _ in range(num_records)],
+        'technician_id': ids.random('TECH_', num_records),
         'description': [f'Maintenance description {i+1}' for i in range(num_records)],
         'parts_replaced': [f'Parts {i+1}' for i in range(num_records)]
     }
@@ -52,7 +63,7 @@ def generate_performance_data(device_ids, num_records=500):
     statuses = ['Normal', 'Warning', 'Critical']
     
     data = {
-        'performance_id': [f'PERF_{str(uuid.uuid4())[:8]}' for _ in range(num_records)],
+        'performance_id': ids.sequential('PERF_', num_records),
         'device_id': np.random.choice(device_ids, num_records),
         'metric_name': np.random.choice(metric_names, num_records),
         'metric_value': np.random.uniform(0, 100, num_records),
@@ -70,14 +81,14 @@ def generate_safety_data(device_ids, num_records=100):
     statuses = ['Open', 'In Progress', 'Resolved', 'Closed']
     
     data = {
-        'safety_id': [f'SAFE_{str(uuid.uuid4())[:8]}' for _ in range(num_records)],
+        'safety_id': ids.sequential('SAFE_', num_records),
         'device_id': np.random.choice(device_ids, num_records),
         'incident_type': np.random.choice(incident_types, num_records),
         'incident_date': [datetime.now().date() - timedelta(days=np.random.randint(0, 30)) for _ in range(num_records)],
         'severity_level': np.random.choice(severity_levels, num_records),
         'description': [f'Safety incident description {i+1}' for i in range(num_records)],
         'action_taken': [f'Action taken {i+1}' for i in range(num_records)],
-        'reported_by': [f'EMP_{str(uuid.uuid4())[:8]}' for _ in range(num_records)],
+        'reported_by': ids.random('EMP_', num_records),
         'status': np.random.choice(statuses, num_records)
     }
     return pd.DataFrame(data)
@@ -87,8 +98,8 @@ def generate_attendance_data(num_records=1000):
     statuses = ['Present', 'Absent', 'Late', 'Early Departure']
     
     data = {
-        'attendance_id': [f'ATT_{str(uuid.uuid4())[:8]}' for _ in range(num_records)],
-        'employee_id': [f'EMP_{str(uuid.uuid4())[:8]}' for _ in range(num_records)],
+        'attendance_id': ids.sequential('ATT_', num_records),
+        'employee_id': ids.random('EMP_', num_records),
         'attendance_date': [datetime.now().date() - timedelta(days=np.random.randint(0, 30)) for _ in range(num_records)],
         'check_in_time': [datetime.now() - timedelta(hours=np.random.randint(0, 24)) for _ in range(num_records)],
         'check_out_time': [datetime.now() - timedelta(hours=np.random.randint(0, 24)) for _ in range(num_records)],
@@ -102,14 +113,14 @@ def generate_workforce_performance_data(num_records=500):
     review_types = ['Annual', 'Quarterly', 'Monthly', 'Project']
     
     data = {
-        'performance_id': [f'PERF_{str(uuid.uuid4())[:8]}' for _ in range(num_records)],
-        'employee_id': [f'EMP_{str(uuid.uuid4())[:8]}' for _ in range(num_records)],
+        'performance_id': ids.sequential('PERF_', num_records),
+        'employee_id': ids.random('EMP_', num_records),
         'review_date': [datetime.now().date() - timedelta(days=np.random.randint(0, 365)) for _ in range(num_records)],
         'review_type': np.random.choice(review_types, num_records),
         'rating': np.random.uniform(1, 5, num_records),
         'feedback': [f'Performance feedback {i+1}' for i in range(num_records)],
         'goals_set': [f'Goals set {i+1}' for i in range(num_records)],
-        'reviewed_by': [f'MGR_{str(uuid.uuid4())[:8]}' for _ in range(num_records)]
+        'reviewed_by': ids.random('MGR_', num_records)
     }
     return pd.DataFrame(data)
 
@@ -119,13 +130,13 @@ def generate_skills_data(num_records=800):
     proficiency_levels = ['Beginner', 'Intermediate', 'Advanced', 'Expert']
     
     data = {
-        'skill_id': [f'SKILL_{str(uuid.uuid4())[:8]}' for _ in range(num_records)],
-        'employee_id': [f'EMP_{str(uuid.uuid4())[:8]}' for _ in range(num_records)],
+        'skill_id': ids.sequential('SKILL_', num_records),
+        'employee_id': ids.random('EMP_', num_records),
         'skill_name': np.random.choice(skill_names, num_records),
         'proficiency_level': np.random.choice(proficiency_levels, num_records),
         'certification_date': [datetime.now().date() - timedelta(days=np.random.randint(0, 365)) for _ in range(num_records)],
         'expiry_date': [datetime.now().date() + timedelta(days=np.random.randint(0, 365)) for _ in range(num_records)],
-        'certified_by': [f'CERT_{str(uuid.uuid4())[:8]}' for _ in range(num_records)]
+        'certified_by': ids.random('CERT_', num_records)
     }
     return pd.DataFrame(data)
 
@@ -135,15 +146,15 @@ def generate_training_data(num_records=300):
     statuses = ['Scheduled', 'In Progress', 'Completed', 'Cancelled']
     
     data = {
-        'training_id': [f'TRAIN_{str(uuid.uuid4())[:8]}' for _ in range(num_records)],
-        'employee_id': [f'EMP_{str(uuid.uuid4())[:8]}' for _ in range(num_records)],
+        'training_id': ids.sequential('TRAIN_', num_records),
+        'employee_id': ids.random('EMP_', num_records),
         'training_name': [f'Training {i+1}' for i in range(num_records)],
         'training_type': np.random.choice(training_types, num_records),
         'start_date': [datetime.now().date() - timedelta(days=np.random.randint(0, 30)) for _ in range(num_records)],
         'end_date': [datetime.now().date() + timedelta(days=np.random.randint(0, 30)) for _ in range(num_records)],
         'status': np.random.choice(statuses, num_records),
         'completion_date': [datetime.now().date() + timedelta(days=np.random.randint(0, 30)) for _ in range(num_records)],
-        'trainer': [f'TRAINER_{str(uuid.uuid4())[:8]}' for _ in range(num_records)]
+        'trainer': ids.random('TRAINER_', num_records)
     }
     return pd.DataFrame(data)
 
@@ -154,8 +165,8 @@ def generate_scheduling_data(num_records=1000):
     statuses = ['Scheduled', 'In Progress', 'Completed', 'Cancelled']
     
     data = {
-        'schedule_id': [f'SCHED_{str(uuid.uuid4())[:8]}' for _ in range(num_records)],
-        'employee_id': [f'EMP_{str(uuid.uuid4())[:8]}' for _ in range(num_records)],
+        'schedule_id': ids.sequential('SCHED_', num_records),
+        'employee_id': ids.random('EMP_', num_records),
         'shift_date': [datetime.now().date() + timedelta(days=np.random.randint(0, 30)) for _ in range(num_records)],
         'shift_type': np.random.choice(shift_types, num_records),
         'start_time': [datetime.now() + timedelta(hours=np.random.randint(0, 24)) for _ in range(num_records)],
@@ -171,13 +182,13 @@ def generate_leave_data(num_records=400):
     statuses = ['Pending', 'Approved', 'Rejected', 'Cancelled']
     
     data = {
-        'leave_id': [f'LEAVE_{str(uuid.uuid4())[:8]}' for _ in range(num_records)],
-        'employee_id': [f'EMP_{str(uuid.uuid4())[:8]}' for _ in range(num_records)],
+        'leave_id': ids.sequential('LEAVE_', num_records),
+        'employee_id': ids.random('EMP_', num_records),
         'leave_type': np.random.choice(leave_types, num_records),
         'start_date': [datetime.now().date() + timedelta(days=np.random.randint(0, 30)) for _ in range(num_records)],
         'end_date': [datetime.now().date() + timedelta(days=np.random.randint(0, 30)) for _ in range(num_records)],
         'status': np.random.choice(statuses, num_records),
-        'approved_by': [f'MGR_{str(uuid.uuid4())[:8]}' for _ in range(num_records)],
+        'approved_by': ids.random('MGR_', num_records),
         'reason': [f'Leave reason {i+1}' for i in range(num_records)]
     }
     return pd.DataFrame(data)
@@ -0,0 +1,117 @@
+import numpy as np
+import os
+import faker
+from faker import Faker
+from pathlib import Path
+import string
+
+DEFAULT_POOL_SIZE = 20000
+DEFAULT_CACHE_DIR = Path('.fake_pool_cache')
+
+# Faker providers that are pooled; anything else is drawn directly with numpy
+POOLED_KINDS = ('name', 'first_name', 'last_name', 'company', 'email', 'phone_number')
+
+LETTERS = np.array(list(string.ascii_letters))
+DIGITS = np.array(list(string.digits))
+UUID_GROUPS = [(0, 8), (8, 12), (12, 16), (16, 20), (20, 32)]
+
+
+class FakeValuePool:
+    """Seeded pools of Faker values, cached on disk and handed out in vectorized draws"""
+
+    def __init__(self, seed, pool_size=DEFAULT_POOL_SIZE, cache_dir=DEFAULT_CACHE_DIR,
+                 locale='en_US'):
+        self.seed = seed
+        self.pool_size = pool_size
+        self.cache_dir = Path(cache_dir)
+        self.locale = locale
+        self._pools = {}
+
+    def __getstate__(self):
+        # Pools are reloaded from the disk cache instead of being pickled to workers
+        state = self.__dict__.copy()
+        state['_pools'] = {}
+        return state
+
+    def _cache_path(self, kind):
+        return self.cache_dir / (
+            f"{kind}-{self.locale}-{self.seed}-{self.pool_size}-faker{faker.VERSION}.npy"
+        )
+
+    def values(self, kind):
+        """Return the pool for one value type, loading or building it once"""
+        if kind not in POOLED_KINDS:
+            raise ValueError(f"Unsupported pool kind: {kind}")
+        if kind in self._pools:
+            return self._pools[kind]
+
+        path = self._cache_path(kind)
+        if path.exists():
+            pool = np.load(path)
+        else:
+            # Each kind gets its own seed so pools don't depend on build order
+            fake = Faker(self.locale)
+            fake.seed_instance(f"fake_pool-{self.seed}-{kind}")
+            provider = getattr(fake, kind)
+            pool = np.array([provider() for _ in range(self.pool_size)])
+            # Write then rename so concurrent workers never read a partial file
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                np.save(f, pool)
+            os.replace(tmp_path, path)
+
+        self._pools[kind] = pool
+        return pool
+
+    def warm(self, kinds):
+        """Build or load the given pools up front, e.g. before forking workers"""
+        for kind in kinds:
+            self.values(kind)
+
+    def draw(self, kind, size, rng):
+        """Draw ``size`` values of one kind from its pool"""
+        pool = self.values(kind)
+        return pool[rng.integers(0, len(pool), size=size)]
+
+    def bothify(self, pattern, size, rng):
+        """Vectorized Faker.bothify: '?' becomes an ASCII letter and '#' a digit"""
+        result = np.full(size, '', dtype=object)
+        for char in pattern:
+            if char == '?':
+                result = result + LETTERS[rng.integers(0, len(LETTERS), size=size)].astype(object)
+            elif char == '#':
+                result = result + DIGITS[rng.integers(0, len(DIGITS), size=size)].astype(object)
+            else:
+                result = result + char
+        return result
+
+    def uuid4(self, size, rng):
+        """Draw random version 4 UUID strings"""
+        raw = rng.integers(0, 256, size=(size, 16), dtype=np.uint8)
+        raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+        raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+
+        # Hex-encode all rows at once, then splice the dashes in as bytes
+        hex_chars = np.frombuffer(raw.tobytes().hex().encode('ascii'), dtype=np.uint8).reshape(size, 32)
+        chars = np.full((size, 36), ord('-'), dtype=np.uint8)
+        for group, (start, stop) in enumerate(UUID_GROUPS):
+            offset = start + group
+            chars[:, offset:offset + stop - start] = hex_chars[:, start:stop]
+        return chars.view('S36').ravel().astype('U36')
+
+    def dates_between(self, start_date, end_date, size, rng):
+        """Draw dates uniformly between start_date and end_date, both inclusive"""
+        start = np.asarray(start_date, dtype='datetime64[D]')
+        end = np.asarray(end_date, dtype='datetime64[D]')
+        span = (end - start).astype(np.int64)
+        offsets = rng.integers(0, np.maximum(span, 0) + 1, size=size)
+        return start + offsets.astype('timedelta64[D]')
+
+    def datetimes_between(self, start_date, end_date, size, rng):
+        """Draw timestamps uniformly between start_date and end_date"""
+        start = np.asarray(start_date, dtype='datetime64[us]')
+        end = np.asarray(end_date, dtype='datetime64[us]')
+        span = np.maximum((end - start).astype(np.int64), 0)
+        offsets = (rng.random(size=size) * span).astype(np.int64)
+        return start + offsets.astype('timedelta64[us]')
@@ -1,51 +1,118 @@
 import pandas as pd
 import numpy as np
-from faker import Faker
 from datetime import datetime, timedelta
-import random
 from scipy import stats
 import yfinance as yf
 from dateutil.relativedelta import relativedelta
+from pandas.tseries.frequencies import to_offset
 import json
 import os
+import argparse
+from sharding import ShardedGeneratorMixin, derive_seed
+from incremental import Checkpoint, shard_key, write_table
+from schemas import apply_schema, read_table
+from partitioned_writer import DEFAULT_CHUNK_ROWS
 
-# Set random seeds for reproducibility
-np.random.seed(42)
-random.seed(42)
-fake = Faker()
-Faker.seed(42)
+# Master seed for reproducibility; each table shard derives its own seed from it
+RANDOM_SEED = 42
 
-class FinancialDataGenerator:
-    def __init__(self):
+# Starting level of each synthetic index: S&P 500, NASDAQ, Dow Jones, Russell 2000
+MARKET_INDICES = {'^GSPC': 4000, '^IXIC': 15000, '^DJI': 35000, '^RUT': 2000}
+
+# Daily performance trend of each market sector
+SECTOR_TRENDS = {
+    'Technology': 0.0003,
+    'Healthcare': 0.0002,
+    'Financials': 0.0001,
+    'Consumer': 0.00015,
+    'Industrial': 0.0001,
+    'Energy': 0.0002,
+    'Materials': 0.0001,
+    'Utilities': 0.00005,
+    'Real Estate': 0.0001,
+    'Communication': 0.00015
+}
+
+# Indices and sectors move with a common market factor. Each series' loading on it
+# sets its correlations (the product of two loadings); the rest is its own noise,
+# scaled by its daily volatility.
+MARKET_SERIES = list(MARKET_INDICES) + list(SECTOR_TRENDS)
+MARKET_LOADINGS = np.array([0.97, 0.92, 0.93, 0.85,
+                            0.80, 0.60, 0.75, 0.75, 0.75, 0.50, 0.65, 0.40, 0.55, 0.70])
+MARKET_VOLATILITY = np.array([0.01] * len(MARKET_INDICES) + [0.02] * len(SECTOR_TRENDS))
+MARKET_CORRELATION = np.outer(MARKET_LOADINGS, MARKET_LOADINGS)
+np.fill_diagonal(MARKET_CORRELATION, 1.0)
+MARKET_CHOLESKY = np.linalg.cholesky(MARKET_CORRELATION * np.outer(MARKET_VOLATILITY, MARKET_VOLATILITY))
+
+# Client asset allocation ranges by risk band: profiles 1-3, 4-7 and 8-10.
+# Each row is (low, high) for stocks, bonds, cash and alternatives.
+ALLOCATION_ASSETS = ['stocks', 'bonds', 'cash', 'alternatives']
+ALLOCATION_BAND_LIMITS = [3, 7]
+ALLOCATION_RANGES = np.array([
+    [(0.2, 0.4), (0.4, 0.6), (0.1, 0.2), (0.05, 0.15)],
+    [(0.5, 0.7), (0.2, 0.4), (0.05, 0.15), (0.05, 0.15)],
+    [(0.7, 0.9), (0.1, 0.2), (0.02, 0.08), (0.05, 0.15)]
+])
+
+# Trades fall within the weekday session, 9:30 to 16:00
+SESSION_OPEN = np.timedelta64(9 * 60 + 30, 'm')
+SESSION_CLOSE = np.timedelta64(16 * 60, 'm')
+
+class FinancialDataGenerator(ShardedGeneratorMixin):
+    fake_pool_kinds = ('company', 'name')
+
+    def __init__(self, seed=RANDOM_SEED, scale=1.0, num_transactions=None, market_freq='D'):
         self.start_date = datetime(2021, 1, 1)
         self.end_date = datetime.now()
-        self.num_clients = 5000
-        self.num_products = 50
-        self.num_advisors = 100
+        self.scale = scale
+        self.num_clients = self.scaled_count(5000)
+        self.num_products = self.scaled_count(50)
+        self.num_advisors = self.scaled_count(100)
+        # Yearly trade volume; set it directly for volumes beyond the scaled default
+        self.num_transactions = num_transactions or self.scaled_count(10000)
+        # Step of the index and sector series: a fixed frequency such as 'D', 'h' or '1min'
+        self.market_freq = market_freq
+        
+        # Per-instance random sources (self.random, self.rng, self.fake, self.fake_pool)
+        self.init_random_state(seed)
         
         # Create output directory if it doesn't exist
         if not os.path.exists('financial_data'):
             os.makedirs('financial_data')
     
+    def estimate_rows(self):
+        """Expected rows per output table at the current scale, without generating anything"""
+        num_days = len(pd.date_range(start=self.start_date, end=self.end_date, freq='D'))
+        num_steps = len(self._market_timeline())
+        return {
+            'client_portfolios.csv': self.num_clients,
+            'investment_products.csv': self.num_products,
+            'market_indices.csv': num_steps,
+            'sector_performance.csv': num_steps * len(SECTOR_TRENDS),
+            'interest_rates.csv': num_days,
+            'trading_activity.csv': self.num_transactions,
+            'advisor_data.csv': self.num_advisors
+        }
+    
     def generate_client_portfolio_data(self):
         """Generate client portfolio data"""
         client_data = {
-            'client_id': [f'CLT{i:05d}' for i in range(self.num_clients)],
-            'account_type': np.random.choice(
+            'client_id': np.char.add('CLT', np.char.zfill(np.arange(self.num_clients).astype(str), 5)),
+            'account_type': self.rng.choice(
                 ['Individual', 'Joint', 'IRA', '401K', 'Institutional'],
                 size=self.num_clients,
                 p=[0.3, 0.2, 0.2, 0.2, 0.1]
             ),
-            'account_balance': np.random.lognormal(
+            'account_balance': self.rng.lognormal(
                 mean=12,  # Log-normal distribution for realistic balance distribution
                 sigma=1.5,
                 size=self.num_clients
             ),
-            'risk_profile': np.random.randint(1, 11, size=self.num_clients),
-            'account_open_date': [
-                fake.date_between(start_date='-10y', end_date='today')
-                for _ in range(self.num_clients)
-            ]
+            'risk_profile': self.rng.integers(1, 11, size=self.num_clients),
+            'account_open_date': self.fake_pool.dates_between(
+                self.end_date - timedelta(days=365 * 10), self.end_date,
+                self.num_clients, self.rng
+            )
         }
         
         # Adjust account balances to realistic ranges
@@ -55,66 +122,40 @@ class FinancialDataGenerator:
             50000000  # Maximum $50,000,000
         )
         
-        # Generate asset allocation based on risk profile
-        def generate_asset_allocation(risk_profile):
-            if risk_profile <= 3:
-                return {
-                    'stocks': random.uniform(0.2, 0.4),
-                    'bonds': random.uniform(0.4, 0.6),
-                    'cash': random.uniform(0.1, 0.2),
-                    'alternatives': random.uniform(0.05, 0.15)
-                }
-            elif risk_profile <= 7:
-                return {
-                    'stocks': random.uniform(0.5, 0.7),
-                    'bonds': random.uniform(0.2, 0.4),
-                    'cash': random.uniform(0.05, 0.15),
-                    'alternatives': random.uniform(0.05, 0.15)
-                }
-            else:
-                return {
-                    'stocks': random.uniform(0.7, 0.9),
-                    'bonds': random.uniform(0.1, 0.2),
-                    'cash': random.uniform(0.02, 0.08),
-                    'alternatives': random.uniform(0.05, 0.15)
-                }
-        
-        # Generate returns based on risk profile and market conditions
-        def generate_returns(risk_profile):
-            base_return = np.random.normal(0.08, 0.02)  # Base market return
-            risk_adjustment = (risk_profile - 5) * 0.01  # Higher risk = higher potential return
-            noise = np.random.normal(0, 0.02)  # Random noise
-            
-            ytd_return = base_return + risk_adjustment + noise
-            one_year = ytd_return * 1.1
-            three_year = one_year * 1.15
-            five_year = three_year * 1.2
-            ten_year = five_year * 1.25
-            
-            return {
-                'ytd_return': ytd_return,
-                'one_year_return': one_year,
-                'three_year_return': three_year,
-                'five_year_return': five_year,
-                'ten_year_return': ten_year
-            }
-        
-        # Add asset allocation and returns
-        client_data['asset_allocation'] = [
-            generate_asset_allocation(risk)
-            for risk in client_data['risk_profile']
-        ]
-        
-        returns_data = [
-            generate_returns(risk)
-            for risk in client_data['risk_profile']
-        ]
-        
-        for key in returns_data[0].keys():
-            client_data[key] = [r[key] for r in returns_data]
-        
-        df = pd.DataFrame(client_data)
-        df.to_csv('financial_data/client_portfolios.csv', index=False)
+        # Asset allocation by risk band, drawn for all clients at once and normalized to sum to 1
+        risk_profile = client_data['risk_profile']
+        band = np.searchsorted(ALLOCATION_BAND_LIMITS, risk_profile)
+        low, high = ALLOCATION_RANGES[band, :, 0], ALLOCATION_RANGES[band, :, 1]
+        allocation = self.rng.uniform(low, high)
+        allocation /= allocation.sum(axis=1, keepdims=True)
+        
+        # Round to basis points; the largest holding absorbs the rounding so each row still sums to 1
+        basis_points = np.rint(allocation * 10000).astype(np.int64)
+        rows = np.arange(self.num_clients)
+        largest = allocation.argmax(axis=1)
+        basis_points[rows, largest] += 10000 - basis_points.sum(axis=1)
+        
+        # Written as one dict per client, e.g. {'stocks': 0.5213, 'bonds': 0.3102, ...}
+        allocation_text = np.full(self.num_clients, '{')
+        for position, asset in enumerate(ALLOCATION_ASSETS):
+            separator = '' if position == 0 else ', '
+            digits = np.char.zfill(basis_points[:, position].astype(str), 4)
+            allocation_text = np.char.add(allocation_text, f"{separator}'{asset}': 0.")
+            allocation_text = np.char.add(allocation_text, digits)
+        client_data['asset_allocation'] = np.char.add(allocation_text, '}')
+        
+        # Returns based on risk profile and market conditions; higher risk, higher potential return
+        base_return = self.rng.normal(0.08, 0.02, size=self.num_clients)
+        noise = self.rng.normal(0, 0.02, size=self.num_clients)
+        ytd_return = base_return + (risk_profile - 5) * 0.01 + noise
+        client_data['ytd_return'] = ytd_return
+        client_data['one_year_return'] = ytd_return * 1.1
+        client_data['three_year_return'] = client_data['one_year_return'] * 1.15
+        client_data['five_year_return'] = client_data['three_year_return'] * 1.2
+        client_data['ten_year_return'] = client_data['five_year_return'] * 1.25
+        
+        df = apply_schema(pd.DataFrame(client_data), 'client_portfolios')
+        write_table(df, 'financial_data/client_portfolios.csv', engine='pyarrow')
         return df
     
     def generate_investment_products(self):
@@ -124,36 +165,36 @@ class FinancialDataGenerator:
         
         product_data = {
             'fund_id': [f'FND{i:03d}' for i in range(self.num_products)],
-            'fund_name': [f"{fake.company()} {random.choice(strategies)} {random.choice(asset_classes)} Fund" 
-                         for _ in range(self.num_products)],
-            'asset_class': np.random.choice(asset_classes, size=self.num_products),
-            'strategy': np.random.choice(strategies, size=self.num_products),
-            'expense_ratio': np.random.uniform(0.0005, 0.025, size=self.num_products),
-            'aum': np.random.lognormal(mean=15, sigma=1, size=self.num_products)
+            'fund_name': [f"{company} {self.random.choice(strategies)} {self.random.choice(asset_classes)} Fund" 
+                         for company in self.fake_pool.draw('company', self.num_products, self.rng)],
+            'asset_class': self.rng.choice(asset_classes, size=self.num_products),
+            'strategy': self.rng.choice(strategies, size=self.num_products),
+            'expense_ratio': self.rng.uniform(0.0005, 0.025, size=self.num_products),
+            'aum': self.rng.lognormal(mean=15, sigma=1, size=self.num_products)
         }
         
         # Generate risk metrics
         def generate_risk_metrics(asset_class):
             if asset_class == 'Equity':
                 return {
-                    'sharpe_ratio': np.random.normal(1.2, 0.3),
-                    'volatility': np.random.normal(0.15, 0.02),
-                    'beta': np.random.normal(1.1, 0.1),
-                    'alpha': np.random.normal(0.02, 0.01)
+                    'sharpe_ratio': self.rng.normal(1.2, 0.3),
+                    'volatility': self.rng.normal(0.15, 0.02),
+                    'beta': self.rng.normal(1.1, 0.1),
+                    'alpha': self.rng.normal(0.02, 0.01)
                 }
             elif asset_class == 'Fixed Income':
                 return {
-                    'sharpe_ratio': np.random.normal(0.8, 0.2),
-                    'volatility': np.random.normal(0.06, 0.01),
-                    'beta': np.random.normal(0.4, 0.1),
-                    'alpha': np.random.normal(0.01, 0.005)
+                    'sharpe_ratio': self.rng.normal(0.8, 0.2),
+                    'volatility': self.rng.normal(0.06, 0.01),
+                    'beta': self.rng.normal(0.4, 0.1),
+                    'alpha': self.rng.normal(0.01, 0.005)
                 }
             else:
                 return {
-                    'sharpe_ratio': np.random.normal(1.0, 0.25),
-                    'volatility': np.random.normal(0.10, 0.015),
-                    'beta': np.random.normal(0.8, 0.1),
-                    'alpha': np.random.normal(0.015, 0.008)
+                    'sharpe_ratio': self.rng.normal(1.0, 0.25),
+                    'volatility': self.rng.normal(0.10, 0.015),
+                    'beta': self.rng.normal(0.8, 0.1),
+                    'alpha': self.rng.normal(0.015, 0.008)
                 }
         
         # Add risk metrics
@@ -168,13 +209,13 @@ class FinancialDataGenerator:
         # Generate historical returns
         def generate_historical_returns(asset_class):
             base_returns = {
-                'one_month': np.random.normal(0.01, 0.02),
-                'three_month': np.random.normal(0.03, 0.03),
-                'six_month': np.random.normal(0.06, 0.04),
-                'one_year': np.random.normal(0.12, 0.05),
-                'three_year': np.random.normal(0.36, 0.08),
-                'five_year': np.random.normal(0.60, 0.10),
-                'ten_year': np.random.normal(1.20, 0.15)
+                'one_month': self.rng.normal(0.01, 0.02),
+                'three_month': self.rng.normal(0.03, 0.03),
+                'six_month': self.rng.normal(0.06, 0.04),
+                'one_year': self.rng.normal(0.12, 0.05),
+                'three_year': self.rng.normal(0.36, 0.08),
+                'five_year': self.rng.normal(0.60, 0.10),
+                'ten_year': self.rng.normal(1.20, 0.15)
             }
             
             # Adjust returns based on asset class
@@ -193,157 +234,293 @@ class FinancialDataGenerator:
         for key in historical_returns[0].keys():
             product_data[key] = [r[key] for r in historical_returns]
         
-        df = pd.DataFrame(product_data)
+        df = apply_schema(pd.DataFrame(product_data), 'investment_products')
         df.to_csv('financial_data/investment_products.csv', index=False)
         return df
     
-    def generate_market_data(self):
-        """Generate market data using yfinance"""
-        indices = ['^GSPC', '^IXIC', '^DJI', '^RUT']  # S&P 500, NASDAQ, Dow Jones, Russell 2000
-        
-        # Generate synthetic market data
-        dates = pd.date_range(start=self.start_date, end=self.end_date, freq='D')
-        market_data = pd.DataFrame(index=dates)
-        
-        # Generate synthetic index values with realistic correlations
-        base_values = {
-            '^GSPC': 4000,  # S&P 500
-            '^IXIC': 15000,  # NASDAQ
-            '^DJI': 35000,  # Dow Jones
-            '^RUT': 2000   # Russell 2000
-        }
-        
-        for index in indices:
-            # Generate daily returns with realistic volatility
-            daily_returns = np.random.normal(0.0002, 0.01, size=len(dates))
-            
-            # Add some market trends
-            trend = np.linspace(0, 0.5, len(dates))  # Overall upward trend
-            correction = np.where(
-                (dates >= '2023-08-01') & (dates <= '2023-10-31'),
-                -0.1,  # Market correction
-                0
-            )
-            
-            # Combine returns with trend and correction
-            cumulative_returns = np.cumsum(daily_returns + trend + correction)
-            
-            # Calculate index values
-            market_data[index] = base_values[index] * (1 + cumulative_returns)
-        
-        # Create sector performance data
-        sectors = ['Technology', 'Healthcare', 'Financials', 'Consumer', 'Industrial', 
-                  'Energy', 'Materials', 'Utilities', 'Real Estate', 'Communication']
+    def _market_timeline(self):
+        """Timestamps of the market series, every market_freq from start_date to end_date"""
+        return pd.date_range(start=self.start_date, end=self.end_date, freq=self.market_freq)
+    
+    def generate_market_data(self, since=None, trend_days=None):
+        """Generate correlated index and sector series at market_freq, plus daily interest rates
+
+        Index returns and sector performance are drawn together from one covariance
+        matrix, so indices move with each other and with the sectors. Drift, trends
+        and volatility are per day and scaled to the step length, so intraday series
+        cover the same ground as daily ones.
+
+        With ``since``, the series continue from the last saved step and only later
+        steps are appended; ``trend_days`` is the length in days of the first run,
+        which sets the slope of the long-term trends.
+        """
+        all_steps = self._market_timeline()
+        first_step = 0 if since is None else int(all_steps.searchsorted(pd.Timestamp(since), side='right'))
+        # Whole-second timestamps, so the CSV holds no fractional seconds
+        timeline = all_steps[first_step:].as_unit('s')
+        epoch = pd.Timestamp(self.start_date)
+        step_days = (epoch + to_offset(self.market_freq) - epoch) / pd.Timedelta(days=1)
+        elapsed_days = ((timeline - epoch) / pd.Timedelta(days=1)).to_numpy()
+        
+        # Trends rise linearly with time, at the slope set by the first run's length
+        all_dates = pd.date_range(start=self.start_date, end=self.end_date, freq='D')
+        if trend_days is None:
+            trend_days = len(all_dates)
+        trend_span = max(trend_days - 1, 1)
+        
+        # One draw per step for every index and sector, correlated through the covariance
+        noise = self.rng.standard_normal((len(timeline), len(MARKET_SERIES)), dtype=np.float32)
+        noise = noise @ MARKET_CHOLESKY.T.astype(np.float32)
+        noise *= np.float32(np.sqrt(step_days))
+        
+        # Index returns: drift, an overall upward trend and the autumn 2023 correction
+        correction = np.where(
+            (timeline >= '2023-08-01') & (timeline < '2023-11-01'),
+            -0.1,
+            0
+        )
+        drift = (0.0002 + elapsed_days * (0.5 / trend_span) + correction) * step_days
+        index_returns = noise[:, :len(MARKET_INDICES)] + drift[:, None]
+        
+        # Cumulative returns continue from the last saved values
+        base_values = np.array(list(MARKET_INDICES.values()))
+        start_returns = np.zeros(len(MARKET_INDICES))
+        if since is not None:
+            last_values = pd.read_csv('financial_data/market_indices.csv', index_col=0).iloc[-1]
+            start_returns = last_values[list(MARKET_INDICES)].to_numpy() / base_values - 1
+        cumulative_returns = start_returns + np.cumsum(index_returns, axis=0, dtype=np.float64)
+        market_data = pd.DataFrame(
+            base_values * (1 + cumulative_returns), index=timeline, columns=list(MARKET_INDICES)
+        )
         
-        # Create a DataFrame with all combinations of dates and sectors
+        # Sector performance: the full step x sector panel in one broadcast, with per-sector trends
+        sectors = list(SECTOR_TRENDS)
+        trend_rates = np.array(list(SECTOR_TRENDS.values()), dtype=np.float32)
+        trend = (elapsed_days * (trend_days / trend_span * step_days)).astype(np.float32)
+        performance = noise[:, len(MARKET_INDICES):] + trend[:, None] * trend_rates
         sector_data = pd.DataFrame({
-            'date': np.repeat(dates, len(sectors)),
-            'sector': np.tile(sectors, len(dates)),
-            'performance': np.random.normal(0, 0.02, size=len(dates) * len(sectors))
-        })
-        
-        # Add sector-specific trends
-        sector_trends = {
-            'Technology': 0.0003,
-            'Healthcare': 0.0002,
-            'Financials': 0.0001,
-            'Consumer': 0.00015,
-            'Industrial': 0.0001,
-            'Energy': 0.0002,
-            'Materials': 0.0001,
-            'Utilities': 0.00005,
-            'Real Estate': 0.0001,
-            'Communication': 0.00015
-        }
-        
-        for sector in sectors:
-            mask = sector_data['sector'] == sector
-            sector_data.loc[mask, 'performance'] += np.linspace(0, sector_trends[sector] * len(dates), len(dates))
-        
-        # Create interest rates data
+            'date': np.repeat(timeline, len(sectors)),
+            'sector': pd.Categorical.from_codes(np.tile(np.arange(len(sectors)), len(timeline)), sectors),
+            'performance': performance.ravel()
+        }, index=np.arange(first_step * len(sectors), len(all_steps) * len(sectors)))
+        del noise, performance
+        
+        # Create daily interest rates data
+        first_position = 0 if since is None else int(all_dates.searchsorted(pd.Timestamp(since), side='right'))
+        dates = all_dates[first_position:]
+        positions = np.arange(first_position, len(all_dates))
         interest_rates = pd.DataFrame({
             'date': dates,
-            'fed_funds_rate': np.random.normal(4.5, 0.5, size=len(dates)),
-            'treasury_10y': np.random.normal(3.8, 0.4, size=len(dates))
-        })
+            'fed_funds_rate': self.rng.normal(4.5, 0.5, size=len(dates)),
+            'treasury_10y': self.rng.normal(3.8, 0.4, size=len(dates))
+        }, index=positions)
         
         # Add rising interest rate trend
-        interest_rates['fed_funds_rate'] += np.linspace(0, 2, len(dates))
-        interest_rates['treasury_10y'] += np.linspace(0, 1.5, len(dates))
+        interest_rates['fed_funds_rate'] += positions * (2 / trend_span)
+        interest_rates['treasury_10y'] += positions * (1.5 / trend_span)
+        
+        apply_schema(sector_data, 'sector_performance')
+        apply_schema(interest_rates, 'interest_rates')
         
         # Save market data
-        market_data.to_csv('financial_data/market_indices.csv')
-        sector_data.to_csv('financial_data/sector_performance.csv')
-        interest_rates.to_csv('financial_data/interest_rates.csv')
+        append = since is not None
+        write_table(market_data, 'financial_data/market_indices.csv', append=append, index=True, engine='pyarrow')
+        write_table(sector_data, 'financial_data/sector_performance.csv', append=append, index=True, engine='pyarrow')
+        write_table(interest_rates, 'financial_data/interest_rates.csv', append=append, index=True)
         
         return market_data, sector_data, interest_rates
     
-    def generate_trading_activity(self, client_portfolios, investment_products):
-        """Generate trading activity data"""
-        num_transactions = 10000
-        
-        trading_data = {
-            'transaction_id': [f'TXN{i:06d}' for i in range(num_transactions)],
-            'date': [fake.date_time_between(start_date='-1y', end_date='now') 
-                    for _ in range(num_transactions)],
-            'client_id': np.random.choice(client_portfolios['client_id'], size=num_transactions),
-            'product_id': np.random.choice(investment_products['fund_id'], size=num_transactions),
-            'transaction_type': np.random.choice(['buy', 'sell'], size=num_transactions),
-            'share_quantity': np.random.lognormal(mean=3, sigma=1, size=num_transactions),
-            'price_per_share': np.random.lognormal(mean=2, sigma=0.5, size=num_transactions),
-        }
-        
-        # Calculate total value and fees
-        trading_data['total_value'] = [
-            qty * price
-            for qty, price in zip(trading_data['share_quantity'], trading_data['price_per_share'])
-        ]
-        
-        trading_data['fee_amount'] = [
-            value * np.random.uniform(0.0001, 0.01)  # 0.01% to 1% fee
-            for value in trading_data['total_value']
-        ]
-        
-        df = pd.DataFrame(trading_data)
-        df.to_csv('financial_data/trading_activity.csv', index=False)
-        return df
+    def _entity_rng(self, *key):
+        """Random source for fixed per-entity traits, the same in every run for a given seed"""
+        return np.random.default_rng(derive_seed(self.seed, 'entity', *key))
+    
+    def _trading_days(self, window_start):
+        """Weekdays whose trading session closes after window_start and by end_date"""
+        days = pd.bdate_range(
+            pd.Timestamp(window_start).normalize(), pd.Timestamp(self.end_date).normalize()
+        ).to_numpy().astype('datetime64[D]')
+        closes = days + SESSION_CLOSE
+        return days[(closes > np.datetime64(window_start)) & (closes <= np.datetime64(self.end_date))]
+    
+    def _day_chunks(self, day_counts, chunk_rows):
+        """Split days into runs of whole days holding at most chunk_rows trades each
+
+        A single day busier than chunk_rows becomes a chunk of its own.
+        """
+        if len(day_counts) == 0:
+            return [(0, 0)]
+        cumulative = np.cumsum(day_counts)
+        chunks = []
+        start = 0
+        while start < len(day_counts):
+            before = cumulative[start - 1] if start else 0
+            end = max(start + 1, int(np.searchsorted(cumulative, before + chunk_rows, side='right')))
+            chunks.append((start, end))
+            start = end
+        return chunks
+    
+    def _trading_chunk(self, days, day_counts, buy_probability, client_ids, client_weights,
+                       product_ids, product_weights, base_prices, first_transaction):
+        """Generate the trades for a run of whole days as arrays, in time order"""
+        rng = self.rng
+        n = int(day_counts.sum())
+        day_index = np.repeat(np.arange(len(days)), day_counts)
+        
+        # U-shaped intraday profile: trading clusters around the open and the close.
+        # Sessions don't overlap, so sorting keeps every trade on its own day
+        session_us = (SESSION_CLOSE - SESSION_OPEN) // np.timedelta64(1, 'us')
+        offsets = (rng.beta(0.7, 0.7, n) * session_us).astype(np.int64).astype('timedelta64[us]')
+        timestamps = np.sort(days[day_index] + SESSION_OPEN + offsets)
+        
+        is_sell = rng.random(n) >= buy_probability[day_index]
+        client_codes = rng.choice(len(client_ids), size=n, p=client_weights)
+        product_codes = rng.choice(len(product_ids), size=n, p=product_weights)
+        
+        # Each product trades close to its own price level
+        share_quantity = rng.lognormal(mean=3, sigma=1, size=n).astype(np.float32)
+        price_per_share = (base_prices[product_codes] * np.exp(rng.normal(0, 0.02, size=n))).astype(np.float32)
+        total_value = share_quantity.astype(np.float64) * price_per_share
+        fee_amount = total_value * rng.uniform(0.0001, 0.01, size=n)  # 0.01% to 1% fee
+        
+        transaction_ids = np.array([], dtype=str)
+        if n:
+            transaction_numbers = np.arange(first_transaction, first_transaction + n).astype(str)
+            transaction_ids = np.char.add('TXN', np.char.zfill(transaction_numbers, 6))
+        df = pd.DataFrame({
+            'transaction_id': transaction_ids,
+            'date': timestamps,
+            'client_id': pd.Categorical.from_codes(client_codes, categories=client_ids),
+            'product_id': pd.Categorical.from_codes(product_codes, categories=product_ids),
+            'transaction_type': pd.Categorical.from_codes(is_sell.astype(np.int8), categories=['buy', 'sell']),
+            'share_quantity': share_quantity,
+            'price_per_share': price_per_share,
+            'total_value': total_value,
+            'fee_amount': fee_amount
+        })
+        return apply_schema(df, 'trading_activity')
+    
+    def generate_trading_activity(self, client_portfolios, investment_products, since=None,
+                                  first_transaction=0, chunk_rows=DEFAULT_CHUNK_ROWS):
+        """Stream trading activity to CSV in chunks of whole trading days
+
+        A year holds num_transactions trades. Trades fall in weekday sessions with
+        a U-shaped intraday profile, some clients and products are far more active
+        than others, and each day has its own buy/sell balance. With ``since``,
+        trades after it are generated at the same yearly rate and appended,
+        numbered on from ``first_transaction``. Returns the number of trades written.
+        """
+        if since is None:
+            num_transactions = self.num_transactions
+            window_start = self.end_date - timedelta(days=365)
+        else:
+            window_days = max((self.end_date - since).total_seconds() / 86400, 0)
+            num_transactions = int(self.rng.poisson(self.num_transactions * window_days / 365))
+            window_start = since
+        
+        # Spread the trades over the trading days, with busier and quieter days
+        days = self._trading_days(window_start)
+        day_counts = np.zeros(len(days), dtype=np.int64)
+        if len(days):
+            daily_volume = self.rng.lognormal(0, 0.3, size=len(days))
+            day_counts = self.rng.multinomial(num_transactions, daily_volume / daily_volume.sum())
+        buy_probability = np.clip(self.rng.normal(0.52, 0.05, size=len(days)), 0.3, 0.7)
+        
+        # Activity skew and price levels are fixed per client and product across runs
+        client_ids = client_portfolios['client_id'].to_numpy()
+        product_ids = investment_products['fund_id'].to_numpy()
+        client_weights = self._entity_rng('client_activity').lognormal(0, 1.5, size=len(client_ids))
+        product_weights = self._entity_rng('product_activity').lognormal(0, 1.0, size=len(product_ids))
+        base_prices = self._entity_rng('product_prices').lognormal(mean=2, sigma=0.5, size=len(product_ids))
+        
+        path = 'financial_data/trading_activity.csv'
+        append = since is not None
+        written = 0
+        for start, end in self._day_chunks(day_counts, chunk_rows):
+            chunk = self._trading_chunk(
+                days[start:end], day_counts[start:end], buy_probability[start:end],
+                client_ids, client_weights / client_weights.sum(),
+                product_ids, product_weights / product_weights.sum(),
+                base_prices, first_transaction + written
+            )
+            write_table(chunk, path, append=append, engine='pyarrow')
+            append = True
+            written += len(chunk)
+        return written
     
     def generate_advisor_data(self, client_portfolios):
         """Generate financial advisor data"""
         advisor_data = {
             'advisor_id': [f'ADV{i:03d}' for i in range(self.num_advisors)],
-            'name': [fake.name() for _ in range(self.num_advisors)],
-            'client_count': np.random.randint(10, 100, size=self.num_advisors),
-            'total_aum': np.random.lognormal(mean=14, sigma=1, size=self.num_advisors),
-            'start_date': [fake.date_between(start_date='-15y', end_date='-1y') 
-                          for _ in range(self.num_advisors)]
+            'name': self.fake_pool.draw('name', self.num_advisors, self.rng),
+            'client_count': self.rng.integers(10, 100, size=self.num_advisors),
+            'total_aum': self.rng.lognormal(mean=14, sigma=1, size=self.num_advisors),
+            'start_date': self.fake_pool.dates_between(
+                self.end_date - timedelta(days=365 * 15), self.end_date - timedelta(days=365),
+                self.num_advisors, self.rng
+            ).tolist()
         }
         
         # Calculate performance metrics
-        advisor_data['client_retention_rate'] = np.random.uniform(0.85, 0.98, size=self.num_advisors)
-        advisor_data['client_satisfaction_score'] = np.random.uniform(4.0, 5.0, size=self.num_advisors)
-        advisor_data['new_client_acquisition'] = np.random.randint(5, 30, size=self.num_advisors)
+        advisor_data['client_retention_rate'] = self.rng.uniform(0.85, 0.98, size=self.num_advisors)
+        advisor_data['client_satisfaction_score'] = self.rng.uniform(4.0, 5.0, size=self.num_advisors)
+        advisor_data['new_client_acquisition'] = self.rng.integers(5, 30, size=self.num_advisors)
         
-        df = pd.DataFrame(advisor_data)
+        df = apply_schema(pd.DataFrame(advisor_data), 'advisor_data')
         df.to_csv('financial_data/advisor_data.csv', index=False)
         return df
     
-    def generate_all_data(self):
-        """Generate all financial data"""
-        print("Generating client portfolio data...")
-        client_portfolios = self.generate_client_portfolio_data()
-        
-        print("Generating investment products...")
-        investment_products = self.generate_investment_products()
-        
-        print("Generating market data...")
-        market_data, sector_data, interest_rates = self.generate_market_data()
-        
-        print("Generating trading activity...")
-        trading_activity = self.generate_trading_activity(client_portfolios, investment_products)
+    def generate_all_data(self, workers=1, incremental=False):
+        """Generate all financial data, one shard per table
+
+        With ``incremental`` and a checkpoint from an earlier run, clients, products
+        and advisors are kept, and only market days and trades after the last run
+        are appended.
+        """
+        checkpoint = Checkpoint('financial_data')
+        incremental = incremental and checkpoint.exists
+        
+        if incremental:
+            market_since = checkpoint.watermark('market_indices')
+            trading_since = checkpoint.watermark('trading_activity')
+            print(f"Incremental: reusing clients, products and advisors, appending rows after {market_since}")
+            client_portfolios = read_table('financial_data/client_portfolios.csv', 'client_portfolios')
+            investment_products = read_table('financial_data/investment_products.csv', 'investment_products')
+            advisor_data = read_table('financial_data/advisor_data.csv', 'advisor_data')
+            (market_data, sector_data, interest_rates), trading_rows = self.run_shards(
+                [
+                    (shard_key('market_data', since=market_since), 'generate_market_data',
+                     (market_since, checkpoint.counter('market_trend_days'))),
+                    (shard_key('trading_activity', since=trading_since), 'generate_trading_activity',
+                     (client_portfolios, investment_products, trading_since, checkpoint.counter('trading_activity')))
+                ],
+                workers=workers
+            )
+        else:
+            print(f"Generating client portfolios, investment products and market data with {workers} worker(s)...")
+            client_portfolios, investment_products, (market_data, sector_data, interest_rates) = self.run_shards(
+                [
+                    (('client_portfolios',), 'generate_client_portfolio_data', ()),
+                    (('investment_products',), 'generate_investment_products', ()),
+                    (('market_data',), 'generate_market_data', ())
+                ],
+                workers=workers
+            )
+            
+            print("Generating trading activity and advisor data...")
+            trading_rows, advisor_data = self.run_shards(
+                [
+                    (('trading_activity',), 'generate_trading_activity', (client_portfolios, investment_products)),
+                    (('advisor_data',), 'generate_advisor_data', (client_portfolios,))
+                ],
+                workers=workers
+            )
+            checkpoint.set_counter('market_trend_days', len(interest_rates))
         
-        print("Generating advisor data...")
-        advisor_data = self.generate_advisor_data(client_portfolios)
+        for table in ['market_indices', 'sector_performance', 'interest_rates', 'trading_activity']:
+            checkpoint.set_watermark(table, self.end_date)
+        num_transactions = checkpoint.counter('trading_activity') if incremental else 0
+        checkpoint.set_counter('trading_activity', num_transactions + trading_rows)
+        checkpoint.save()
         
         print("Data generation complete! Files saved in 'financial_data' directory.")
         return {
@@ -352,10 +529,20 @@ class FinancialDataGenerator:
             'market_data': market_data,
             'sector_data': sector_data,
             'interest_rates': interest_rates,
-            'trading_activity': trading_activity,
+            'trading_rows': trading_rows,
             'advisor_data': advisor_data
         }
 
 if __name__ == "__main__":
-    generator = FinancialDataGenerator()
-    data = generator.generate_all_data() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Generate financial data")
+    parser.add_argument('--seed', type=int, default=RANDOM_SEED, help="Master random seed")
+    parser.add_argument('--workers', type=int, default=1, help="Worker processes, one table per shard")
+    parser.add_argument('--scale', type=float, default=1.0, help="Multiplier for clients, products, advisors and transactions")
+    parser.add_argument('--transactions', type=int, help="Trades per year, overriding the scaled default")
+    parser.add_argument('--market-freq', default='D', help="Step of the index and sector series, e.g. D, h or 1min")
+    parser.add_argument('--incremental', action='store_true', help="Append only market days and trades after the last run")
+    args = parser.parse_args()
+    
+    generator = FinancialDataGenerator(seed=args.seed, scale=args.scale, num_transactions=args.transactions,
+                                       market_freq=args.market_freq)
+    data = generator.generate_all_data(workers=args.workers, incremental=args.incremental)
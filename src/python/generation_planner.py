@@ -0,0 +1,253 @@
+import pandas as pd
+import numpy as np
+from pathlib import Path
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import time
+from industrial_iot_generator import IndustrialIoTGenerator
+from workforce_data_generator import WorkforceDataGenerator
+from financial_data_generator import FinancialDataGenerator
+from water_utilities_finance_generator import WaterUtilitiesFinanceGenerator
+from water_utilities_metrics_generator import WaterUtilitiesMetricsGenerator
+from partitioned_writer import PARQUET_AVAILABLE, DEFAULT_CHUNK_ROWS
+from fake_pool import DEFAULT_CACHE_DIR
+from schemas import SCHEMAS, apply_schema
+
+if PARQUET_AVAILABLE:
+    import pyarrow.parquet as pq
+
+# Generator class and output directory for each planned generator
+GENERATORS = {
+    'industrial': (IndustrialIoTGenerator, 'industrial_data'),
+    'workforce': (WorkforceDataGenerator, 'workforce_data'),
+    'financial': (FinancialDataGenerator, 'financial_data'),
+    'water_finance': (WaterUtilitiesFinanceGenerator, 'water_utilities_finance'),
+    'water_metrics': (WaterUtilitiesMetricsGenerator, 'water_utilities_metrics')
+}
+
+# Scale of the calibration run; small enough to finish in seconds
+CALIBRATION_SCALE = 0.01
+
+# Streamed tables hold one chunk at a time, plus a copy while it is converted and written
+STREAM_BUFFER_COPIES = 2
+
+SIZE_UNITS = {'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3, 'TB': 1024 ** 4}
+
+
+def parse_size(text):
+    """Parse a size such as '500MB' or '2.5 GB' into bytes"""
+    text = text.strip().upper()
+    for unit in sorted(SIZE_UNITS, key=len, reverse=True):
+        if text.endswith(unit):
+            return int(float(text[:-len(unit)]) * SIZE_UNITS[unit])
+    return int(float(text))
+
+
+def format_size(num_bytes):
+    """Format a byte count with a binary unit"""
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if abs(num_bytes) < 1024:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} TB"
+
+
+@contextlib.contextmanager
+def _working_dir(config_dir):
+    """Run generators in a scratch directory holding copies of the YAML configs"""
+    cwd = os.getcwd()
+    scratch = tempfile.mkdtemp(prefix='generation_plan_')
+    try:
+        for config in Path(config_dir).glob('*.yaml'):
+            shutil.copy(config, scratch)
+        os.chdir(scratch)
+        yield Path(scratch)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def _schema_name(table):
+    """Schema of an output table such as 'oil_and_gas_assets.csv' or 'operational_data/sector=x'"""
+    stem = table.split('/')[0].removesuffix('.csv')
+    return next((name for name in SCHEMAS if stem.endswith(name)), None)
+
+
+def _measure_table(path, schema=None):
+    """Return (rows, bytes on disk, in-memory bytes per row) for a CSV file or partitioned dataset
+
+    In-memory size is measured with the table's compact dtypes, as the generators hold it.
+    """
+    if path.is_dir():
+        files = sorted(path.rglob('*.parquet')) + sorted(path.rglob('*.csv'))
+        if not files:
+            return 0, 0, 0.0
+        disk_bytes = sum(f.stat().st_size for f in files)
+        if files[0].suffix == '.parquet':
+            rows = sum(pq.read_metadata(f).num_rows for f in files)
+            sample = pd.read_parquet(files[0])
+        else:
+            rows = sum(len(pd.read_csv(f)) for f in files)
+            sample = pd.read_csv(files[0])
+    else:
+        if not path.exists():
+            return 0, 0, 0.0
+        disk_bytes = path.stat().st_size
+        sample = pd.read_csv(path)
+        rows = len(sample)
+    if schema is not None:
+        sample = apply_schema(sample, schema)
+    memory_per_row = sample.memory_usage(deep=True).sum() / len(sample) if len(sample) else 0.0
+    return rows, disk_bytes, memory_per_row
+
+
+class GenerationPlanner:
+    def __init__(self, config_dir='.', generators=None, end_date=None):
+        self.config_dir = Path(config_dir).resolve()
+        # Share the caller's fake value pool cache so calibration doesn't rebuild it
+        self.pool_cache_dir = Path(DEFAULT_CACHE_DIR).resolve()
+        self.generators = list(generators or GENERATORS)
+        self.end_date = end_date
+        self.calibration = None
+
+    def _make_generator(self, name, scale):
+        """Instantiate a generator at the given scale, with quiet construction"""
+        generator_class, _ = GENERATORS[name]
+        with contextlib.redirect_stdout(io.StringIO()):
+            generator = generator_class(scale=scale)
+        if self.end_date is not None:
+            generator.end_date = self.end_date
+        generator.fake_pool.cache_dir = self.pool_cache_dir
+        return generator
+
+    def estimate_rows(self, scale=1.0):
+        """Expected rows per (generator, table) at the given scale"""
+        rows = {}
+        with _working_dir(self.config_dir):
+            for name in self.generators:
+                for table, count in self._make_generator(name, scale).estimate_rows().items():
+                    rows[(name, table)] = count
+        return rows
+
+    def calibrate(self, scale=CALIBRATION_SCALE):
+        """Run every generator at a small scale and measure per-table size and speed"""
+        calibration = {}
+        with _working_dir(self.config_dir) as scratch:
+            for name in self.generators:
+                print(f"Calibrating {name} at scale {scale}...")
+                generator = self._make_generator(name, scale)
+                generator.fake_pool.warm(generator.fake_pool_kinds)
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    generator.generate_all_data()
+                elapsed = time.perf_counter() - start
+
+                output_dir = scratch / GENERATORS[name][1]
+                tables = {
+                    table: _measure_table(output_dir / table, _schema_name(table))
+                    for table in generator.estimate_rows()
+                }
+                total_rows = sum(rows for rows, _, _ in tables.values())
+                calibration[name] = {
+                    'seconds_per_row': elapsed / total_rows if total_rows else 0.0,
+                    'tables': {
+                        table: {
+                            'bytes_per_row': disk_bytes / rows if rows else 0.0,
+                            'memory_per_row': memory_per_row
+                        }
+                        for table, (rows, disk_bytes, memory_per_row) in tables.items()
+                    }
+                }
+        self.calibration = calibration
+        return calibration
+
+    def plan(self, scale=1.0):
+        """Estimate rows, disk size, memory and runtime per table at the given scale
+
+        Runtime is measured per generator and apportioned to its tables by row count.
+        """
+        records = []
+        for (name, table), rows in self.estimate_rows(scale).items():
+            record = {'generator': name, 'table': table, 'rows': int(round(rows))}
+            if self.calibration is not None:
+                measured = self.calibration[name]['tables'][table]
+                streamed = not table.endswith('.csv')
+                rows_in_memory = min(rows, DEFAULT_CHUNK_ROWS) * STREAM_BUFFER_COPIES if streamed else rows
+                record['disk_bytes'] = rows * measured['bytes_per_row']
+                record['memory_bytes'] = rows_in_memory * measured['memory_per_row']
+                record['seconds'] = rows * self.calibration[name]['seconds_per_row']
+            records.append(record)
+        return pd.DataFrame(records)
+
+    def scale_for_target(self, target_rows=None, target_bytes=None, low=1e-4, high=1e4):
+        """Find the scale whose estimated total rows or disk size meets the target"""
+        if (target_rows is None) == (target_bytes is None):
+            raise ValueError("Specify exactly one of target_rows or target_bytes")
+        if target_bytes is not None and self.calibration is None:
+            raise ValueError("A calibration run is needed to plan for a target size")
+        column, target = ('rows', target_rows) if target_rows is not None else ('disk_bytes', target_bytes)
+
+        # Estimates grow monotonically with scale, so bisect on a log scale
+        for _ in range(40):
+            middle = np.sqrt(low * high)
+            if self.plan(middle)[column].sum() < target:
+                low = middle
+            else:
+                high = middle
+        return float(np.sqrt(low * high))
+
+
+def print_plan(plan, scale):
+    """Print a plan with per-generator and overall totals"""
+    print(f"\n=== Generation plan at scale {scale:g} ===")
+    calibrated = 'disk_bytes' in plan.columns
+    display = plan.copy()
+    if calibrated:
+        display['disk'] = display['disk_bytes'].map(format_size)
+        display['memory'] = display['memory_bytes'].map(format_size)
+        display = display.drop(columns=['disk_bytes', 'memory_bytes', 'seconds'])
+    print(display.to_string(index=False))
+
+    print("\n=== Totals ===")
+    for name, group in plan.groupby('generator', sort=False):
+        line = f"{name}: {group['rows'].sum():,} rows"
+        if calibrated:
+            # Tables are all held at once in the worst case, so memory is summed
+            line += (f", {format_size(group['disk_bytes'].sum())} on disk"
+                     f", peak memory up to {format_size(group['memory_bytes'].sum())}"
+                     f", ~{group['seconds'].sum():.0f}s")
+        print(line)
+    line = f"All generators: {plan['rows'].sum():,} rows"
+    if calibrated:
+        line += (f", {format_size(plan['disk_bytes'].sum())} on disk"
+                 f", ~{plan['seconds'].sum():.0f}s with one worker")
+    print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dry-run estimate of generated data volume")
+    parser.add_argument('--config-dir', default='.', help="Directory holding the YAML configs")
+    parser.add_argument('--generators', nargs='+', choices=list(GENERATORS), help="Generators to plan")
+    parser.add_argument('--scale', type=float, default=1.0, help="Scale factor to plan for")
+    parser.add_argument('--target-rows', type=float, help="Find the scale that produces this many rows")
+    parser.add_argument('--target-size', help="Find the scale that produces this much data, e.g. 50GB")
+    parser.add_argument('--no-calibrate', action='store_true', help="Skip the calibration run; rows only")
+    args = parser.parse_args()
+
+    planner = GenerationPlanner(config_dir=args.config_dir, generators=args.generators)
+    if not args.no_calibrate:
+        planner.calibrate()
+
+    scale = args.scale
+    if args.target_rows is not None or args.target_size is not None:
+        scale = planner.scale_for_target(
+            target_rows=args.target_rows,
+            target_bytes=parse_size(args.target_size) if args.target_size else None
+        )
+        print(f"\nScale factor for the target: {scale:.4g}")
+
+    print_plan(planner.plan(scale), scale)
@@ -0,0 +1,162 @@
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from generation_planner import GENERATORS, _measure_table, _schema_name, _working_dir, format_size
+from fake_pool import DEFAULT_CACHE_DIR
+
+# Fixed end date, so every run of a benchmark generates the same rows
+BENCHMARK_END_DATE = datetime(2025, 1, 1)
+
+# Scales per generator: operational telemetry grows fastest with scale, so industrial runs smaller
+BENCHMARK_SCALES = {
+    'industrial': [0.005, 0.02],
+    'workforce': [1, 10],
+    'financial': [1, 10],
+    'water_finance': [1, 10],
+    'water_metrics': [1, 10]
+}
+
+# Each benchmark keeps the fastest of several runs, which is the least noisy on a busy machine;
+# quick generators run again until their runs add up to MIN_BENCHMARK_SECONDS
+DEFAULT_REPEATS = 3
+MIN_BENCHMARK_SECONDS = 2.0
+
+# Fail when throughput drops by more than this fraction of the baseline
+DEFAULT_THRESHOLD = 0.25
+
+DEFAULT_BASELINE = Path(__file__).resolve().parents[1] / 'tests' / 'benchmark_baselines.json'
+
+
+def benchmark_key(name, scale):
+    """Baseline key of one generator at one scale, e.g. 'workforce@0.05'"""
+    return f"{name}@{scale:g}"
+
+
+def _benchmark_in_process(config_dir, name, scale, pool_cache_dir, repeats):
+    """Run one generator in the current process and measure its best throughput and output"""
+    with _working_dir(config_dir) as scratch:
+        generator_class, output_dir = GENERATORS[name]
+        with contextlib.redirect_stdout(io.StringIO()):
+            generator = generator_class(scale=scale)
+        generator.end_date = BENCHMARK_END_DATE
+        generator.fake_pool.cache_dir = Path(pool_cache_dir)
+        generator.fake_pool.warm(generator.fake_pool_kinds)
+
+        seconds = float('inf')
+        runs = 0
+        total_seconds = 0.0
+        while runs < repeats or total_seconds < MIN_BENCHMARK_SECONDS:
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                generator.generate_all_data()
+            elapsed = time.perf_counter() - start
+            seconds = min(seconds, elapsed)
+            total_seconds += elapsed
+            runs += 1
+
+        tables = {}
+        for table in generator.estimate_rows():
+            rows, disk_bytes, _ = _measure_table(scratch / output_dir / table, _schema_name(table))
+            tables[table] = {'rows': rows, 'bytes': disk_bytes}
+
+    rows = sum(table['rows'] for table in tables.values())
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == 'darwin' else 1024)
+    return {
+        'generator': name,
+        'scale': scale,
+        'seconds': seconds,
+        'runs': runs,
+        'rows': rows,
+        'rows_per_second': rows / seconds if seconds else 0.0,
+        'peak_rss_bytes': peak_rss,
+        'tables': tables
+    }
+
+
+def run_benchmark(name, scale, config_dir='.', repeats=DEFAULT_REPEATS):
+    """Benchmark one generator at one scale in a fresh process, so peak RSS is its own"""
+    config_dir = Path(config_dir).resolve()
+    pool_cache_dir = Path(DEFAULT_CACHE_DIR).resolve()
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as pool:
+        return pool.submit(_benchmark_in_process, config_dir, name, scale, pool_cache_dir, repeats).result()
+
+
+def load_baselines(path=DEFAULT_BASELINE):
+    path = Path(path)
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def save_baselines(results, path=DEFAULT_BASELINE):
+    """Record results as the baselines for their generator and scale, keeping other entries"""
+    baselines = load_baselines(path)
+    for result in results:
+        baselines[benchmark_key(result['generator'], result['scale'])] = result
+    Path(path).write_text(json.dumps(baselines, indent=2, sort_keys=True) + '\n')
+
+
+def find_regression(result, baselines, threshold=DEFAULT_THRESHOLD):
+    """Describe a throughput drop beyond ``threshold`` against the baseline, or return None"""
+    baseline = baselines.get(benchmark_key(result['generator'], result['scale']))
+    if baseline is None:
+        return None
+    floor = baseline['rows_per_second'] * (1 - threshold)
+    if result['rows_per_second'] >= floor:
+        return None
+    return (f"{benchmark_key(result['generator'], result['scale'])}: "
+            f"{result['rows_per_second']:,.0f} rows/s, below {floor:,.0f} "
+            f"({baseline['rows_per_second']:,.0f} baseline - {threshold:.0%})")
+
+
+def print_result(result, baseline=None):
+    """Print a benchmark result, with the change from its baseline if there is one"""
+    line = (f"{benchmark_key(result['generator'], result['scale'])}: {result['rows']:,} rows in "
+            f"{result['seconds']:.2f}s, {result['rows_per_second']:,.0f} rows/s, "
+            f"peak RSS {format_size(result['peak_rss_bytes'])}")
+    if baseline is not None:
+        line += f" ({result['rows_per_second'] / baseline['rows_per_second'] - 1:+.1%} vs baseline)"
+    print(line)
+    for table, measured in result['tables'].items():
+        print(f"    {table}: {measured['rows']:,} rows, {format_size(measured['bytes'])}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark generator throughput against stored baselines")
+    parser.add_argument('--config-dir', default='.', help="Directory holding the YAML configs")
+    parser.add_argument('--generators', nargs='+', choices=list(GENERATORS), help="Generators to benchmark")
+    parser.add_argument('--scales', nargs='+', type=float, help="Scale factors to run, overriding each generator's own")
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS, help="Runs per benchmark; the fastest counts")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="JSON file of baseline results")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed fractional drop in rows/sec before failing")
+    parser.add_argument('--update-baseline', action='store_true', help="Record this run as the new baseline")
+    args = parser.parse_args()
+
+    baselines = load_baselines(args.baseline)
+    results = []
+    regressions = []
+    for name in args.generators or list(GENERATORS):
+        for scale in args.scales or BENCHMARK_SCALES[name]:
+            result = run_benchmark(name, scale, args.config_dir, args.repeats)
+            print_result(result, baselines.get(benchmark_key(name, scale)))
+            results.append(result)
+            regression = find_regression(result, baselines, args.threshold)
+            if regression:
+                regressions.append(regression)
+
+    if args.update_baseline:
+        save_baselines(results, args.baseline)
+        print(f"Baselines saved to {args.baseline}")
+    elif regressions:
+        print("\nThroughput regressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
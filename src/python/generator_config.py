@@ -0,0 +1,118 @@
+import hashlib
+from pathlib import Path
+import numpy as np
+import yaml
+
+# Parsed configs by content hash, so copies of a file share one parse and an edited file is parsed again
+_CONFIG_CACHE = {}
+
+_MISSING = object()
+
+
+class ConfigError(ValueError):
+    """A generator config file is missing a setting or holds an invalid one"""
+
+
+class GeneratorConfig:
+    """A parsed YAML config, validated once and shared by every generator that loads the same file
+
+    Settings are read as nested keys as before (``config['transactions']['daily_range']``)
+    or in one cached step by dotted path (``config.lookup('transactions.daily_range')``);
+    ``config.array`` gathers a setting across the entries of a mapping or list as a numpy
+    array. The parsed data is shared, so it must not be modified.
+    """
+
+    def __init__(self, path, data, digest):
+        self.path = path
+        self.data = data
+        self.digest = digest
+        self._lookups = {}
+        self._validated = set()
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def lookup(self, path, default=_MISSING):
+        """The setting at a dotted path such as 'revenue.components.water_sales.base_percentage'"""
+        if path not in self._lookups:
+            value = self.data
+            for key in path.split('.'):
+                if not isinstance(value, dict) or key not in value:
+                    if default is _MISSING:
+                        raise ConfigError(f"{self.path}: missing setting '{path}'")
+                    return default
+                value = value[key]
+            self._lookups[path] = value
+        return self._lookups[path]
+
+    def array(self, path, field=None):
+        """A setting across the entries of a mapping or list, e.g. array('locations.facilities.x', 'lat')"""
+        key = (path, field)
+        if key not in self._lookups:
+            entries = self.lookup(path)
+            values = list(entries.values() if isinstance(entries, dict) else entries)
+            if field is not None:
+                values = [entry[field] for entry in values]
+            array = np.array(values)
+            array.flags.writeable = False
+            self._lookups[key] = array
+        return self._lookups[key]
+
+    def _expand(self, path):
+        """(dotted path, value) for every setting a path with '*' wildcards matches"""
+        matches = [('', self.data)]
+        for key in path.split('.'):
+            expanded = []
+            for prefix, value in matches:
+                if not isinstance(value, dict) or (key != '*' and key not in value) or not value:
+                    missing = f"{prefix}.{key}" if prefix else key
+                    raise ConfigError(f"{self.path}: missing setting '{missing}'")
+                keys = list(value) if key == '*' else [key]
+                expanded.extend((f"{prefix}.{k}" if prefix else str(k), value[k]) for k in keys)
+            matches = expanded
+        return matches
+
+    def validate(self, required=(), ranges=()):
+        """Check that required settings exist and that ranges are [low, high] pairs, once per set of rules
+
+        Paths may use '*' to match every key of a mapping, e.g. 'costs.components.*.percentage_range'.
+        """
+        rules = (tuple(required), tuple(ranges))
+        if rules in self._validated:
+            return self
+        errors = []
+        for path in required:
+            try:
+                self._expand(path)
+            except ConfigError as error:
+                errors.append(str(error))
+        for pattern in ranges:
+            try:
+                matches = self._expand(pattern)
+            except ConfigError as error:
+                errors.append(str(error))
+                continue
+            for path, value in matches:
+                if not (isinstance(value, list) and len(value) == 2
+                        and all(isinstance(v, (int, float)) for v in value) and value[0] <= value[1]):
+                    errors.append(f"{self.path}: '{path}' should be a [low, high] range, got {value!r}")
+        if errors:
+            raise ConfigError('\n'.join(errors))
+        self._validated.add(rules)
+        return self
+
+
+def load_config(path, required=(), ranges=()):
+    """Load and validate a YAML config, reusing the parsed form while the file is unchanged"""
+    path = Path(path).resolve()
+    contents = path.read_bytes()
+    digest = hashlib.sha256(contents).hexdigest()
+    if digest not in _CONFIG_CACHE:
+        _CONFIG_CACHE[digest] = GeneratorConfig(path, yaml.safe_load(contents), digest)
+    return _CONFIG_CACHE[digest].validate(required, ranges)
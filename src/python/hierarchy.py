@@ -0,0 +1,60 @@
+from collections import defaultdict
+
+
+def assign_parents(ids, groups, rnd, parent_probability, max_depth=None, max_children=None):
+    """Pick a parent for each node from the other members of its group in O(n)
+
+    Without limits every node gets, with ``parent_probability``, a uniformly
+    chosen other member of its group. With ``max_depth`` (levels per tree) or
+    ``max_children`` (fan-out per parent) the groups are built into acyclic
+    trees that respect those limits.
+    """
+    members = defaultdict(list)
+    for index, group in enumerate(groups):
+        members[group].append(index)
+
+    parents = [None] * len(ids)
+    if max_depth is None and max_children is None:
+        for group_members in members.values():
+            if len(group_members) < 2:
+                continue
+            for position, index in enumerate(group_members):
+                if rnd.random() < parent_probability:
+                    # Draw from the other len - 1 members by skipping over this node
+                    choice = rnd.randrange(len(group_members) - 1)
+                    if choice >= position:
+                        choice += 1
+                    parents[index] = ids[group_members[choice]]
+        return parents
+
+    for group_members in members.values():
+        order = list(group_members)
+        rnd.shuffle(order)
+
+        # Nodes that can still take children, kept for O(1) draws and removals
+        open_nodes = []
+        open_position = {}
+        depth = {}
+        children = defaultdict(int)
+
+        for index in order:
+            if open_nodes and rnd.random() < parent_probability:
+                parent = open_nodes[rnd.randrange(len(open_nodes))]
+                parents[index] = ids[parent]
+                depth[index] = depth[parent] + 1
+                children[parent] += 1
+                if max_children is not None and children[parent] >= max_children:
+                    # Swap-remove the full parent from the open list
+                    last = open_nodes.pop()
+                    if last != parent:
+                        open_nodes[open_position[parent]] = last
+                        open_position[last] = open_position[parent]
+                    del open_position[parent]
+            else:
+                depth[index] = 1
+
+            if (max_depth is None or depth[index] < max_depth) and max_children != 0:
+                open_position[index] = len(open_nodes)
+                open_nodes.append(index)
+
+    return parents
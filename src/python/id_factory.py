@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+# Digits in sequential IDs; larger batches are padded to their largest number
+DEFAULT_ID_WIDTH = 8
+
+HEX_DIGITS = np.frombuffer(b'0123456789abcdef', dtype=np.uint8)
+
+
+def check_unique(ids):
+    """Raise ValueError if a batch of IDs or ID codes holds duplicates; one hash pass over the batch"""
+    index = pd.Index(ids)
+    if index.has_duplicates:
+        duplicates = index[index.duplicated()].unique()
+        raise ValueError(f"{len(duplicates)} duplicate IDs, e.g. {list(duplicates[:5])}")
+    return ids
+
+
+def _format_ids(prefix, codes, base, width):
+    """Render integer codes as prefix + fixed-width digits in a base, building all strings as bytes"""
+    prefix = np.frombuffer(prefix.encode('ascii'), dtype=np.uint8)
+    chars = np.empty((len(codes), len(prefix) + width), dtype=np.uint8)
+    chars[:, :len(prefix)] = prefix
+    remaining = np.asarray(codes, dtype=np.uint64)
+    for position in range(chars.shape[1] - 1, len(prefix) - 1, -1):
+        remaining, digit = np.divmod(remaining, np.uint64(base))
+        chars[:, position] = HEX_DIGITS[digit]
+    return chars.view(f'S{chars.shape[1]}').ravel().astype(str)
+
+
+class IdFactory:
+    """Seeded ID columns built as whole arrays
+
+    Sequential IDs ('WO_00000001', 'WO_00000002', ...) continue per prefix across
+    calls, zero-padded to at least ``width`` digits; they sort in the order they were
+    issued until a counter outgrows the width, when the padding widens. Random IDs are drawn without
+    replacement from the seeded generator, so a batch never repeats one. Every
+    batch is checked for duplicates before it is returned.
+    """
+
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+        self.counters = {}
+
+    def sequential(self, prefix, size, width=DEFAULT_ID_WIDTH, start=None):
+        """The next ``size`` counter IDs for a prefix, zero-padded to ``width`` digits
+
+        With ``start``, numbering continues after it, e.g. from a count saved by an
+        earlier run, instead of after the prefix's last issued ID.
+        """
+        if start is None:
+            start = self.counters.get(prefix, 0)
+        numbers = check_unique(np.arange(start + 1, start + size + 1))
+        self.counters[prefix] = start + size
+        return _format_ids(prefix, numbers, 10, max(width, len(str(start + size))))
+
+    def random(self, prefix, size, length=8):
+        """``size`` distinct random IDs of ``length`` hex digits, like a truncated uuid4"""
+        if not 0 < length <= 16:
+            raise ValueError("Random IDs have between 1 and 16 hex digits")
+        space = 16 ** length
+        if size > space:
+            raise ValueError(f"Cannot draw {size} distinct IDs of {length} hex digits")
+        if length < 16:
+            codes = self.rng.choice(space, size=size, replace=False)
+        else:
+            # 16 ** 16 is too large for choice, so full-width codes are drawn as uint64 and repeats drawn again
+            codes = self.rng.integers(0, np.iinfo(np.uint64).max, size=size, dtype=np.uint64, endpoint=True)
+            repeated = pd.Index(codes).duplicated()
+            while repeated.any():
+                codes[repeated] = self.rng.integers(0, np.iinfo(np.uint64).max, size=int(repeated.sum()),
+                                                    dtype=np.uint64, endpoint=True)
+                repeated = pd.Index(codes).duplicated()
+        return _format_ids(prefix, check_unique(codes), 16, length)
@@ -0,0 +1,100 @@
+import pandas as pd
+from datetime import datetime, timedelta
+from pathlib import Path
+import json
+import os
+
+# pyarrow's CSV writer formats large numeric tables several times faster than pandas
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_CSV_AVAILABLE = True
+except ImportError:
+    PYARROW_CSV_AVAILABLE = False
+
+CHECKPOINT_FILE = '_checkpoint.json'
+
+
+class Checkpoint:
+    """Per-table watermarks and ID counters from the last run, stored next to the output"""
+
+    def __init__(self, output_dir):
+        self.path = Path(output_dir) / CHECKPOINT_FILE
+        if self.path.exists():
+            self.data = json.loads(self.path.read_text())
+        else:
+            self.data = {'watermarks': {}, 'counters': {}}
+
+    @property
+    def exists(self):
+        return self.path.exists()
+
+    def watermark(self, table):
+        """Return the end of the last generated time range for a table, or None"""
+        value = self.data['watermarks'].get(table)
+        return datetime.fromisoformat(value) if value else None
+
+    def set_watermark(self, table, end_date):
+        self.data['watermarks'][table] = end_date.isoformat()
+
+    def counter(self, name, default=0):
+        """Return the last ID number issued for a counter"""
+        return self.data['counters'].get(name, default)
+
+    def set_counter(self, name, value):
+        self.data['counters'][name] = int(value)
+
+    def save(self):
+        """Write the checkpoint atomically so an interrupted run keeps the previous one"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        tmp_path.write_text(json.dumps(self.data, indent=2, sort_keys=True))
+        os.replace(tmp_path, self.path)
+
+
+def shard_key(*key, since=None):
+    """Shard key for a table; incremental shards also key on their window so each refresh differs"""
+    return key if since is None else key + (since.isoformat(),)
+
+
+def step_dates(start_date, end_date, step_days, after=None):
+    """Dates start_date, start_date + step, ... up to end_date, keeping only those after ``after``"""
+    step = timedelta(days=step_days)
+    index = 0 if after is None or after < start_date else (after - start_date) // step + 1
+    dates = []
+    current_date = start_date + index * step
+    while current_date <= end_date:
+        dates.append(current_date)
+        current_date += step
+    return dates
+
+
+def write_table(df, path, append=False, index=False, engine='pandas'):
+    """Write a table as CSV, or append its rows to an existing file in the file's column order
+
+    With ``engine='pyarrow'`` the rows are written by pyarrow when it is installed;
+    it quotes every string value, which reads back the same, and writes timestamps
+    that all fall on midnight as dates, as pandas does.
+    """
+    path = Path(path)
+    appending = append and path.exists()
+    if appending:
+        if df.empty:
+            return
+        columns = pd.read_csv(path, nrows=0, index_col=0 if index else None).columns
+        df = df.reindex(columns=columns)
+
+    if engine == 'pyarrow' and PYARROW_CSV_AVAILABLE:
+        if index:
+            df = df.reset_index(names=df.index.name or '')
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        # Like pandas, write timestamps that all fall on midnight as plain dates
+        for position, column in enumerate(df.columns):
+            values = df[column].to_numpy()
+            if values.dtype.kind == 'M' and (values.astype('datetime64[D]') == values).all():
+                table = table.set_column(position, table.field(position).name,
+                                         table.column(position).cast(pa.date32()))
+        with open(path, 'ab' if appending else 'wb') as f:
+            pa_csv.write_csv(table, f, pa_csv.WriteOptions(include_header=not appending))
+    else:
+        df.to_csv(path, mode='a' if appending else 'w', header=not appending, index=index)
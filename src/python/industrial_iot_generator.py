@@ -1,28 +1,48 @@
 import pandas as pd
 import numpy as np
-from faker import Faker
 from datetime import datetime, timedelta
-import random
-import yaml
 from pathlib import Path
-import uuid
-import json
-from scipy import stats
-import os
+import argparse
+import itertools
+import ast
+from partitioned_writer import PartitionedWriter, DEFAULT_CHUNK_ROWS
+from sharding import ShardedGeneratorMixin
+from hierarchy import assign_parents
+from incremental import Checkpoint, shard_key, write_table
+from schemas import apply_schema, read_table
+from generator_config import load_config
 
-# Set random seeds for reproducibility
+# Master seed for reproducibility; each sector shard derives its own seed from it
 RANDOM_SEED = 42
-np.random.seed(RANDOM_SEED)
-random.seed(RANDOM_SEED)
-fake = Faker()
-Faker.seed(RANDOM_SEED)
 
-class IndustrialIoTGenerator:
-    def __init__(self):
+# Settings industry_config.yaml must define, checked once when the file is first loaded
+CONFIG_REQUIRED = (
+    'sectors.*.asset_types',
+    'locations.facilities',
+    'maintenance_types',
+    'work_order_status',
+    'compliance_standards',
+    'safety_requirements.permits'
+)
+
+OPERATIONAL_COLUMNS = [
+    'asset_id', 'timestamp', 'operational_status', 'efficiency', 'temperature',
+    'pressure', 'vibration', 'utilization', 'quality_score', 'energy_consumption',
+    'capex', 'opex'
+]
+
+class IndustrialIoTGenerator(ShardedGeneratorMixin):
+    fake_pool_kinds = ('company', 'name')
+
+    def __init__(self, seed=RANDOM_SEED, scale=1.0):
         self.start_date = datetime(2019, 1, 1)
         self.end_date = datetime.now()
+        self.scale = scale
         self.config = self._load_config()
         
+        # Per-instance random sources (self.random, self.rng, self.fake, self.fake_pool)
+        self.init_random_state(seed)
+        
         # Create output directory
         self.output_dir = Path('industrial_data')
         self.output_dir.mkdir(exist_ok=True)
@@ -32,21 +52,52 @@ class IndustrialIoTGenerator:
         self.work_order_counter = 0
         
     def _load_config(self):
-        """Load configuration from YAML file"""
-        with open('industry_config.yaml', 'r') as f:
-            return yaml.safe_load(f)
+        """Load the validated configuration, parsed once per version of the YAML file"""
+        return load_config('industry_config.yaml', required=CONFIG_REQUIRED)
+    
+    def estimate_rows(self):
+        """Expected rows per output table at the current scale, without generating anything"""
+        instances = self.expected_scaled_count(50, 200)
+        # Installation dates fall uniformly 1-10 years before end_date
+        mean_age_days = 365 * (1 + 10) / 2
+        
+        rows = {}
+        for sector, sector_config in self.config['sectors'].items():
+            asset_types = [t for types in sector_config['asset_types'].values() for t in types]
+            num_assets = instances * len(asset_types)
+            rows[f'{sector}_assets.csv'] = num_assets
+            rows[f'{sector}_work_orders.csv'] = instances * sum(
+                mean_age_days / (asset_type['maintenance_interval'] / 24) for asset_type in asset_types
+            )
+            rows[f'operational_data/sector={sector}'] = num_assets * (mean_age_days * 24 + self.end_date.hour + 1)
+        return rows
     
     def generate_asset_master_data(self, sector):
         """Generate asset master data for a specific sector"""
         assets = []
-        sector_config = self.config['sectors'][sector]
+        sector_config = self.config.lookup(f'sectors.{sector}')
         
         for category, asset_types in sector_config['asset_types'].items():
             for asset_type in asset_types:
                 # Generate multiple instances of each asset type
-                num_instances = random.randint(50, 200)  # 50-200 instances per type
+                num_instances = self.scaled_count(self.random.randint(50, 200))  # 50-200 instances per type
+                
+                # Draw the fake fields for every instance of this type at once
+                manufacturers = self.fake_pool.draw('company', num_instances, self.rng).tolist()
+                model_codes = self.fake_pool.bothify('??###', num_instances, self.rng).tolist()
+                serial_numbers = self.fake_pool.uuid4(num_instances, self.rng).tolist()
+                installation_dates = self.fake_pool.dates_between(
+                    self.end_date - timedelta(days=365 * 10),
+                    self.end_date - timedelta(days=365),
+                    num_instances, self.rng
+                ).tolist()
+                warranty_dates = self.fake_pool.dates_between(
+                    self.end_date + timedelta(days=365),
+                    self.end_date + timedelta(days=365 * 5),
+                    num_instances, self.rng
+                ).tolist()
                 
-                for _ in range(num_instances):
+                for i in range(num_instances):
                     self.asset_counter += 1
                     asset_id = f"{sector[:2].upper()}-{category[:2].upper()}-{self.asset_counter:06d}"
                     
@@ -56,223 +107,370 @@ class IndustrialIoTGenerator:
                         'name': f"{asset_type['name']} #{self.asset_counter:03d}",
                         'type': asset_type['name'],
                         'category': category,
-                        'manufacturer': fake.company(),
-                        'model_number': f"MOD-{fake.bothify('??###')}",
-                        'serial_number': fake.uuid4(),
-                        'installation_date': fake.date_between(
-                            start_date='-10y',
-                            end_date='-1y'
-                        ),
-                        'expected_lifetime_hours': random.randint(40000, 100000),
-                        'expected_lifetime_years': random.randint(10, 25),
-                        'purchase_cost': random.uniform(10000, 1000000),
-                        'replacement_cost': random.uniform(15000, 1500000),
-                        'warranty_expiration': fake.date_between(
-                            start_date='+1y',
-                            end_date='+5y'
-                        ),
+                        'manufacturer': manufacturers[i],
+                        'model_number': f"MOD-{model_codes[i]}",
+                        'serial_number': serial_numbers[i],
+                        'installation_date': installation_dates[i],
+                        'expected_lifetime_hours': self.random.randint(40000, 100000),
+                        'expected_lifetime_years': self.random.randint(10, 25),
+                        'purchase_cost': self.random.uniform(10000, 1000000),
+                        'replacement_cost': self.random.uniform(15000, 1500000),
+                        'warranty_expiration': warranty_dates[i],
                         'maintenance_interval': asset_type['maintenance_interval'],
                         'standards': asset_type['standards'],
                         'failure_modes': asset_type['failure_modes'],
-                        'condition_score': random.uniform(60, 100),
-                        'criticality_rating': random.randint(1, 5),
-                        'operational_status': random.choice([
+                        'condition_score': self.random.uniform(60, 100),
+                        'criticality_rating': self.random.randint(1, 5),
+                        'operational_status': self.random.choice([
                             'Running', 'Standby', 'Maintenance', 'Failed'
                         ]),
-                        'firmware_version': f"{random.randint(1,5)}.{random.randint(0,9)}.{random.randint(0,9)}",
+                        'firmware_version': f"{self.random.randint(1,5)}.{self.random.randint(0,9)}.{self.random.randint(0,9)}",
                         'parent_asset_id': None,  # Will be updated later
                         'location': self._generate_location(sector)
                     }
                     
                     assets.append(asset)
         
-        # Establish parent-child relationships
-        for asset in assets:
-            if random.random() < 0.3:  # 30% chance of having a parent
-                potential_parents = [
-                    a for a in assets 
-                    if a['asset_id'] != asset['asset_id'] and 
-                    a['category'] == asset['category']
-                ]
-                if potential_parents:
-                    asset['parent_asset_id'] = random.choice(potential_parents)['asset_id']
-        
-        df = pd.DataFrame(assets)
+        # Establish parent-child relationships within each category
+        hierarchy = self.config.get('asset_hierarchy', {})
+        parent_ids = assign_parents(
+            [asset['asset_id'] for asset in assets],
+            [asset['category'] for asset in assets],
+            self.random,
+            parent_probability=hierarchy.get('parent_probability', 0.3),
+            max_depth=hierarchy.get('max_depth'),
+            max_children=hierarchy.get('max_children')
+        )
+        for asset, parent_id in zip(assets, parent_ids):
+            asset['parent_asset_id'] = parent_id
+        
+        df = apply_schema(pd.DataFrame(assets), 'assets')
         df.to_csv(self.output_dir / f'{sector}_assets.csv', index=False)
         return df
     
     def _generate_location(self, sector):
         """Generate location data for an asset"""
-        facilities = self.config['locations']['facilities'][sector]
-        facility = random.choice(facilities)
-        area = random.choice(facility['areas'])
+        facilities = self.config.lookup(f'locations.facilities.{sector}')
+        facility = self.random.choice(facilities)
+        area = self.random.choice(facility['areas'])
         
         return {
             'facility_name': facility['name'],
             'area': area,
             'location_code': f"{facility['name'][:3].upper()}-{area[:3].upper()}",
-            'lat': facility['lat'] + random.uniform(-0.01, 0.01),
-            'lon': facility['lon'] + random.uniform(-0.01, 0.01)
+            'lat': facility['lat'] + self.random.uniform(-0.01, 0.01),
+            'lon': facility['lon'] + self.random.uniform(-0.01, 0.01)
         }
     
-    def generate_work_orders(self, sector, assets_df):
-        """Generate work order history"""
-        work_orders = []
-        
-        # Generate work orders for each asset
-        for _, asset in assets_df.iterrows():
-            # Calculate number of work orders based on asset age and maintenance interval
-            installation_date = pd.to_datetime(asset['installation_date'])
-            days_since_installation = (self.end_date - installation_date).days
-            expected_work_orders = days_since_installation / (asset['maintenance_interval'] / 24)
-            
-            num_work_orders = int(np.random.poisson(expected_work_orders))
-            
-            for _ in range(num_work_orders):
-                self.work_order_counter += 1
-                work_order_id = f"WO-{sector[:2].upper()}-{self.work_order_counter:06d}"
-                
-                # Generate work order data
-                work_order = {
-                    'work_order_id': work_order_id,
-                    'asset_id': asset['asset_id'],
-                    'type': random.choice(self.config['maintenance_types']),
-                    'priority': random.randint(1, 5),
-                    'status': random.choice(self.config['work_order_status']),
-                    'problem_description': random.choice(asset['failure_modes']),
-                    'assigned_technician': fake.name(),
-                    'required_certifications': random.sample(
-                        self.config['compliance_standards'],
-                        k=random.randint(1, 3)
-                    ),
-                    'creation_date': fake.date_time_between(
-                        start_date=installation_date,
-                        end_date=self.end_date
-                    ),
-                    'estimated_hours': random.uniform(2, 48),
-                    'actual_hours': None,  # Will be updated based on status
-                    'parts_used': self._generate_parts_used(),
-                    'downtime_hours': None,  # Will be updated based on status
-                    'safety_permits': random.sample(
-                        self.config['safety_requirements']['permits'],
-                        k=random.randint(1, 3)
+    def generate_work_orders(self, sector, assets_df, since=None):
+        """Generate work order history for all assets in one batch of array draws
+
+        With ``since``, only work orders created after it are generated and appended.
+        """
+        # Calculate number of work orders based on the asset's time in service
+        # during the window and its maintenance interval
+        installation_dates = pd.to_datetime(assets_df['installation_date']).to_numpy('datetime64[us]')
+        end_date = np.datetime64(self.end_date, 'us')
+        window_start = installation_dates
+        if since is not None:
+            window_start = np.maximum(installation_dates, np.datetime64(since, 'us'))
+        days_in_window = np.maximum((end_date - window_start) / np.timedelta64(1, 'D'), 0)
+        expected_work_orders = days_in_window / (assets_df['maintenance_interval'].to_numpy() / 24)
+        
+        num_work_orders = self.rng.poisson(expected_work_orders)
+        asset_index = np.repeat(np.arange(len(assets_df)), num_work_orders)
+        n = len(asset_index)
+        
+        work_order_numbers = range(self.work_order_counter + 1, self.work_order_counter + n + 1)
+        self.work_order_counter += n
+        prefix = sector[:2].upper()
+        
+        maintenance_types = self.config['maintenance_types']
+        statuses = self.config['work_order_status']
+        status_codes = self.rng.integers(0, len(statuses), size=n)
+        
+        creation_dates = self.fake_pool.datetimes_between(
+            window_start[asset_index], end_date, n, self.rng
+        )
+        estimated_hours = self.rng.uniform(2, 48, size=n)
+        
+        # Completion fields are only filled for completed and cancelled work orders
+        done = np.isin(status_codes, [statuses.index(s) for s in ('Completed', 'Cancelled') if s in statuses])
+        num_done = int(done.sum())
+        completion_dates = np.full(n, np.datetime64('NaT'), dtype='datetime64[us]')
+        completion_dates[done] = self.fake_pool.datetimes_between(
+            creation_dates[done],
+            np.minimum(creation_dates[done] + np.timedelta64(30, 'D'), end_date),
+            num_done, self.rng
+        )
+        actual_hours = np.full(n, np.nan)
+        actual_hours[done] = estimated_hours[done] * self.rng.uniform(0.8, 1.2, size=num_done)
+        downtime_hours = np.full(n, np.nan)
+        downtime_hours[done] = actual_hours[done] * self.rng.uniform(1.0, 1.5, size=num_done)
+        completion_codes = np.full(n, -1)
+        completion_codes[done] = (self.rng.random(num_done) >= 0.9).astype(int)
+        
+        work_orders = pd.DataFrame({
+            'work_order_id': [f"WO-{prefix}-{number:06d}" for number in work_order_numbers],
+            'asset_id': pd.Categorical.from_codes(asset_index, assets_df['asset_id']),
+            'type': pd.Categorical.from_codes(
+                self.rng.integers(0, len(maintenance_types), size=n), maintenance_types
+            ),
+            'priority': self.rng.integers(1, 6, size=n),
+            'status': pd.Categorical.from_codes(status_codes, statuses),
+            'problem_description': self._choose_failure_modes(assets_df['failure_modes'], asset_index),
+            'assigned_technician': self.fake_pool.draw('name', n, self.rng),
+            'required_certifications': self._sample_labels(self.config['compliance_standards'], n),
+            'creation_date': creation_dates,
+            'estimated_hours': estimated_hours,
+            'actual_hours': actual_hours,
+            'parts_used': self._generate_parts_used(n),
+            'downtime_hours': downtime_hours,
+            'safety_permits': self._sample_labels(self.config.lookup('safety_requirements.permits'), n),
+            'completion_status': pd.Categorical.from_codes(completion_codes, ['Success', 'Partial']),
+            'completion_date': completion_dates
+        })
+        
+        work_orders = apply_schema(work_orders, 'work_orders')
+        write_table(work_orders, self.output_dir / f'{sector}_work_orders.csv', append=since is not None)
+        return work_orders
+    
+    def _choose_failure_modes(self, failure_modes, asset_index):
+        """Pick one of each work order's asset failure modes"""
+        # Flatten the per-asset lists and index into them by offset
+        lengths = np.array([len(modes) for modes in failure_modes], dtype=np.int64)
+        offsets = np.cumsum(lengths) - lengths
+        flat_modes = np.array([mode for modes in failure_modes for mode in modes], dtype=object)
+        picks = (self.rng.random(len(asset_index)) * lengths[asset_index]).astype(np.int64)
+        return flat_modes[offsets[asset_index] + picks]
+    
+    def _sample_labels(self, items, size, max_k=3):
+        """Draw random.sample(items, k=1..max_k) for many rows, as list-formatted labels"""
+        items = list(items)
+        m = len(items)
+        max_k = min(max_k, m)
+        
+        # Ordering random keys gives a uniform permutation per row; keep its first k entries
+        order = np.argsort(self.rng.random((size, m)), axis=1)[:, :max_k]
+        k = self.rng.integers(1, max_k + 1, size=size)
+        
+        # Encode each (k, leading entries) selection as an integer and map it to its label
+        weights = m ** np.arange(max_k)
+        codes = (k - 1) * m ** max_k + ((order * weights) * (np.arange(max_k) < k[:, None])).sum(axis=1)
+        lookup = np.full(max_k * m ** max_k, -1)
+        labels = []
+        for length in range(1, max_k + 1):
+            for selection in itertools.permutations(range(m), length):
+                code = (length - 1) * m ** max_k + sum(i * w for i, w in zip(selection, weights))
+                lookup[code] = len(labels)
+                labels.append(str([items[i] for i in selection]))
+        return pd.Categorical.from_codes(lookup[codes], labels)
+    
+    def _generate_parts_used(self, size):
+        """Generate JSON lists of parts used for a batch of work orders"""
+        num_parts = self.rng.integers(1, 6, size=size)
+        total_parts = int(num_parts.sum())
+        part_codes = self.fake_pool.bothify('??###', total_parts, self.rng).tolist()
+        quantities = self.rng.integers(1, 11, size=total_parts).tolist()
+        unit_costs = self.rng.uniform(10, 1000, size=total_parts).tolist()
+        
+        # Format every part once, then join each work order's slice of them
+        parts = [
+            f'{{"part_id": "PRT-{code}", "quantity": {quantity}, "unit_cost": {cost!r}}}'
+            for code, quantity, cost in zip(part_codes, quantities, unit_costs)
+        ]
+        bounds = np.concatenate([[0], np.cumsum(num_parts)]).tolist()
+        return [f"[{', '.join(parts[bounds[i]:bounds[i + 1]])}]" for i in range(size)]
+    
+    def generate_operational_data(self, sector, assets_df, file_format='parquet',
+                                  chunk_rows=DEFAULT_CHUNK_ROWS, since=None):
+        """Stream operational performance data to a dataset partitioned by sector/asset_id/month
+
+        With ``since``, only readings after it are generated, as new files in the
+        existing dataset; a full run replaces the dataset.
+        """
+        installation_dates = pd.to_datetime(assets_df['installation_date'])
+        if since is None:
+            timeline_start = installation_dates.min()
+        else:
+            # Readings are hourly, so continue from the first hour after the watermark
+            timeline_start = pd.Timestamp(since).floor('h') + pd.Timedelta(hours=1)
+        
+        writer = PartitionedWriter(
+            self.output_dir / 'operational_data' / f'sector={sector}',
+            partition_cols=['asset_id', 'month'],
+            file_format=file_format,
+            chunk_rows=chunk_rows,
+            overwrite=since is None,
+            file_prefix='part' if since is None else f"part-{since:%Y%m%dT%H%M%S}"
+        )
+        if assets_df.empty or timeline_start > self.end_date:
+            writer.close()
+            return writer.rows_written
+        
+        # Build the hourly timeline and its daily/seasonal patterns once; every
+        # asset runs from its installation date to end_date, so each asset's
+        # readings are a tail slice of the same timeline
+        timeline = pd.date_range(
+            start=timeline_start,
+            end=self.end_date,
+            freq='h'
+        )
+        hour_factor, season_factor = self._daily_patterns(timeline)
+        offsets = timeline.searchsorted(installation_dates)
+        
+        # Month partition labels as codes into the list of months on the timeline
+        month_number = timeline.year.to_numpy() * 12 + timeline.month.to_numpy() - 1
+        month_codes = month_number - month_number[0]
+        months = pd.period_range(timeline[0], timeline[-1], freq='M').strftime('%Y-%m')
+        
+        asset_ids = assets_df['asset_id'].to_numpy()
+        
+        # Generate hourly readings asset by asset; the writer flushes bounded chunks.
+        # Label columns are built from integer codes so no per-row strings are created
+        with writer:
+            for asset_code, offset in enumerate(offsets):
+                n = len(timeline) - offset
+                readings = self._generate_asset_readings(hour_factor[offset:], season_factor[offset:])
+                frame = pd.DataFrame({
+                    'asset_id': pd.Categorical.from_codes(
+                        np.full(n, asset_code), categories=asset_ids
                     ),
-                    'completion_status': None  # Will be updated based on status
-                }
-                
-                # Update fields based on status
-                if work_order['status'] in ['Completed', 'Cancelled']:
-                    completion_date = fake.date_time_between(
-                        start_date=work_order['creation_date'],
-                        end_date=min(
-                            work_order['creation_date'] + timedelta(days=30),
-                            self.end_date
-                        )
-                    )
-                    work_order['completion_date'] = completion_date
-                    work_order['actual_hours'] = work_order['estimated_hours'] * random.uniform(0.8, 1.2)
-                    work_order['downtime_hours'] = work_order['actual_hours'] * random.uniform(1.0, 1.5)
-                    work_order['completion_status'] = 'Success' if random.random() < 0.9 else 'Partial'
-                
-                work_orders.append(work_order)
+                    'timestamp': timeline[offset:],
+                    **readings,
+                    'month': pd.Categorical.from_codes(month_codes[offset:], categories=months)
+                }, columns=OPERATIONAL_COLUMNS + ['month'])
+                writer.write(apply_schema(frame, 'operational_data'))
         
-        df = pd.DataFrame(work_orders)
-        df.to_csv(self.output_dir / f'{sector}_work_orders.csv', index=False)
-        return df
+        return writer.rows_written
     
-    def _generate_parts_used(self):
-        """Generate list of parts used in a work order"""
-        num_parts = random.randint(1, 5)
-        parts = []
-        
-        for _ in range(num_parts):
-            parts.append({
-                'part_id': f"PRT-{fake.bothify('??###')}",
-                'quantity': random.randint(1, 10),
-                'unit_cost': random.uniform(10, 1000)
-            })
-        
-        return json.dumps(parts)
+    def _daily_patterns(self, timestamps):
+        """Hour-of-day and seasonal load factors for a DatetimeIndex of readings"""
+        hour_factor = 1 + 0.1 * np.sin(2 * np.pi * timestamps.hour.to_numpy() / 24)
+        season_factor = 1 + 0.15 * np.sin(2 * np.pi * timestamps.dayofyear.to_numpy() / 365)
+        return hour_factor, season_factor
     
-    def generate_operational_data(self, sector, assets_df):
-        """Generate operational performance data"""
-        operational_data = []
-        
-        # Generate hourly readings for each asset
-        for _, asset in assets_df.iterrows():
-            dates = pd.date_range(
-                start=pd.to_datetime(asset['installation_date']),
-                end=self.end_date,
-                freq='h'
-            )
-            
-            # Base performance metrics
-            base_efficiency = random.uniform(0.85, 0.95)
-            base_temperature = random.uniform(60, 80)
-            base_pressure = random.uniform(80, 120)
-            base_vibration = random.uniform(0.1, 0.3)
-            
-            for date in dates:
-                # Add daily and seasonal patterns
-                hour_factor = 1 + 0.1 * np.sin(2 * np.pi * date.hour / 24)
-                season_factor = 1 + 0.15 * np.sin(2 * np.pi * date.dayofyear / 365)
-                
-                # Generate reading with noise and patterns
-                reading = {
-                    'asset_id': asset['asset_id'],
-                    'timestamp': date,
-                    'operational_status': 'Running' if random.random() < 0.95 else 'Standby',
-                    'efficiency': base_efficiency * hour_factor * season_factor + random.uniform(-0.05, 0.05),
-                    'temperature': base_temperature * hour_factor * season_factor + random.uniform(-2, 2),
-                    'pressure': base_pressure * hour_factor + random.uniform(-5, 5),
-                    'vibration': base_vibration + random.uniform(-0.05, 0.05),
-                    'utilization': random.uniform(0.7, 1.0) * hour_factor,
-                    'quality_score': random.uniform(0.9, 1.0),
-                    'energy_consumption': random.uniform(50, 100) * hour_factor * season_factor
-                }
-                
-                # Calculate CAPEX and OPEX
-                # CAPEX: Major investments and upgrades
-                capex = 0
-                if random.random() < 0.01:  # 1% chance of CAPEX event
-                    capex = random.uniform(10000, 100000)
-                
-                # OPEX: Daily operational costs
-                base_opex = random.uniform(100, 500)
-                opex = base_opex * hour_factor
-                
-                # Add maintenance costs to OPEX
-                if random.random() < 0.05:  # 5% chance of maintenance
-                    opex += random.uniform(1000, 5000)
-                
-                # Update reading with CAPEX and OPEX
-                reading['capex'] = capex
-                reading['opex'] = opex
-                
-                operational_data.append(reading)
+    def _draw_asset_baselines(self, size=None):
+        """Draw base performance metrics for one asset, or arrays of them for ``size`` assets"""
+        rng = self.rng
+        return {
+            'efficiency': rng.uniform(0.85, 0.95, size),
+            'temperature': rng.uniform(60, 80, size),
+            'pressure': rng.uniform(80, 120, size),
+            'vibration': rng.uniform(0.1, 0.3, size)
+        }
+    
+    def _generate_asset_readings(self, hour_factor, season_factor, baselines=None):
+        """Generate hourly readings as whole arrays
+
+        Without ``baselines`` the readings belong to a single asset with freshly
+        drawn base metrics; otherwise each reading uses the matching baseline
+        from arrays as returned by ``_draw_asset_baselines``.
+        """
+        rng = self.rng
+        n = len(hour_factor)
         
-        df = pd.DataFrame(operational_data)
-        df.to_csv(self.output_dir / f'{sector}_operational_data.csv', index=False)
-        return df
+        # Base performance metrics
+        if baselines is None:
+            baselines = self._draw_asset_baselines()
+        base_efficiency = baselines['efficiency']
+        base_temperature = baselines['temperature']
+        base_pressure = baselines['pressure']
+        base_vibration = baselines['vibration']
+        
+        daily_seasonal = hour_factor * season_factor
+        
+        # CAPEX: Major investments and upgrades (1% chance per hour)
+        capex = np.zeros(n)
+        capex_events = rng.random(n) < 0.01
+        capex[capex_events] = rng.uniform(10000, 100000, capex_events.sum())
+        
+        # OPEX: Daily operational costs plus maintenance (5% chance per hour)
+        opex = rng.uniform(100, 500, n) * hour_factor
+        maintenance_events = rng.random(n) < 0.05
+        opex[maintenance_events] += rng.uniform(1000, 5000, maintenance_events.sum())
+        
+        return {
+            'operational_status': pd.Categorical.from_codes(
+                (rng.random(n) >= 0.95).astype(np.int8),
+                categories=['Running', 'Standby']
+            ),
+            'efficiency': base_efficiency * daily_seasonal + rng.uniform(-0.05, 0.05, n),
+            'temperature': base_temperature * daily_seasonal + rng.uniform(-2, 2, n),
+            'pressure': base_pressure * hour_factor + rng.uniform(-5, 5, n),
+            'vibration': base_vibration + rng.uniform(-0.05, 0.05, n),
+            'utilization': rng.uniform(0.7, 1.0, n) * hour_factor,
+            'quality_score': rng.uniform(0.9, 1.0, n),
+            'energy_consumption': rng.uniform(50, 100, n) * daily_seasonal,
+            'capex': capex,
+            'opex': opex
+        }
+    
+    def _load_assets(self, sector):
+        """Read a sector's previously generated assets back for incremental runs"""
+        return read_table(
+            self.output_dir / f'{sector}_assets.csv', 'assets',
+            converters={'failure_modes': ast.literal_eval}
+        )
     
-    def generate_all_data(self):
-        """Generate all industrial IoT data"""
-        for sector in self.config['sectors'].keys():
-            print(f"Generating data for {sector}...")
-            
-            print("  Generating asset master data...")
+    def _generate_sector(self, sector, work_orders_since=None, readings_since=None, work_order_counter=0):
+        """Generate assets, work orders and operational data for one sector
+
+        In incremental runs the sector's existing assets are reused and only
+        work orders and readings after the watermarks are added.
+        """
+        if work_orders_since is None and readings_since is None:
             assets_df = self.generate_asset_master_data(sector)
-            
-            print("  Generating work orders...")
-            work_orders_df = self.generate_work_orders(sector, assets_df)
-            
-            print("  Generating operational data...")
-            operational_data_df = self.generate_operational_data(sector, assets_df)
-            
+        else:
+            assets_df = self._load_assets(sector)
+        self.work_order_counter = work_order_counter
+        work_orders_df = self.generate_work_orders(sector, assets_df, since=work_orders_since)
+        readings_written = self.generate_operational_data(sector, assets_df, since=readings_since)
+        return len(assets_df), len(work_orders_df), readings_written
+    
+    def generate_all_data(self, workers=1, incremental=False):
+        """Generate all industrial IoT data, one shard per sector
+
+        With ``incremental`` and a checkpoint from an earlier run, existing assets
+        are kept; work orders are appended and readings added as new partition files.
+        """
+        sectors = list(self.config['sectors'].keys())
+        checkpoint = Checkpoint(self.output_dir)
+        incremental = incremental and checkpoint.exists
+        
+        shards = []
+        for sector in sectors:
+            work_orders_since = checkpoint.watermark(f'{sector}_work_orders') if incremental else None
+            readings_since = checkpoint.watermark(f'operational_data/sector={sector}') if incremental else None
+            work_order_counter = checkpoint.counter(f'{sector}_work_orders') if incremental else 0
+            shards.append((
+                shard_key(sector, since=work_orders_since),
+                '_generate_sector',
+                (sector, work_orders_since, readings_since, work_order_counter)
+            ))
+        
+        mode = "new rows since the last run" if incremental else "data"
+        print(f"Generating {mode} for {len(sectors)} sectors with {workers} worker(s)...")
+        results = self.run_shards(shards, workers=workers)
+        
+        for sector, (num_assets, num_work_orders, readings_written) in zip(sectors, results):
             print(f"Completed generating data for {sector}")
+            print(f"  Assets: {num_assets}, work orders: {num_work_orders}, readings: {readings_written}")
+            checkpoint.set_watermark(f'{sector}_work_orders', self.end_date)
+            checkpoint.set_watermark(f'operational_data/sector={sector}', self.end_date)
+            work_order_counter = checkpoint.counter(f'{sector}_work_orders') if incremental else 0
+            checkpoint.set_counter(f'{sector}_work_orders', work_order_counter + num_work_orders)
+        checkpoint.save()
         
         print("Data generation complete! Files saved in 'industrial_data' directory.")
 
 if __name__ == "__main__":
-    generator = IndustrialIoTGenerator()
-    generator.generate_all_data() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Generate industrial IoT data")
+    parser.add_argument('--seed', type=int, default=RANDOM_SEED, help="Master random seed")
+    parser.add_argument('--workers', type=int, default=1, help="Worker processes, one sector per shard")
+    parser.add_argument('--scale', type=float, default=1.0, help="Multiplier for the number of assets")
+    parser.add_argument('--incremental', action='store_true', help="Append only rows after the last run's watermarks")
+    args = parser.parse_args()
+    
+    generator = IndustrialIoTGenerator(seed=args.seed, scale=args.scale)
+    generator.generate_all_data(workers=args.workers, incremental=args.incremental)
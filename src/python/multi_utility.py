@@ -0,0 +1,96 @@
+import numpy as np
+import shutil
+from sharding import derive_seed
+from incremental import shard_key, write_table
+from partitioned_writer import PartitionedWriter
+
+# Spread of utility sizes: each utility's volumes are scaled by a lognormal factor around 1
+UTILITY_SIZE_SIGMA = 0.5
+
+
+class MultiUtilityMixin:
+    """Generate one utility into flat CSVs, or many into datasets partitioned by utility_id
+
+    Generators set ``num_utilities`` and ``file_format`` and may override
+    ``apply_utility_profile`` to draw each utility's own parameters.
+    """
+
+    num_utilities = 1
+    file_format = 'parquet'
+
+    # Set for the utility a shard generates; None writes the single-utility CSVs
+    utility_id = None
+    utility_size = 1.0
+
+    @property
+    def utility_ids(self):
+        return [f'UTIL-{number:03d}' for number in range(1, self.num_utilities + 1)]
+
+    def partition_key(self, table, utility_id):
+        """Dataset path of one utility's partition, also its checkpoint key"""
+        return f'{table}/utility_id={utility_id}'
+
+    def draw_utility_size(self, utility_id):
+        """A utility's size factor, the same in every run for a given seed"""
+        rng = np.random.default_rng(derive_seed(self.seed, 'utility', utility_id, 'size'))
+        return float(rng.lognormal(0, UTILITY_SIZE_SIGMA))
+
+    def apply_utility_profile(self, rng):
+        """Draw the current utility's own parameters; the default keeps the shared ones"""
+
+    def write_output(self, df, table, since=None):
+        """Write a table's rows: a flat CSV for one utility, else the utility's partition"""
+        if self.utility_id is None:
+            write_table(df, self.output_dir / f'{table}.csv', append=since is not None)
+            return
+        writer = PartitionedWriter(
+            self.output_dir / self.partition_key(table, self.utility_id),
+            partition_cols=[],
+            file_format=self.file_format,
+            overwrite=since is None,
+            file_prefix='part' if since is None else f"part-{since:%Y%m%dT%H%M%S}"
+        )
+        with writer:
+            writer.write(df)
+
+    def generate_utility(self, method, utility_id, since=None, counters=None):
+        """Run one table's generator for one utility and return the rows written"""
+        self.utility_id = utility_id
+        self.utility_size = self.draw_utility_size(utility_id)
+        self.apply_utility_profile(np.random.default_rng(derive_seed(self.seed, 'utility', utility_id)))
+        for name, value in (counters or {}).items():
+            setattr(self, name, value)
+        return len(getattr(self, method)(since))
+
+    def run_utilities(self, tables, checkpoint, incremental=False, workers=1):
+        """Generate every table for every utility, one shard per (table, utility)
+
+        ``tables`` maps each table to its generator method and the name of its ID
+        counter attribute, or None. Watermarks and counters are kept per partition,
+        so utilities added since the last run get their full history. Returns the
+        rows written per table.
+        """
+        if not incremental:
+            for table in tables:
+                shutil.rmtree(self.output_dir / table, ignore_errors=True)
+
+        partitions = []
+        shards = []
+        for table, (method, counter) in tables.items():
+            for utility_id in self.utility_ids:
+                key = self.partition_key(table, utility_id)
+                since = checkpoint.watermark(key) if incremental else None
+                counters = {counter: checkpoint.counter(key) if since else 0} if counter else {}
+                partitions.append((table, key, since))
+                shards.append((shard_key(table, utility_id, since=since), 'generate_utility',
+                               (method, utility_id, since, counters)))
+
+        results = self.run_shards(shards, workers=workers)
+
+        rows = dict.fromkeys(tables, 0)
+        for (table, key, since), num_rows in zip(partitions, results):
+            rows[table] += num_rows
+            checkpoint.set_watermark(key, self.end_date)
+            if tables[table][1]:
+                checkpoint.set_counter(key, (checkpoint.counter(key) if since else 0) + num_rows)
+        return rows
@@ -0,0 +1,113 @@
+import pandas as pd
+import numpy as np
+import shutil
+from pathlib import Path
+
+# Parquet output needs pyarrow; without it the writer falls back to CSV parts
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+DEFAULT_CHUNK_ROWS = 500000
+
+
+class PartitionedWriter:
+    def __init__(self, base_dir, partition_cols, file_format='parquet',
+                 chunk_rows=DEFAULT_CHUNK_ROWS, overwrite=True, file_prefix='part'):
+        if file_format not in ('parquet', 'csv'):
+            raise ValueError(f"Unsupported file format: {file_format}")
+        if file_format == 'parquet' and not PARQUET_AVAILABLE:
+            print("pyarrow is not installed, writing CSV partitions instead")
+            file_format = 'csv'
+
+        self.base_dir = Path(base_dir)
+        self.partition_cols = list(partition_cols)
+        self.file_format = file_format
+        self.chunk_rows = chunk_rows
+        self.file_prefix = file_prefix
+
+        if overwrite and self.base_dir.exists():
+            shutil.rmtree(self.base_dir)
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+
+        # Initialize counters
+        self.rows_written = 0
+        self.files = []
+        self._chunk_counter = 0
+        self._buffer = []
+        self._buffered_rows = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, df):
+        """Buffer a frame and flush once a full chunk has accumulated"""
+        if df.empty:
+            return
+        self._buffer.append(df)
+        self._buffered_rows += len(df)
+        if self._buffered_rows >= self.chunk_rows:
+            self.flush()
+
+    def flush(self):
+        """Write buffered rows as one file per partition"""
+        if not self._buffer:
+            return
+        chunk = pd.concat(self._buffer, ignore_index=True)
+        self._buffer = []
+        self._buffered_rows = 0
+
+        data = chunk.drop(columns=self.partition_cols)
+        if self.file_format == 'parquet':
+            # Convert the chunk to Arrow once and slice partitions out of it
+            data = pa.Table.from_pandas(data, preserve_index=False)
+
+        if self.partition_cols:
+            groups = chunk.groupby(self.partition_cols, sort=False, observed=True).indices.items()
+        else:
+            groups = [((), np.arange(len(chunk)))]
+
+        for keys, rows in groups:
+            if not isinstance(keys, tuple):
+                keys = (keys,)
+            part_dir = self.base_dir.joinpath(*[
+                f"{col}={value}" for col, value in zip(self.partition_cols, keys)
+            ])
+            part_dir.mkdir(parents=True, exist_ok=True)
+            path = part_dir / f"{self.file_prefix}-{self._chunk_counter:05d}.{self.file_format}"
+
+            # Partition values live in the directory names, not in the files
+            if self.file_format == 'parquet':
+                pq.write_table(data.take(rows), path)
+            else:
+                data.iloc[rows].to_csv(path, index=False)
+            self.files.append(path)
+
+        self._chunk_counter += 1
+        self.rows_written += len(chunk)
+
+    def close(self):
+        """Flush any remaining rows"""
+        self.flush()
+        return self.files
+
+
+def read_partitioned(base_dir):
+    """Read a partitioned dataset back into one frame, restoring partition columns"""
+    base_dir = Path(base_dir)
+    frames = []
+    for path in sorted(base_dir.rglob('*.parquet')) + sorted(base_dir.rglob('*.csv')):
+        df = pd.read_parquet(path) if path.suffix == '.parquet' else pd.read_csv(path)
+        for part in path.relative_to(base_dir).parent.parts:
+            col, _, value = part.partition('=')
+            df[col] = value
+        frames.append(df)
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,234 @@
+import pandas as pd
+
+# Compact dtypes for the columns of each generated table. Low-cardinality
+# labels and foreign keys are categorical, sensor readings, scores and rates
+# are float32, small counts and ratings use the narrowest integer type, and
+# dates are datetime64. Money stays float64 so cents survive large amounts.
+# Columns that aren't listed keep the dtype they were built with.
+CATEGORY = 'category'
+DATETIME = 'datetime'
+
+SCHEMAS = {
+    # Industrial IoT
+    'assets': {
+        'type': CATEGORY,
+        'category': CATEGORY,
+        'manufacturer': CATEGORY,
+        'installation_date': DATETIME,
+        'expected_lifetime_hours': 'int32',
+        'expected_lifetime_years': 'int8',
+        'warranty_expiration': DATETIME,
+        'maintenance_interval': 'int16',
+        'condition_score': 'float32',
+        'criticality_rating': 'int8',
+        'operational_status': CATEGORY,
+        'parent_asset_id': CATEGORY
+    },
+    'work_orders': {
+        'asset_id': CATEGORY,
+        'type': CATEGORY,
+        'priority': 'int8',
+        'status': CATEGORY,
+        'problem_description': CATEGORY,
+        'creation_date': DATETIME,
+        'estimated_hours': 'float32',
+        'actual_hours': 'float32',
+        'downtime_hours': 'float32',
+        'completion_status': CATEGORY,
+        'completion_date': DATETIME
+    },
+    'operational_data': {
+        'asset_id': CATEGORY,
+        'operational_status': CATEGORY,
+        'efficiency': 'float32',
+        'temperature': 'float32',
+        'pressure': 'float32',
+        'vibration': 'float32',
+        'utilization': 'float32',
+        'quality_score': 'float32',
+        'energy_consumption': 'float32',
+        'month': CATEGORY
+    },
+
+    # Workforce
+    'employees': {
+        'department': CATEGORY,
+        'role': CATEGORY,
+        'hire_date': DATETIME,
+        'employment_status': CATEGORY,
+        'manager_id': CATEGORY
+    },
+    'training_records': {
+        'employee_id': CATEGORY,
+        'training_type': CATEGORY,
+        'provider': CATEGORY,
+        'start_date': DATETIME,
+        'end_date': DATETIME,
+        'status': CATEGORY,
+        'score': 'Int8'
+    },
+    'leave_records': {
+        'employee_id': CATEGORY,
+        'leave_type': CATEGORY,
+        'start_date': DATETIME,
+        'end_date': DATETIME,
+        'status': CATEGORY,
+        'reason': CATEGORY,
+        'approved_by': CATEGORY
+    },
+    'performance_reviews': {
+        'employee_id': CATEGORY,
+        'review_date': DATETIME,
+        'reviewer_id': CATEGORY,
+        'overall_rating': 'int8',
+        'technical_skills': 'int8',
+        'communication': 'int8',
+        'leadership': 'int8',
+        'safety_compliance': 'int8',
+        'attendance': 'int8',
+        'comments': CATEGORY
+    },
+
+    # Financial
+    'client_portfolios': {
+        'account_type': CATEGORY,
+        'risk_profile': 'int8',
+        'account_open_date': DATETIME,
+        'ytd_return': 'float32',
+        'one_year_return': 'float32',
+        'three_year_return': 'float32',
+        'five_year_return': 'float32',
+        'ten_year_return': 'float32'
+    },
+    'investment_products': {
+        'asset_class': CATEGORY,
+        'strategy': CATEGORY,
+        'expense_ratio': 'float32',
+        'sharpe_ratio': 'float32',
+        'volatility': 'float32',
+        'beta': 'float32',
+        'alpha': 'float32',
+        'one_month': 'float32',
+        'three_month': 'float32',
+        'six_month': 'float32',
+        'one_year': 'float32',
+        'three_year': 'float32',
+        'five_year': 'float32',
+        'ten_year': 'float32'
+    },
+    'sector_performance': {
+        'date': DATETIME,
+        'sector': CATEGORY,
+        'performance': 'float32'
+    },
+    'interest_rates': {
+        'date': DATETIME,
+        'fed_funds_rate': 'float32',
+        'treasury_10y': 'float32'
+    },
+    'trading_activity': {
+        'date': DATETIME,
+        'client_id': CATEGORY,
+        'product_id': CATEGORY,
+        'transaction_type': CATEGORY,
+        'share_quantity': 'float32',
+        'price_per_share': 'float32'
+    },
+    'advisor_data': {
+        'client_count': 'int16',
+        'start_date': DATETIME,
+        'client_retention_rate': 'float32',
+        'client_satisfaction_score': 'float32',
+        'new_client_acquisition': 'int16'
+    },
+
+    # Water utilities finance
+    'financial_statements': {
+        'year': 'int16',
+        'month': 'int8',
+        'operating_margin': 'float32',
+        'net_margin': 'float32',
+        'revenue_growth': 'float32',
+        'cost_efficiency': 'float32',
+        'water_loss_percentage': 'float32',
+        'energy_efficiency': 'float32'
+    },
+    'budgets': {
+        'year': 'int16',
+        'status': CATEGORY,
+        'approval_date': DATETIME
+    },
+    'cash_flow': {
+        'date': DATETIME,
+        'transaction_type': CATEGORY,
+        'payment_method': CATEGORY,
+        'status': CATEGORY,
+        'description': CATEGORY,
+        'category': CATEGORY
+    },
+
+    # Water utilities metrics
+    'ofwat_results': {
+        'year': 'int16',
+        'quarter_number': 'int8',
+        'water_quality_score': 'float32',
+        'customer_service_score': 'float32',
+        'leakage_reduction_score': 'float32',
+        'water_efficiency_score': 'float32',
+        'environmental_impact_score': 'float32',
+        'operational_efficiency_score': 'float32',
+        'overall_performance_score': 'float32',
+        'performance_rating': CATEGORY,
+        'regulatory_compliance': CATEGORY
+    },
+    'capex_projects': {
+        'project_type': CATEGORY,
+        'start_date': DATETIME,
+        'planned_end_date': DATETIME,
+        'actual_end_date': DATETIME,
+        'progress_percentage': 'float32',
+        'status': CATEGORY,
+        'priority': CATEGORY,
+        'risk_level': CATEGORY
+    },
+    'pulse_surveys': {
+        'survey_date': DATETIME,
+        'department': CATEGORY,
+        'response_rate': 'float32',
+        'engagement_score': 'float32',
+        'satisfaction_score': 'float32',
+        'wellbeing_score': 'float32',
+        'culture_score': 'float32',
+        'leadership_score': 'float32',
+        'development_score': 'float32',
+        'work_life_balance_score': 'float32',
+        'recognition_score': 'float32',
+        'overall_score': 'float32'
+    }
+}
+
+
+def _cast(series, dtype):
+    """Cast one column, leaving it alone if it already has the target dtype"""
+    if dtype == DATETIME:
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series
+        return pd.to_datetime(series)
+    if dtype == CATEGORY and isinstance(series.dtype, pd.CategoricalDtype):
+        return series
+    if series.dtype == dtype:
+        return series
+    return series.astype(dtype)
+
+
+def apply_schema(df, table):
+    """Cast a frame's columns to the compact dtypes of a generated table and return it"""
+    for column, dtype in SCHEMAS[table].items():
+        if column in df.columns:
+            df[column] = _cast(df[column], dtype)
+    return df
+
+
+def read_table(path, table, **kwargs):
+    """Read a generated CSV back with its table's compact dtypes"""
+    return apply_schema(pd.read_csv(path, **kwargs), table)
@@ -0,0 +1,76 @@
+import numpy as np
+from faker import Faker
+import random
+import hashlib
+import pickle
+from fake_pool import FakeValuePool
+from concurrent.futures import ProcessPoolExecutor
+
+
+def derive_seed(master_seed, *keys):
+    """Derive a stable, independent seed for one shard from the master seed"""
+    digest = hashlib.sha256(repr((master_seed,) + keys).encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'little')
+
+
+def _run_shard(task):
+    """Run one shard of work on a generator with freshly seeded random sources"""
+    generator, key, method, args = task
+    generator.seed_shard(*key)
+    return getattr(generator, method)(*args)
+
+
+class ShardedGeneratorMixin:
+    """Per-instance random sources that are reseeded for each shard of work"""
+
+    # Fake value pools the generator draws from, cached before workers start
+    fake_pool_kinds = ()
+
+    # Multiplier applied to entity counts; generators set it from their scale argument
+    scale = 1.0
+
+    def init_random_state(self, seed):
+        """Set the master seed, its shared fake value pool and the random sources"""
+        self.seed = seed
+        self.fake_pool = FakeValuePool(seed)
+        self.seed_shard()
+
+    def seed_shard(self, *key):
+        """Reseed random, rng and fake from the master seed and a shard key"""
+        shard_seed = derive_seed(self.seed, *key)
+        self.random = random.Random(shard_seed)
+        self.rng = np.random.default_rng(shard_seed)
+        self.fake = Faker()
+        self.fake.seed_instance(shard_seed)
+
+    def scaled_count(self, count):
+        """Scale an entity count by the generator's scale factor, keeping at least one"""
+        return max(1, int(round(count * self.scale)))
+
+    def expected_scaled_count(self, low, high, factor=1.0):
+        """Mean of scaled_count(count * factor) over a uniform randint(low, high) draw"""
+        return float(np.mean([self.scaled_count(count * factor) for count in range(low, high + 1)]))
+
+    def run_shards(self, shards, workers=1):
+        """Run (key, method, args) shards and return their results in shard order"""
+        if workers > 1:
+            self.fake_pool.warm(self.fake_pool_kinds)
+        # Every shard runs against a pickled copy of the generator, in-process or
+        # in a worker, so a shard's output depends only on the master seed and its key
+        snapshot = pickle.dumps(self)
+        tasks = [(pickle.loads(snapshot), key, method, args) for key, method, args in shards]
+        if workers <= 1 or len(tasks) <= 1:
+            return [_run_shard(task) for task in tasks]
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            return list(pool.map(_run_shard, tasks))
+
+    def __getstate__(self):
+        # Random sources are reseeded per shard, so they are not shipped to workers
+        state = self.__dict__.copy()
+        for name in ('random', 'rng', 'fake'):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.seed_shard()
@@ -0,0 +1,410 @@
+import pandas as pd
+import numpy as np
+from collections import deque
+from datetime import datetime
+from io import BytesIO
+from pathlib import Path
+import argparse
+import asyncio
+import os
+import sys
+from industrial_iot_generator import IndustrialIoTGenerator, OPERATIONAL_COLUMNS, RANDOM_SEED
+
+# The MinIO sink needs the minio client; the local stand-in works without it
+try:
+    from minio import Minio
+    MINIO_AVAILABLE = True
+except ImportError:
+    MINIO_AVAILABLE = False
+
+# Batches are paced this many times per second, so the rate stays smooth
+TICKS_PER_SECOND = 100
+
+# Batches held between the generator and the sink before the generator waits
+DEFAULT_QUEUE_BATCHES = 100
+
+# Batch latencies kept for the percentiles in the metrics report
+LATENCY_WINDOW = 100000
+
+TELEMETRY_BUCKET = 'telemetry'
+DEFAULT_OBJECT_EVENTS = 10000
+
+
+class StdoutSink:
+    """Write JSON lines to standard output"""
+
+    async def open(self):
+        pass
+
+    async def write(self, payload, count):
+        sys.stdout.write(payload)
+
+    async def close(self):
+        sys.stdout.flush()
+
+
+class FileSink:
+    """Append JSON lines to a local file"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.file = None
+
+    async def open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.path, 'a')
+
+    async def write(self, payload, count):
+        self.file.write(payload)
+
+    async def close(self):
+        self.file.close()
+
+
+class SocketSink:
+    """Send JSON lines over a TCP or UNIX socket, waiting whenever the receiver falls behind"""
+
+    def __init__(self, host=None, port=None, path=None):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.writer = None
+
+    async def open(self):
+        if self.path is not None:
+            _, self.writer = await asyncio.open_unix_connection(self.path)
+        else:
+            _, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def write(self, payload, count):
+        self.writer.write(payload.encode('utf-8'))
+        await self.writer.drain()
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+class LocalObjectStore:
+    """Stand-in for a MinIO client that stores objects under a local directory"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def bucket_exists(self, bucket_name):
+        return (self.root / bucket_name).is_dir()
+
+    def make_bucket(self, bucket_name):
+        (self.root / bucket_name).mkdir(parents=True, exist_ok=True)
+
+    def put_object(self, bucket_name, object_name, data, length, content_type=None):
+        path = self.root / bucket_name / object_name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data.read(length))
+
+
+class ObjectStoreSink:
+    """Upload JSON lines to a MinIO bucket as one object per ``object_events`` events"""
+
+    def __init__(self, client, bucket=TELEMETRY_BUCKET, prefix='industrial', object_events=DEFAULT_OBJECT_EVENTS):
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+        self.object_events = object_events
+        self._buffer = []
+        self._buffered_events = 0
+        self._object_counter = 0
+
+    async def open(self):
+        if not await asyncio.to_thread(self.client.bucket_exists, self.bucket):
+            await asyncio.to_thread(self.client.make_bucket, self.bucket)
+
+    async def write(self, payload, count):
+        self._buffer.append(payload)
+        self._buffered_events += count
+        if self._buffered_events >= self.object_events:
+            await self.flush()
+
+    async def flush(self):
+        """Upload the buffered lines as one object; uploads run in a thread so the stream keeps going"""
+        if not self._buffer:
+            return
+        data = ''.join(self._buffer).encode('utf-8')
+        self._object_counter += 1
+        object_name = f"{self.prefix}/{datetime.now():%Y%m%dT%H%M%S}-{self._object_counter:06d}.jsonl"
+        await asyncio.to_thread(
+            self.client.put_object, self.bucket, object_name, BytesIO(data), len(data),
+            content_type='application/x-ndjson'
+        )
+        self._buffer = []
+        self._buffered_events = 0
+
+    async def close(self):
+        await self.flush()
+
+
+def open_sink(spec, object_events=DEFAULT_OBJECT_EVENTS):
+    """Create a sink from a spec: stdout, file:PATH, tcp:HOST:PORT, unix:PATH, minio:BUCKET or local-minio:DIR"""
+    kind, _, target = spec.partition(':')
+    if kind in ('stdout', '-'):
+        return StdoutSink()
+    if kind == 'file':
+        return FileSink(target)
+    if kind == 'tcp':
+        host, _, port = target.rpartition(':')
+        return SocketSink(host=host or 'localhost', port=int(port))
+    if kind == 'unix':
+        return SocketSink(path=target)
+    if kind == 'minio':
+        if not MINIO_AVAILABLE:
+            raise RuntimeError("minio is not installed; use local-minio:DIR for a local stand-in")
+        client = Minio(
+            os.environ.get("MINIO_ENDPOINT", "http://minio:9000").replace("http://", ""),
+            access_key=os.environ.get("MINIO_ACCESS_KEY", "minioadmin"),
+            secret_key=os.environ.get("MINIO_SECRET_KEY", "minioadmin"),
+            secure=False
+        )
+        return ObjectStoreSink(client, bucket=target or TELEMETRY_BUCKET, object_events=object_events)
+    if kind == 'local-minio':
+        return ObjectStoreSink(LocalObjectStore(target or 'minio_data'), object_events=object_events)
+    raise ValueError(f"Unsupported sink: {spec}")
+
+
+class StreamMetrics:
+    """Running counts, throughput and sink latency for a stream"""
+
+    def __init__(self, target_rate, queue_size):
+        self.target_rate = target_rate
+        self.queue_size = queue_size
+        self.started = None
+        self.events = 0
+        self.bytes = 0
+        self.max_queue_depth = 0
+        self.seconds_behind = 0.0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self._last_report = (0.0, 0)
+
+    def start(self, now):
+        self.started = now
+        self._last_report = (now, 0)
+
+    def record_batch(self, count, num_bytes, latency, queue_depth):
+        self.events += count
+        self.bytes += num_bytes
+        self.latencies.append(latency)
+        self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+
+    def record_lag(self, seconds):
+        """Time the generator started a batch late because the sink held it back"""
+        self.seconds_behind += seconds
+
+    def snapshot(self, now):
+        """Totals so far, with the rate since the previous snapshot"""
+        elapsed = max(now - self.started, 1e-9)
+        last_time, last_events = self._last_report
+        window = max(now - last_time, 1e-9)
+        self._last_report = (now, self.events)
+        latencies = np.array(self.latencies) * 1000 if self.latencies else np.zeros(1)
+        return {
+            'events': self.events,
+            'elapsed_seconds': elapsed,
+            'rate': self.events / elapsed,
+            'window_rate': (self.events - last_events) / window,
+            'target_rate': self.target_rate,
+            'megabytes_per_second': self.bytes / elapsed / 1024 ** 2,
+            'latency_ms_p50': float(np.percentile(latencies, 50)),
+            'latency_ms_p95': float(np.percentile(latencies, 95)),
+            'latency_ms_p99': float(np.percentile(latencies, 99)),
+            'latency_ms_max': float(latencies.max()),
+            'max_queue_depth': self.max_queue_depth,
+            'seconds_behind': self.seconds_behind
+        }
+
+
+def format_metrics(metrics):
+    """One-line summary of a metrics snapshot"""
+    return (f"{metrics['events']:,} events in {metrics['elapsed_seconds']:.1f}s, "
+            f"{metrics['window_rate']:,.0f}/s now, {metrics['rate']:,.0f}/s overall "
+            f"(target {metrics['target_rate']:,.0f}/s), {metrics['megabytes_per_second']:.2f} MB/s, "
+            f"sink latency p50 {metrics['latency_ms_p50']:.1f} ms p99 {metrics['latency_ms_p99']:.1f} ms, "
+            f"queue peak {metrics['max_queue_depth']}, behind schedule {metrics['seconds_behind']:.1f}s")
+
+
+class TelemetryStream:
+    """Emit operational readings for existing assets as a paced stream of JSON lines
+
+    Readings follow the same per-asset baselines and daily/seasonal patterns as
+    IndustrialIoTGenerator.generate_operational_data. In accelerated time every
+    sweep over the assets advances the simulated clock by one hour, as in the
+    batch data; in real time readings are stamped with the wall clock.
+    """
+
+    def __init__(self, generator, sectors=None, rate=1000.0, realtime=False, start=None,
+                 batch_size=None, queue_size=DEFAULT_QUEUE_BATCHES):
+        self.generator = generator
+        self.rate = float(rate)
+        self.realtime = realtime
+        self.batch_size = batch_size or max(1, int(round(self.rate / TICKS_PER_SECOND)))
+        self.queue_size = queue_size
+
+        self.assets = self._load_assets(sectors or list(generator.config['sectors']))
+        if self.assets.empty:
+            raise ValueError("No assets to stream")
+
+        # Baselines are drawn once per asset so each asset's readings stay consistent
+        generator.seed_shard('telemetry_stream')
+        self.baselines = generator._draw_asset_baselines(len(self.assets))
+        self.asset_ids = self.assets['asset_id'].to_numpy()
+        self.sectors = self.assets['sector'].to_numpy()
+
+        self.clock = pd.Timestamp(start or datetime.now()).floor('h')
+        self.position = 0
+
+    def _load_assets(self, sectors):
+        """Reuse each sector's generated assets, generating them first if there are none yet"""
+        frames = []
+        for sector in sectors:
+            if (self.generator.output_dir / f'{sector}_assets.csv').exists():
+                assets_df = self.generator._load_assets(sector)
+            else:
+                assets_df = self.generator.generate_asset_master_data(sector)
+            frames.append(assets_df[['asset_id']].assign(sector=sector))
+        return pd.concat(frames, ignore_index=True)
+
+    def next_batch(self, size=None):
+        """Generate the next batch of readings as JSON lines"""
+        size = size or self.batch_size
+        num_assets = len(self.asset_ids)
+        sequence = self.position + np.arange(size)
+        self.position += size
+        asset_index = sequence % num_assets
+
+        if self.realtime:
+            timestamps = pd.DatetimeIndex(np.full(size, np.datetime64(datetime.now(), 'ms')))
+        else:
+            timestamps = self.clock + pd.to_timedelta(sequence // num_assets, unit='h')
+        hour_factor, season_factor = self.generator._daily_patterns(timestamps)
+        readings = self.generator._generate_asset_readings(
+            hour_factor, season_factor,
+            baselines={name: values[asset_index] for name, values in self.baselines.items()}
+        )
+
+        batch = pd.DataFrame({
+            'asset_id': self.asset_ids[asset_index],
+            'sector': self.sectors[asset_index],
+            'timestamp': timestamps,
+            **readings
+        }, columns=['sector'] + OPERATIONAL_COLUMNS)
+        payload = batch.to_json(orient='records', lines=True, date_format='iso', date_unit='ms')
+        # Older pandas versions leave off the final newline
+        return payload if payload.endswith('\n') else payload + '\n'
+
+    async def _produce(self, queue, metrics, max_events, stop):
+        """Generate batches on schedule; a full queue holds the generator back"""
+        loop = asyncio.get_running_loop()
+        interval = self.batch_size / self.rate
+        next_time = loop.time()
+        emitted = 0
+        while not stop.is_set() and (max_events is None or emitted < max_events):
+            count = self.batch_size if max_events is None else min(self.batch_size, max_events - emitted)
+            payload = self.next_batch(count)
+
+            delay = next_time - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                # Running late; restart the schedule rather than bursting to catch up
+                metrics.record_lag(-delay)
+                next_time = loop.time()
+            await queue.put((next_time, count, payload))
+            next_time += interval
+            emitted += count
+        await queue.put(None)
+
+    async def _consume(self, queue, sink, metrics):
+        """Write batches to the sink and record how long each took from its scheduled time"""
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            scheduled, count, payload = item
+            await sink.write(payload, count)
+            metrics.record_batch(count, len(payload), loop.time() - scheduled, queue.qsize())
+
+    async def _report(self, metrics, interval):
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(interval)
+            print(format_metrics(metrics.snapshot(loop.time())), file=sys.stderr)
+
+    async def run(self, sink, duration=None, max_events=None, report_interval=5.0):
+        """Stream to a sink until the duration or event count is reached; returns final metrics"""
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        metrics = StreamMetrics(self.rate, self.queue_size)
+        stop = asyncio.Event()
+
+        await sink.open()
+        metrics.start(loop.time())
+        producer = asyncio.create_task(self._produce(queue, metrics, max_events, stop))
+        consumer = asyncio.create_task(self._consume(queue, sink, metrics))
+        reporter = asyncio.create_task(self._report(metrics, report_interval)) if report_interval else None
+        if duration is not None:
+            loop.call_later(duration, stop.set)
+
+        try:
+            await asyncio.gather(producer, consumer)
+        finally:
+            stop.set()
+            producer.cancel()
+            consumer.cancel()
+            if reporter is not None:
+                reporter.cancel()
+            await sink.close()
+        return metrics.snapshot(loop.time())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stream live industrial IoT telemetry")
+    parser.add_argument('--sink', default='stdout',
+                        help="stdout, file:PATH, tcp:HOST:PORT, unix:PATH, minio:BUCKET or local-minio:DIR")
+    parser.add_argument('--rate', type=float, default=1000.0, help="Events per second")
+    parser.add_argument('--realtime', action='store_true',
+                        help="Stamp readings with the wall clock instead of one simulated hour per sweep")
+    parser.add_argument('--start', help="Start of the simulated clock, e.g. 2024-01-01T00:00")
+    parser.add_argument('--sectors', nargs='+', help="Sectors to stream; defaults to all")
+    parser.add_argument('--duration', type=float, help="Seconds to stream for")
+    parser.add_argument('--max-events', type=int, help="Stop after this many events")
+    parser.add_argument('--batch-size', type=int, help="Events per batch; defaults to rate / 100")
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_BATCHES, help="Batches buffered before the generator waits")
+    parser.add_argument('--object-events', type=int, default=DEFAULT_OBJECT_EVENTS, help="Events per object for MinIO sinks")
+    parser.add_argument('--report-interval', type=float, default=5.0, help="Seconds between metrics reports on stderr")
+    parser.add_argument('--seed', type=int, default=RANDOM_SEED, help="Master random seed")
+    parser.add_argument('--scale', type=float, default=1.0, help="Multiplier for the number of assets, if they are generated")
+    args = parser.parse_args()
+
+    generator = IndustrialIoTGenerator(seed=args.seed, scale=args.scale)
+    stream = TelemetryStream(
+        generator,
+        sectors=args.sectors,
+        rate=args.rate,
+        realtime=args.realtime,
+        start=args.start,
+        batch_size=args.batch_size,
+        queue_size=args.queue_size
+    )
+    if not args.realtime:
+        speedup = args.rate * 3600 / len(stream.asset_ids)
+        print(f"Streaming {len(stream.asset_ids)} assets at {args.rate:,.0f} events/s "
+              f"({speedup:,.0f}x real time)", file=sys.stderr)
+    try:
+        summary = asyncio.run(stream.run(
+            open_sink(args.sink, object_events=args.object_events),
+            duration=args.duration,
+            max_events=args.max_events,
+            report_interval=args.report_interval
+        ))
+        print(format_metrics(summary), file=sys.stderr)
+    except KeyboardInterrupt:
+        pass
@@ -1,8 +1,11 @@
 import pandas as pd
 import os
-import uuid
+from id_factory import IdFactory
 import numpy as np
 
+# Seed for the ID factory, so every run issues the same IDs
+RANDOM_SEED = 42
+
 # Define standard market sectors
 SECTORS = [
     'Technology',
@@ -22,7 +25,7 @@ SECTORS = [
 df = pd.read_csv('cleaned_data/financial_data/sector_performance.csv')
 
 # Generate sector IDs
-df['sector_id'] = [f'SECT_{str(uuid.uuid4())[:8]}' for _ in range(len(df))]
+df['sector_id'] = IdFactory(RANDOM_SEED).sequential('SECT_', len(df))
 
 # Convert dates to YYYY-MM-DD format
 df['transaction_date'] = pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d')
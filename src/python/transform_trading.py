@@ -1,12 +1,15 @@
 import pandas as pd
 import os
-import uuid
+from id_factory import IdFactory
+
+# Seed for the ID factory, so every run issues the same IDs
+RANDOM_SEED = 42
 
 # Read the original CSV file
 df = pd.read_csv('cleaned_data/financial_data/trading_activity.csv')
 
 # Generate transaction IDs
-df['transaction_id'] = [f'TRANS_{str(uuid.uuid4())[:8]}' for _ in range(len(df))]
+df['transaction_id'] = IdFactory(RANDOM_SEED).sequential('TRANS_', len(df))
 
 # Convert dates to YYYY-MM-DD format
 df['transaction_date'] = pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d')
@@ -1,13 +1,16 @@
 import pandas as pd
 import os
-import uuid
+from id_factory import IdFactory
+
+# Seed for the ID factory, so every run issues the same IDs
+RANDOM_SEED = 42
 
 # Read the original CSV file
 df = pd.read_csv('cleaned_data/industrial_data/water_utilities_work_orders.csv')
 
 # Generate work order IDs if not present
 if 'work_order_id' not in df.columns:
-    df['work_order_id'] = [f'WO_{str(uuid.uuid4())[:8]}' for _ in range(len(df))]
+    df['work_order_id'] = IdFactory(RANDOM_SEED).sequential('WO_', len(df))
 
 # Convert dates to YYYY-MM-DD format
 if 'creation_date' in df.columns:
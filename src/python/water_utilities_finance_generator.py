@@ -1,211 +1,348 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import random
 from pathlib import Path
 import json
 from scipy import stats
-import yaml
+import argparse
+from sharding import ShardedGeneratorMixin
+from incremental import Checkpoint, shard_key, step_dates
+from multi_utility import MultiUtilityMixin
+from schemas import apply_schema
+from generator_config import load_config
 
-# Set random seeds for reproducibility
+# Master seed for reproducibility; each table shard derives its own seed from it
 RANDOM_SEED = 42
-np.random.seed(RANDOM_SEED)
-random.seed(RANDOM_SEED)
 
-class WaterUtilitiesFinanceGenerator:
-    def __init__(self):
+# Settings finance_config.yaml must define, checked once when the file is first loaded
+CONFIG_REQUIRED = (
+    'revenue.components.water_sales.seasonal_factors',
+    'revenue.components.wastewater_charges.seasonal_factors',
+    'revenue.components.connection_fees.base_percentage',
+    'transactions.types.*.category',
+    'transactions.types.*.descriptions',
+    'budget.allocations',
+    'budget.status_options',
+    'financial_metrics',
+    'payment_methods',
+    'transaction_status',
+    'budget_notes'
+)
+CONFIG_RANGES = (
+    'revenue.components.connection_fees.variation_range',
+    'costs.components.*.percentage_range',
+    'transactions.daily_range',
+    'budget.base_range'
+)
+
+class WaterUtilitiesFinanceGenerator(MultiUtilityMixin, ShardedGeneratorMixin):
+    def __init__(self, seed=RANDOM_SEED, scale=1.0, num_utilities=1, file_format='parquet'):
         self.start_date = datetime(2019, 1, 1)
         self.end_date = datetime.now()
+        self.scale = scale
+        # More than one utility writes datasets partitioned by utility_id in this format
+        self.num_utilities = num_utilities
+        self.file_format = file_format
+        
+        # Per-instance random sources (self.random, self.rng, self.fake, self.fake_pool)
+        self.init_random_state(seed)
         
         # Create output directory
         self.output_dir = Path('water_utilities_finance')
         self.output_dir.mkdir(exist_ok=True)
         
-        # Load configuration
+        # Load configuration, resolved once into flat parameter arrays
         self.config = self._load_config()
+        self.params = self._resolve_params()
         
         # Initialize counters
         self.transaction_counter = 0
         self.budget_counter = 0
     
     def _load_config(self):
-        """Load configuration from YAML file"""
-        with open('finance_config.yaml', 'r') as f:
-            return yaml.safe_load(f)
-        
-    def generate_financial_statements(self):
-        """Generate monthly financial statements"""
-        financial_data = []
-        
-        # Generate monthly records from 2019 to present
-        current_date = self.start_date
-        while current_date <= self.end_date:
-            # Generate base revenue with seasonal variations
-            base_revenue = random.uniform(5000000, 8000000)
-            season_factor = 1.0
-            if current_date.month in [6, 7, 8]:  # Summer
-                season_factor = self.config['revenue']['components']['water_sales']['seasonal_factors']['summer']
-            elif current_date.month in [12, 1, 2]:  # Winter
-                season_factor = self.config['revenue']['components']['water_sales']['seasonal_factors']['winter']
-            
-            # Calculate revenue components using config
-            water_sales = base_revenue * self.config['revenue']['components']['water_sales']['base_percentage'] * season_factor
-            wastewater_charges = base_revenue * self.config['revenue']['components']['wastewater_charges']['base_percentage'] * season_factor
-            connection_fees = base_revenue * self.config['revenue']['components']['connection_fees']['base_percentage'] * random.uniform(*self.config['revenue']['components']['connection_fees']['variation_range'])
-            
-            # Calculate operating costs using config
-            labor_costs = base_revenue * random.uniform(*self.config['costs']['components']['labor']['percentage_range'])
-            materials_costs = base_revenue * random.uniform(*self.config['costs']['components']['materials']['percentage_range'])
-            energy_costs = base_revenue * random.uniform(*self.config['costs']['components']['energy']['percentage_range'])
-            maintenance_costs = base_revenue * random.uniform(*self.config['costs']['components']['maintenance']['percentage_range'])
-            other_costs = base_revenue * random.uniform(*self.config['costs']['components']['other']['percentage_range'])
-            
-            # Calculate financial metrics
-            total_revenue = water_sales + wastewater_charges + connection_fees
-            total_costs = labor_costs + materials_costs + energy_costs + maintenance_costs + other_costs
-            operating_income = total_revenue - total_costs
-            net_income = operating_income * random.uniform(0.7, 0.9)  # After taxes and other expenses
-            
-            # Generate financial record
-            financial_record = {
-                'period': current_date.strftime('%Y-%m'),
-                'year': current_date.year,
-                'month': current_date.month,
-                'water_sales': round(water_sales, 2),
-                'wastewater_charges': round(wastewater_charges, 2),
-                'connection_fees': round(connection_fees, 2),
-                'total_revenue': round(total_revenue, 2),
-                'labor_costs': round(labor_costs, 2),
-                'materials_costs': round(materials_costs, 2),
-                'energy_costs': round(energy_costs, 2),
-                'maintenance_costs': round(maintenance_costs, 2),
-                'other_costs': round(other_costs, 2),
-                'total_costs': round(total_costs, 2),
-                'operating_income': round(operating_income, 2),
-                'net_income': round(net_income, 2),
-                'operating_margin': round(operating_income / total_revenue * 100, 2),
-                'net_margin': round(net_income / total_revenue * 100, 2),
-                'revenue_growth': round(random.uniform(*self.config['financial_metrics']['revenue_growth']['range']), 2),
-                'cost_efficiency': round(random.uniform(*self.config['financial_metrics']['cost_efficiency']['range']), 2),
-                'water_loss_percentage': round(random.uniform(*self.config['financial_metrics']['water_loss_percentage']['range']), 2),
-                'energy_efficiency': round(random.uniform(*self.config['financial_metrics']['energy_efficiency']['range']), 2)
+        """Load the validated configuration, parsed once per version of the YAML file"""
+        return load_config('finance_config.yaml', required=CONFIG_REQUIRED, ranges=CONFIG_RANGES)
+        
+    def _resolve_params(self):
+        """Flatten the nested config into the arrays the vectorized generators index into"""
+        revenue = self.config.lookup('revenue.components')
+        costs = self.config.lookup('costs.components')
+        # Metrics with a calculation are derived from the statement; the rest are drawn from a range
+        metrics = {
+            name: metric for name, metric in self.config['financial_metrics'].items()
+            if 'calculation' not in metric
+        }
+        transaction_types = self.config.lookup('transactions.types')
+        
+        # Seasonal factor per calendar month: summer is June-August, winter December-February
+        def monthly_factors(seasonal_factors):
+            factors = np.ones(12)
+            factors[[5, 6, 7]] = seasonal_factors['summer']
+            factors[[11, 0, 1]] = seasonal_factors['winter']
+            return factors
+        
+        # Descriptions of every transaction type in one list, indexed by offset and count per type
+        descriptions = [config['descriptions'] for config in transaction_types.values()]
+        description_counts = np.array([len(d) for d in descriptions])
+        flat_descriptions = [d for type_descriptions in descriptions for d in type_descriptions]
+        unique_descriptions = list(dict.fromkeys(flat_descriptions))
+        
+        return {
+            'water_sales_share': revenue['water_sales']['base_percentage'],
+            'water_sales_season': monthly_factors(revenue['water_sales']['seasonal_factors']),
+            'wastewater_share': revenue['wastewater_charges']['base_percentage'],
+            'wastewater_season': monthly_factors(revenue['wastewater_charges']['seasonal_factors']),
+            'connection_fee_share': revenue['connection_fees']['base_percentage'],
+            'connection_fee_range': revenue['connection_fees']['variation_range'],
+            'cost_names': list(costs),
+            'cost_ranges': self.config.array('costs.components', 'percentage_range'),
+            'metric_names': list(metrics),
+            'metric_ranges': np.array([metrics[name]['range'] for name in metrics]),
+            'daily_range': self.config.lookup('transactions.daily_range'),
+            'transaction_types': list(transaction_types),
+            'transaction_categories': self.config.array('transactions.types', 'category'),
+            'inflow_types': np.isin(list(transaction_types), ['Customer Payment', 'Service Fee']),
+            'description_offsets': np.cumsum(description_counts) - description_counts,
+            'description_counts': description_counts,
+            'description_codes': np.array([unique_descriptions.index(d) for d in flat_descriptions]),
+            'descriptions': unique_descriptions,
+            'payment_methods': self.config['payment_methods'],
+            'transaction_status': self.config['transaction_status']
+        }
+    
+    def apply_utility_profile(self, rng):
+        """Draw a utility's own seasonality and cost structure around the configured ones"""
+        params = dict(self.params)
+        amplitude = rng.uniform(0.5, 1.5)
+        params['water_sales_season'] = 1 + (params['water_sales_season'] - 1) * amplitude
+        params['wastewater_season'] = 1 + (params['wastewater_season'] - 1) * amplitude
+        params['cost_ranges'] = params['cost_ranges'] * rng.uniform(0.9, 1.1, size=(len(params['cost_ranges']), 1))
+        self.params = params
+    
+    def estimate_rows(self):
+        """Expected rows per output table at the current scale, without generating anything"""
+        num_days = (self.end_date - self.start_date).days + 1
+        daily_range = self.config.lookup('transactions.daily_range')
+        if self.num_utilities == 1:
+            return {
+                'financial_statements.csv': (num_days - 1) // 30 + 1,
+                'budgets.csv': self.end_date.year - self.start_date.year + 1,
+                'cash_flow.csv': num_days * self.expected_scaled_count(*daily_range)
             }
-            
-            financial_data.append(financial_record)
-            current_date += timedelta(days=30)  # Move to next month
+        return {
+            'financial_statements': ((num_days - 1) // 30 + 1) * self.num_utilities,
+            'budgets': (self.end_date.year - self.start_date.year + 1) * self.num_utilities,
+            'cash_flow': num_days * sum(
+                self.expected_scaled_count(*daily_range, factor=self.draw_utility_size(utility_id))
+                for utility_id in self.utility_ids
+            )
+        }
+    
+    def generate_financial_statements(self, since=None):
+        """Generate monthly financial statements, only those after ``since`` if given"""
+        params = self.params
+        
+        # Monthly records from 2019 to present, all drawn at once
+        dates = pd.DatetimeIndex(step_dates(self.start_date, self.end_date, 30, after=since))
+        n = len(dates)
+        month_index = dates.month.to_numpy() - 1
         
-        df = pd.DataFrame(financial_data)
-        df.to_csv(self.output_dir / 'financial_statements.csv', index=False)
+        # Base revenue with seasonal variations
+        base_revenue = self.rng.uniform(5000000, 8000000, size=n) * self.utility_size
+        water_sales = base_revenue * params['water_sales_share'] * params['water_sales_season'][month_index]
+        wastewater_charges = base_revenue * params['wastewater_share'] * params['wastewater_season'][month_index]
+        connection_fees = base_revenue * params['connection_fee_share'] * self.rng.uniform(*params['connection_fee_range'], size=n)
+        
+        # Operating costs, one column per cost component
+        cost_ranges = params['cost_ranges']
+        costs = base_revenue[:, None] * self.rng.uniform(cost_ranges[:, 0], cost_ranges[:, 1], size=(n, len(cost_ranges)))
+        
+        # Calculate financial metrics
+        total_revenue = water_sales + wastewater_charges + connection_fees
+        total_costs = costs.sum(axis=1)
+        operating_income = total_revenue - total_costs
+        net_income = operating_income * self.rng.uniform(0.7, 0.9, size=n)  # After taxes and other expenses
+        
+        financial_data = {
+            'period': dates.strftime('%Y-%m'),
+            'year': dates.year,
+            'month': dates.month,
+            'water_sales': water_sales,
+            'wastewater_charges': wastewater_charges,
+            'connection_fees': connection_fees,
+            'total_revenue': total_revenue
+        }
+        for position, name in enumerate(params['cost_names']):
+            financial_data[f'{name}_costs'] = costs[:, position]
+        financial_data.update({
+            'total_costs': total_costs,
+            'operating_income': operating_income,
+            'net_income': net_income,
+            'operating_margin': operating_income / total_revenue * 100,
+            'net_margin': net_income / total_revenue * 100
+        })
+        metric_ranges = params['metric_ranges']
+        metrics = self.rng.uniform(metric_ranges[:, 0], metric_ranges[:, 1], size=(n, len(metric_ranges)))
+        for position, name in enumerate(params['metric_names']):
+            financial_data[name] = metrics[:, position]
+        
+        df = apply_schema(pd.DataFrame(financial_data).round(2), 'financial_statements')
+        self.write_output(df, 'financial_statements', since)
         return df
     
-    def generate_budgets(self):
-        """Generate annual budgets and forecasts"""
+    def generate_budgets(self, since=None):
+        """Generate annual budgets and forecasts, only for years after ``since`` if given"""
         budget_data = []
         
         # Generate annual budgets from 2019 to present
-        for year in range(self.start_date.year, self.end_date.year + 1):
+        first_year = self.start_date.year if since is None else since.year + 1
+        base_range = self.config.lookup('budget.base_range')
+        allocations = self.config.lookup('budget.allocations')
+        for year in range(first_year, self.end_date.year + 1):
             # Generate base budget using config
-            base_budget = random.uniform(*self.config['budget']['base_range'])
+            base_budget = self.random.uniform(*base_range) * self.utility_size
             
             # Generate budget components using config
             budget_record = {
                 'year': year,
-                'budget_id': f"BUD-{year}-{random.randint(1000, 9999)}",
+                'budget_id': f"BUD-{year}-{self.random.randint(1000, 9999)}",
                 'total_budget': round(base_budget, 2),
-                'operational_budget': round(base_budget * self.config['budget']['allocations']['operational'], 2),
-                'capital_budget': round(base_budget * self.config['budget']['allocations']['capital'], 2),
-                'maintenance_budget': round(base_budget * self.config['budget']['allocations']['maintenance'], 2),
-                'labor_budget': round(base_budget * self.config['budget']['allocations']['labor'], 2),
-                'materials_budget': round(base_budget * self.config['budget']['allocations']['materials'], 2),
-                'energy_budget': round(base_budget * self.config['budget']['allocations']['energy'], 2),
-                'technology_budget': round(base_budget * self.config['budget']['allocations']['technology'], 2),
-                'safety_budget': round(base_budget * self.config['budget']['allocations']['safety'], 2),
-                'training_budget': round(base_budget * self.config['budget']['allocations']['training'], 2),
-                'contingency_budget': round(base_budget * self.config['budget']['allocations']['contingency'], 2),
-                'status': random.choice(self.config['budget']['status_options']),
-                'approved_by': f"DIR-{random.randint(1000, 9999)}",
-                'approval_date': datetime(year, random.randint(1, 12), random.randint(1, 28)),
-                'budget_notes': json.dumps(random.sample(self.config['budget_notes'], k=random.randint(3, 5)))
+                'operational_budget': round(base_budget * allocations['operational'], 2),
+                'capital_budget': round(base_budget * allocations['capital'], 2),
+                'maintenance_budget': round(base_budget * allocations['maintenance'], 2),
+                'labor_budget': round(base_budget * allocations['labor'], 2),
+                'materials_budget': round(base_budget * allocations['materials'], 2),
+                'energy_budget': round(base_budget * allocations['energy'], 2),
+                'technology_budget': round(base_budget * allocations['technology'], 2),
+                'safety_budget': round(base_budget * allocations['safety'], 2),
+                'training_budget': round(base_budget * allocations['training'], 2),
+                'contingency_budget': round(base_budget * allocations['contingency'], 2),
+                'status': self.random.choice(self.config.lookup('budget.status_options')),
+                'approved_by': f"DIR-{self.random.randint(1000, 9999)}",
+                'approval_date': datetime(year, self.random.randint(1, 12), self.random.randint(1, 28)),
+                'budget_notes': json.dumps(self.random.sample(self.config.lookup('budget_notes'), k=self.random.randint(3, 5)))
             }
             
             budget_data.append(budget_record)
         
-        df = pd.DataFrame(budget_data)
-        df.to_csv(self.output_dir / 'budgets.csv', index=False)
+        df = apply_schema(pd.DataFrame(budget_data), 'budgets')
+        self.write_output(df, 'budgets', since)
         return df
     
-    def generate_cash_flow(self):
-        """Generate daily cash flow transactions"""
-        cash_flow_data = []
-        
-        # Generate daily transactions from 2019 to present
-        current_date = self.start_date
-        while current_date <= self.end_date:
-            # Generate multiple transactions per day using config
-            num_transactions = random.randint(*self.config['transactions']['daily_range'])
-            
-            for _ in range(num_transactions):
-                self.transaction_counter += 1
-                transaction_id = f"TRX-{self.transaction_counter:06d}"
-                
-                # Generate transaction data using config
-                amount = random.uniform(100, 100000)
-                transaction_type = random.choice(list(self.config['transactions']['types'].keys()))
-                transaction_config = self.config['transactions']['types'][transaction_type]
-                
-                # Determine if inflow or outflow
-                is_inflow = transaction_type in ['Customer Payment', 'Service Fee']
-                
-                transaction = {
-                    'transaction_id': transaction_id,
-                    'date': current_date,
-                    'transaction_type': transaction_type,
-                    'amount': round(amount, 2),
-                    'is_inflow': is_inflow,
-                    'payment_method': random.choice(self.config['payment_methods']),
-                    'status': random.choice(self.config['transaction_status']),
-                    'reference_number': f"REF-{random.randint(100000, 999999)}",
-                    'description': random.choice(transaction_config['descriptions']),
-                    'category': transaction_config['category']
-                }
-                
-                cash_flow_data.append(transaction)
-            
-            current_date += timedelta(days=1)
+    def generate_cash_flow(self, since=None):
+        """Generate daily cash flow transactions, only for days after ``since`` if given"""
+        params = self.params
+        
+        # Transactions per day for every day from 2019 to present, drawn at once
+        days = np.array(step_dates(self.start_date, self.end_date, 1, after=since), dtype='datetime64[us]')
+        low, high = params['daily_range']
+        daily_counts = self.rng.integers(low, high + 1, size=len(days))
+        daily_counts = np.maximum(1, np.rint(daily_counts * self.scale * self.utility_size)).astype(np.int64)
+        n = int(daily_counts.sum())
         
-        df = pd.DataFrame(cash_flow_data)
-        df.to_csv(self.output_dir / 'cash_flow.csv', index=False)
+        transaction_numbers = np.arange(self.transaction_counter + 1, self.transaction_counter + n + 1)
+        self.transaction_counter += n
+        
+        # Each transaction's description is one of its type's descriptions
+        type_codes = self.rng.integers(0, len(params['transaction_types']), size=n)
+        picks = (self.rng.random(n) * params['description_counts'][type_codes]).astype(np.int64)
+        description_codes = params['description_codes'][params['description_offsets'][type_codes] + picks]
+        
+        cash_flow_data = {
+            'transaction_id': [f"TRX-{number:06d}" for number in transaction_numbers],
+            'date': np.repeat(days, daily_counts),
+            'transaction_type': pd.Categorical.from_codes(type_codes, params['transaction_types']),
+            'amount': self.rng.uniform(100, 100000, size=n).round(2),
+            'is_inflow': params['inflow_types'][type_codes],
+            'payment_method': pd.Categorical.from_codes(
+                self.rng.integers(0, len(params['payment_methods']), size=n), params['payment_methods']
+            ),
+            'status': pd.Categorical.from_codes(
+                self.rng.integers(0, len(params['transaction_status']), size=n), params['transaction_status']
+            ),
+            'reference_number': np.char.add('REF-', self.rng.integers(100000, 1000000, size=n).astype(str)),
+            'description': pd.Categorical.from_codes(description_codes, params['descriptions']),
+            'category': params['transaction_categories'][type_codes]
+        }
+        
+        df = apply_schema(pd.DataFrame(cash_flow_data), 'cash_flow')
+        self.write_output(df, 'cash_flow', since)
         return df
     
-    def generate_all_data(self):
-        """Generate all financial data"""
+    def generate_all_data(self, workers=1, incremental=False):
+        """Generate all financial data, one shard per table, or per table and utility
+
+        With ``incremental`` and a checkpoint from an earlier run, only rows after
+        each table's watermark are generated and appended to the existing files.
+        With more than one utility, each table is a dataset partitioned by utility_id.
+        """
+        tables = ['financial_statements', 'budgets', 'cash_flow']
+        checkpoint = Checkpoint(self.output_dir)
+        incremental = incremental and checkpoint.exists
+        since = {table: checkpoint.watermark(table) if incremental else None for table in tables}
+        
         print("\n=== Starting Water Utilities Finance Data Generation ===")
         print(f"Start Date: {self.start_date.strftime('%Y-%m-%d')}")
         print(f"End Date: {self.end_date.strftime('%Y-%m-%d')}")
-        print(f"Output Directory: {self.output_dir.absolute()}\n")
-        
-        print("1. Generating financial statements...")
-        financial_df = self.generate_financial_statements()
-        print(f"   ✓ Generated {len(financial_df)} monthly records")
-        print(f"   ✓ Saved to: {self.output_dir / 'financial_statements.csv'}")
+        print(f"Output Directory: {self.output_dir.absolute()}")
+        print(f"Utilities: {self.num_utilities}")
+        print(f"Workers: {workers}")
+        if incremental:
+            print("Incremental: appending rows after the last run's watermarks")
+        print()
         
-        print("\n2. Generating budgets...")
-        budget_df = self.generate_budgets()
-        print(f"   ✓ Generated {len(budget_df)} annual budgets")
-        print(f"   ✓ Saved to: {self.output_dir / 'budgets.csv'}")
+        print("Generating financial statements, budgets and cash flow transactions...")
+        if self.num_utilities > 1:
+            rows = self.run_utilities(
+                {
+                    'financial_statements': ('generate_financial_statements', None),
+                    'budgets': ('generate_budgets', None),
+                    'cash_flow': ('generate_cash_flow', 'transaction_counter')
+                },
+                checkpoint, incremental=incremental, workers=workers
+            )
+            outputs = {table: self.output_dir / table for table in tables}
+        else:
+            if since['cash_flow'] is not None:
+                self.transaction_counter = checkpoint.counter('cash_flow')
+            frames = self.run_shards(
+                [
+                    (shard_key(table, since=since[table]), f'generate_{table}', (since[table],))
+                    for table in tables
+                ],
+                workers=workers
+            )
+            rows = {table: len(df) for table, df in zip(tables, frames)}
+            outputs = {table: self.output_dir / f'{table}.csv' for table in tables}
+            for table in tables:
+                checkpoint.set_watermark(table, self.end_date)
+            checkpoint.set_counter('cash_flow', self.transaction_counter + rows['cash_flow'])
+        checkpoint.save()
         
-        print("\n3. Generating cash flow transactions...")
-        cash_flow_df = self.generate_cash_flow()
-        print(f"   ✓ Generated {len(cash_flow_df)} transactions")
-        print(f"   ✓ Saved to: {self.output_dir / 'cash_flow.csv'}")
+        print(f"1. ✓ Generated {rows['financial_statements']} monthly records")
+        print(f"   ✓ Saved to: {outputs['financial_statements']}")
+        print(f"2. ✓ Generated {rows['budgets']} annual budgets")
+        print(f"   ✓ Saved to: {outputs['budgets']}")
+        print(f"3. ✓ Generated {rows['cash_flow']} transactions")
+        print(f"   ✓ Saved to: {outputs['cash_flow']}")
         
         print("\n=== Data Generation Summary ===")
-        print(f"Total Financial Statements: {len(financial_df)}")
-        print(f"Total Budgets: {len(budget_df)}")
-        print(f"Total Transactions: {len(cash_flow_df)}")
+        print(f"Total Financial Statements: {rows['financial_statements']}")
+        print(f"Total Budgets: {rows['budgets']}")
+        print(f"Total Transactions: {rows['cash_flow']}")
         print(f"\nAll files have been saved to: {self.output_dir.absolute()}")
         print("=== Generation Complete ===\n")
 
 if __name__ == "__main__":
-    generator = WaterUtilitiesFinanceGenerator()
-    generator.generate_all_data() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Generate water utilities finance data")
+    parser.add_argument('--seed', type=int, default=RANDOM_SEED, help="Master random seed")
+    parser.add_argument('--workers', type=int, default=1, help="Worker processes, one table (and utility) per shard")
+    parser.add_argument('--scale', type=float, default=1.0, help="Multiplier for the number of daily transactions")
+    parser.add_argument('--incremental', action='store_true', help="Append only rows after the last run's watermarks")
+    parser.add_argument('--utilities', type=int, default=1, help="Number of utilities; more than one writes datasets partitioned by utility_id")
+    parser.add_argument('--format', choices=['parquet', 'csv'], default='parquet', help="File format of utility partitions")
+    args = parser.parse_args()
+    
+    generator = WaterUtilitiesFinanceGenerator(seed=args.seed, scale=args.scale, num_utilities=args.utilities,
+                                               file_format=args.format)
+    generator.generate_all_data(workers=args.workers, incremental=args.incremental)
@@ -1,20 +1,147 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import random
 from pathlib import Path
 import json
 from scipy import stats
+import argparse
+from sharding import ShardedGeneratorMixin
+from incremental import Checkpoint, shard_key, step_dates
+from multi_utility import MultiUtilityMixin
+from schemas import apply_schema
 
-# Set random seeds for reproducibility
+# Master seed for reproducibility; each table shard derives its own seed from it
 RANDOM_SEED = 42
-np.random.seed(RANDOM_SEED)
-random.seed(RANDOM_SEED)
 
-class WaterUtilitiesMetricsGenerator:
-    def __init__(self):
+# Ofwat performance measures and the range of their base scores
+OFWAT_SCORE_RANGES = {
+    'water_quality': (0.85, 0.98),
+    'customer_service': (0.80, 0.95),
+    'leakage_reduction': (0.75, 0.90),
+    'water_efficiency': (0.80, 0.95),
+    'environmental_impact': (0.85, 0.98),
+    'operational_efficiency': (0.80, 0.95)
+}
+
+# Overall score thresholds of the Ofwat performance ratings, best first
+PERFORMANCE_RATINGS = [(0.95, 'Outstanding'), (0.90, 'Good'), (0.85, 'Requires Improvement')]
+
+CAPEX_PROJECT_TYPES = [
+    'Infrastructure Upgrade',
+    'Treatment Plant Modernization',
+    'Distribution Network Improvement',
+    'Technology Implementation',
+    'Facility Expansion',
+    'Environmental Compliance',
+    'Safety Enhancement',
+    'Automation Project'
+]
+
+DEPARTMENTS = ['Operations', 'Maintenance', 'Safety', 'HR', 'Logistics', 'Training', 'Quality Control']
+
+PULSE_MEASURES = [
+    'engagement', 'satisfaction', 'wellbeing', 'culture',
+    'leadership', 'development', 'work_life_balance', 'recognition'
+]
+
+# Text pools for the JSON list columns, each with the range of how many entries a row lists
+TEXT_POOLS = {
+    'key_achievements': ([
+        'Reduced water leakage by 15%',
+        'Improved customer satisfaction scores',
+        'Implemented new water treatment technology',
+        'Enhanced environmental protection measures',
+        'Optimized operational efficiency',
+        'Upgraded distribution network',
+        'Reduced energy consumption',
+        'Improved water quality metrics'
+    ], 3, 5),
+    'areas_for_improvement': ([
+        'Customer response times',
+        'Water pressure management',
+        'Infrastructure maintenance',
+        'Energy efficiency',
+        'Waste reduction',
+        'Employee training',
+        'Digital transformation',
+        'Environmental impact'
+    ], 2, 4),
+    'benefits_realized': ([
+        'Improved operational efficiency',
+        'Enhanced safety measures',
+        'Reduced maintenance costs',
+        'Better environmental compliance',
+        'Increased capacity',
+        'Improved customer service',
+        'Cost savings',
+        'Technology advancement'
+    ], 3, 5),
+    'key_milestones': ([
+        'Project planning completed',
+        'Design phase completed',
+        'Equipment procurement',
+        'Installation completed',
+        'Testing phase',
+        'Staff training',
+        'Commissioning',
+        'Project handover'
+    ], 4, 6),
+    'stakeholders': ([
+        'Operations Team',
+        'Maintenance Team',
+        'Safety Department',
+        'Environmental Team',
+        'Customer Service',
+        'Regulatory Bodies',
+        'Local Community',
+        'Contractors'
+    ], 3, 5),
+    'key_findings': ([
+        'High employee engagement in safety initiatives',
+        'Strong team collaboration',
+        'Good work-life balance',
+        'Effective leadership communication',
+        'Opportunities for skill development',
+        'Positive workplace culture',
+        'Well-maintained facilities',
+        'Clear career progression paths'
+    ], 3, 5),
+    'action_items': ([
+        'Enhance training programs',
+        'Improve communication channels',
+        'Implement flexible working arrangements',
+        'Strengthen recognition programs',
+        'Develop leadership skills',
+        'Address workload concerns',
+        'Enhance workplace safety',
+        'Improve career development opportunities'
+    ], 2, 4),
+    'employee_feedback': ([
+        'Great team environment',
+        'Good work-life balance',
+        'Clear communication from management',
+        'Opportunities for growth',
+        'Strong safety culture',
+        'Well-organized workplace',
+        'Supportive colleagues',
+        'Challenging and rewarding work'
+    ], 4, 6)
+}
+
+class WaterUtilitiesMetricsGenerator(MultiUtilityMixin, ShardedGeneratorMixin):
+    def __init__(self, seed=RANDOM_SEED, scale=1.0, num_utilities=1, file_format='parquet',
+                 survey_interval_days=30):
         self.start_date = datetime(2019, 1, 1)
         self.end_date = datetime.now()
+        self.scale = scale
+        # More than one utility writes datasets partitioned by utility_id in this format
+        self.num_utilities = num_utilities
+        self.file_format = file_format
+        # Days between pulse surveys; 1 surveys every department daily
+        self.survey_interval_days = survey_interval_days
+        
+        # Per-instance random sources (self.random, self.rng, self.fake, self.fake_pool)
+        self.init_random_state(seed)
         
         # Create output directory
         self.output_dir = Path('water_utilities_metrics')
@@ -24,347 +151,261 @@ class WaterUtilitiesMetricsGenerator:
         self.capex_counter = 0
         self.pulse_survey_counter = 0
         
-    def generate_ofwat_results(self):
-        """Generate Ofwat performance results"""
-        ofwat_data = []
+        # How far a utility's performance and staff engagement sit from the typical scores
+        self.performance_offset = 0.0
+        self.engagement_offset = 0.0
+    
+    def apply_utility_profile(self, rng):
+        """Draw a utility's own performance and engagement levels"""
+        self.performance_offset = rng.normal(0, 0.03)
+        self.engagement_offset = rng.normal(0, 0.04)
         
-        # Generate quarterly results from 2019 to present
-        current_date = self.start_date
-        while current_date <= self.end_date:
-            # Base performance scores with some randomness
-            base_scores = {
-                'water_quality': random.uniform(0.85, 0.98),
-                'customer_service': random.uniform(0.80, 0.95),
-                'leakage_reduction': random.uniform(0.75, 0.90),
-                'water_efficiency': random.uniform(0.80, 0.95),
-                'environmental_impact': random.uniform(0.85, 0.98),
-                'operational_efficiency': random.uniform(0.80, 0.95)
-            }
-            
-            # Add seasonal variations
-            season_factor = 1.0
-            if current_date.month in [6, 7, 8]:  # Summer
-                season_factor = 0.95
-            elif current_date.month in [12, 1, 2]:  # Winter
-                season_factor = 1.05
-            
-            # Calculate final scores
-            scores = {k: round(v * season_factor * random.uniform(0.95, 1.05), 3) 
-                     for k, v in base_scores.items()}
-            
-            # Generate Ofwat record
-            ofwat_record = {
-                'quarter': current_date.strftime('%Y-Q%q'),
-                'year': current_date.year,
-                'quarter_number': (current_date.month - 1) // 3 + 1,
-                'water_quality_score': scores['water_quality'],
-                'customer_service_score': scores['customer_service'],
-                'leakage_reduction_score': scores['leakage_reduction'],
-                'water_efficiency_score': scores['water_efficiency'],
-                'environmental_impact_score': scores['environmental_impact'],
-                'operational_efficiency_score': scores['operational_efficiency'],
-                'overall_performance_score': round(np.mean(list(scores.values())), 3),
-                'performance_rating': self._calculate_performance_rating(scores),
-                'key_achievements': json.dumps(self._generate_key_achievements()),
-                'areas_for_improvement': json.dumps(self._generate_improvement_areas()),
-                'regulatory_compliance': random.choice(['Compliant', 'Compliant', 'Compliant', 'Minor Issues']),
-                'financial_incentives_earned': round(random.uniform(100000, 500000), 2)
+    def estimate_rows(self):
+        """Expected rows per output table at the current scale, without generating anything"""
+        num_days = (self.end_date - self.start_date).days
+        num_months = num_days // 30 + 1
+        num_surveys = num_days // self.survey_interval_days + 1
+        if self.num_utilities == 1:
+            return {
+                'ofwat_results.csv': num_days // 90 + 1,
+                'capex_projects.csv': num_months * self.expected_scaled_count(1, 5),
+                'pulse_surveys.csv': num_surveys * len(DEPARTMENTS)
             }
-            
-            ofwat_data.append(ofwat_record)
-            current_date += timedelta(days=90)  # Move to next quarter
+        return {
+            'ofwat_results': (num_days // 90 + 1) * self.num_utilities,
+            'capex_projects': num_months * sum(
+                self.expected_scaled_count(1, 5, factor=self.draw_utility_size(utility_id))
+                for utility_id in self.utility_ids
+            ),
+            'pulse_surveys': num_surveys * len(DEPARTMENTS) * self.num_utilities
+        }
+    
+    def _season_factors(self, dates, summer, winter):
+        """Seasonal factor per date: summer is June-August, winter December-February"""
+        month = dates.month.to_numpy()
+        return np.select([np.isin(month, [6, 7, 8]), np.isin(month, [12, 1, 2])], [summer, winter], 1.0)
+    
+    def _sample_text_lists(self, pool, size):
+        """JSON lists of random.sample(items, k=low..high) for many rows, drawn from a text pool"""
+        items, low, high = TEXT_POOLS[pool]
         
-        df = pd.DataFrame(ofwat_data)
-        df.to_csv(self.output_dir / 'ofwat_results.csv', index=False)
-        return df
+        # Ordering random keys gives a uniform permutation per row; keep its first k entries
+        order = np.argsort(self.rng.random((size, len(items))), axis=1)[:, :high]
+        k = self.rng.integers(low, high + 1, size=size)
+        quoted = np.array([json.dumps(item) for item in items])
+        text = np.full(size, '[')
+        for position in range(high):
+            entry = quoted[order[:, position]]
+            if position > 0:
+                entry = np.char.add(', ', entry)
+            text = np.char.add(text, np.where(position < k, entry, ''))
+        return np.char.add(text, ']')
     
-    def generate_capex_data(self):
-        """Generate CAPEX (Capital Expenditure) data"""
-        capex_data = []
+    def generate_ofwat_results(self, since=None):
+        """Generate Ofwat performance results, only for quarters after ``since`` if given"""
+        # Quarterly results from 2019 to present, all drawn at once
+        dates = pd.DatetimeIndex(step_dates(self.start_date, self.end_date, 90, after=since))
+        n = len(dates)
+        quarter_number = (dates.month.to_numpy() - 1) // 3 + 1
         
-        # Generate monthly CAPEX records
-        current_date = self.start_date
-        while current_date <= self.end_date:
-            # Generate multiple CAPEX projects per month
-            num_projects = random.randint(1, 5)
-            
-            for _ in range(num_projects):
-                self.capex_counter += 1
-                project_id = f"CAPEX-{self.capex_counter:06d}"
-                
-                # Generate project data
-                project_type = random.choice([
-                    'Infrastructure Upgrade',
-                    'Treatment Plant Modernization',
-                    'Distribution Network Improvement',
-                    'Technology Implementation',
-                    'Facility Expansion',
-                    'Environmental Compliance',
-                    'Safety Enhancement',
-                    'Automation Project'
-                ])
-                
-                # Generate project timeline
-                start_date = current_date + timedelta(days=random.randint(0, 30))
-                duration_months = random.randint(3, 24)
-                end_date = start_date + timedelta(days=duration_months * 30)
-                
-                # Generate budget data
-                base_budget = random.uniform(100000, 5000000)
-                contingency = base_budget * random.uniform(0.05, 0.15)
-                total_budget = base_budget + contingency
-                
-                # Generate progress data
-                if end_date < self.end_date:
-                    progress = random.uniform(0.8, 1.0)
-                    actual_cost = total_budget * random.uniform(0.9, 1.1)
-                    status = random.choice(['Completed', 'Completed', 'Completed', 'On Track'])
-                else:
-                    progress = random.uniform(0.0, 0.8)
-                    actual_cost = total_budget * progress * random.uniform(0.9, 1.1)
-                    status = random.choice(['In Progress', 'On Track', 'Delayed'])
-                
-                capex_record = {
-                    'project_id': project_id,
-                    'project_name': f"{project_type} Project {self.capex_counter}",
-                    'project_type': project_type,
-                    'start_date': start_date,
-                    'planned_end_date': end_date,
-                    'actual_end_date': end_date if status == 'Completed' else None,
-                    'base_budget': round(base_budget, 2),
-                    'contingency_budget': round(contingency, 2),
-                    'total_budget': round(total_budget, 2),
-                    'actual_cost': round(actual_cost, 2),
-                    'progress_percentage': round(progress * 100, 2),
-                    'status': status,
-                    'priority': random.choice(['High', 'Medium', 'Low']),
-                    'risk_level': random.choice(['Low', 'Medium', 'High']),
-                    'benefits_realized': json.dumps(self._generate_project_benefits()),
-                    'key_milestones': json.dumps(self._generate_project_milestones()),
-                    'stakeholders': json.dumps(self._generate_stakeholders())
-                }
-                
-                capex_data.append(capex_record)
-            
-            current_date += timedelta(days=30)  # Move to next month
+        # Base scores per quarter and measure, with seasonal variation and noise
+        ranges = np.array(list(OFWAT_SCORE_RANGES.values()))
+        base_scores = self.rng.uniform(ranges[:, 0], ranges[:, 1], size=(n, len(ranges))) + self.performance_offset
+        season_factor = self._season_factors(dates, 0.95, 1.05)
+        scores = np.round(base_scores * season_factor[:, None] * self.rng.uniform(0.95, 1.05, size=base_scores.shape), 3)
+        overall_score = scores.mean(axis=1)
         
-        df = pd.DataFrame(capex_data)
-        df.to_csv(self.output_dir / 'capex_projects.csv', index=False)
+        ofwat_data = {
+            'quarter': [f"{year}-Q{quarter}" for year, quarter in zip(dates.year, quarter_number)],
+            'year': dates.year,
+            'quarter_number': quarter_number
+        }
+        for position, measure in enumerate(OFWAT_SCORE_RANGES):
+            ofwat_data[f'{measure}_score'] = scores[:, position]
+        ofwat_data.update({
+            'overall_performance_score': np.round(overall_score, 3),
+            'performance_rating': np.select(
+                [overall_score >= threshold for threshold, _ in PERFORMANCE_RATINGS],
+                [rating for _, rating in PERFORMANCE_RATINGS],
+                'Poor'
+            ),
+            'key_achievements': self._sample_text_lists('key_achievements', n),
+            'areas_for_improvement': self._sample_text_lists('areas_for_improvement', n),
+            'regulatory_compliance': np.where(self.rng.random(n) < 0.75, 'Compliant', 'Minor Issues'),
+            'financial_incentives_earned': self.rng.uniform(100000, 500000, size=n).round(2)
+        })
+        
+        df = apply_schema(pd.DataFrame(ofwat_data), 'ofwat_results')
+        self.write_output(df, 'ofwat_results', since)
         return df
     
-    def generate_pulse_survey_data(self):
-        """Generate employee pulse survey data"""
-        pulse_data = []
+    def generate_capex_data(self, since=None):
+        """Generate CAPEX (Capital Expenditure) data, only for months after ``since`` if given"""
+        # Several projects start each month; draw every month's count, then all projects at once
+        months = np.array(step_dates(self.start_date, self.end_date, 30, after=since), dtype='datetime64[us]')
+        monthly_counts = self.rng.integers(1, 6, size=len(months))
+        monthly_counts = np.maximum(1, np.rint(monthly_counts * self.scale * self.utility_size)).astype(np.int64)
+        n = int(monthly_counts.sum())
+        
+        project_numbers = np.arange(self.capex_counter + 1, self.capex_counter + n + 1)
+        self.capex_counter += n
+        project_types = np.array(CAPEX_PROJECT_TYPES)[self.rng.integers(0, len(CAPEX_PROJECT_TYPES), size=n)]
         
-        # Generate monthly pulse survey results
-        current_date = self.start_date
-        while current_date <= self.end_date:
-            # Generate survey data for each department
-            departments = [
-                'Operations', 'Maintenance', 'Safety', 'HR', 
-                'Logistics', 'Training', 'Quality Control'
-            ]
-            
-            for department in departments:
-                self.pulse_survey_counter += 1
-                survey_id = f"PULSE-{self.pulse_survey_counter:06d}"
-                
-                # Generate base scores with some randomness
-                base_scores = {
-                    'engagement': random.uniform(0.70, 0.90),
-                    'satisfaction': random.uniform(0.70, 0.90),
-                    'wellbeing': random.uniform(0.70, 0.90),
-                    'culture': random.uniform(0.70, 0.90),
-                    'leadership': random.uniform(0.70, 0.90),
-                    'development': random.uniform(0.70, 0.90),
-                    'work_life_balance': random.uniform(0.70, 0.90),
-                    'recognition': random.uniform(0.70, 0.90)
-                }
-                
-                # Add seasonal variations
-                season_factor = 1.0
-                if current_date.month in [6, 7, 8]:  # Summer
-                    season_factor = 1.05
-                elif current_date.month in [12, 1, 2]:  # Winter
-                    season_factor = 0.95
-                
-                # Calculate final scores
-                scores = {k: round(v * season_factor * random.uniform(0.95, 1.05), 3) 
-                         for k, v in base_scores.items()}
-                
-                # Generate pulse survey record
-                pulse_record = {
-                    'survey_id': survey_id,
-                    'survey_date': current_date,
-                    'department': department,
-                    'response_rate': round(random.uniform(0.75, 0.95), 3),
-                    'engagement_score': scores['engagement'],
-                    'satisfaction_score': scores['satisfaction'],
-                    'wellbeing_score': scores['wellbeing'],
-                    'culture_score': scores['culture'],
-                    'leadership_score': scores['leadership'],
-                    'development_score': scores['development'],
-                    'work_life_balance_score': scores['work_life_balance'],
-                    'recognition_score': scores['recognition'],
-                    'overall_score': round(np.mean(list(scores.values())), 3),
-                    'key_findings': json.dumps(self._generate_key_findings()),
-                    'action_items': json.dumps(self._generate_action_items()),
-                    'employee_feedback': json.dumps(self._generate_employee_feedback())
-                }
-                
-                pulse_data.append(pulse_record)
-            
-            current_date += timedelta(days=30)  # Move to next month
+        # Project timeline
+        start_dates = np.repeat(months, monthly_counts) + self.rng.integers(0, 31, size=n).astype('timedelta64[D]')
+        duration_months = self.rng.integers(3, 25, size=n)
+        end_dates = start_dates + (duration_months * 30).astype('timedelta64[D]')
         
-        df = pd.DataFrame(pulse_data)
-        df.to_csv(self.output_dir / 'pulse_surveys.csv', index=False)
+        # Budget data
+        base_budget = self.rng.uniform(100000, 5000000, size=n) * self.utility_size
+        contingency = base_budget * self.rng.uniform(0.05, 0.15, size=n)
+        total_budget = base_budget + contingency
+        
+        # Progress: projects past their planned end are mostly completed
+        finished = end_dates < np.datetime64(self.end_date)
+        progress = np.where(finished, self.rng.uniform(0.8, 1.0, size=n), self.rng.uniform(0.0, 0.8, size=n))
+        cost_factor = self.rng.uniform(0.9, 1.1, size=n)
+        actual_cost = np.where(finished, total_budget, total_budget * progress) * cost_factor
+        status = np.where(
+            finished,
+            np.where(self.rng.random(n) < 0.75, 'Completed', 'On Track'),
+            np.array(['In Progress', 'On Track', 'Delayed'])[self.rng.integers(0, 3, size=n)]
+        )
+        completed = status == 'Completed'
+        
+        levels = np.array(['High', 'Medium', 'Low'])
+        capex_data = {
+            'project_id': [f"CAPEX-{number:06d}" for number in project_numbers],
+            'project_name': np.char.add(np.char.add(project_types, ' Project '), project_numbers.astype(str)),
+            'project_type': project_types,
+            'start_date': start_dates,
+            'planned_end_date': end_dates,
+            'actual_end_date': np.where(completed, end_dates, np.datetime64('NaT')),
+            'base_budget': base_budget.round(2),
+            'contingency_budget': contingency.round(2),
+            'total_budget': total_budget.round(2),
+            'actual_cost': actual_cost.round(2),
+            'progress_percentage': (progress * 100).round(2),
+            'status': status,
+            'priority': levels[self.rng.integers(0, 3, size=n)],
+            'risk_level': levels[self.rng.integers(0, 3, size=n)],
+            'benefits_realized': self._sample_text_lists('benefits_realized', n),
+            'key_milestones': self._sample_text_lists('key_milestones', n),
+            'stakeholders': self._sample_text_lists('stakeholders', n)
+        }
+        
+        df = apply_schema(pd.DataFrame(capex_data), 'capex_projects')
+        self.write_output(df, 'capex_projects', since)
         return df
     
-    def _calculate_performance_rating(self, scores):
-        """Calculate Ofwat performance rating based on scores"""
-        overall_score = np.mean(list(scores.values()))
-        if overall_score >= 0.95:
-            return 'Outstanding'
-        elif overall_score >= 0.90:
-            return 'Good'
-        elif overall_score >= 0.85:
-            return 'Requires Improvement'
-        else:
-            return 'Poor'
-    
-    def _generate_key_achievements(self):
-        """Generate key achievements for Ofwat results"""
-        return random.sample([
-            'Reduced water leakage by 15%',
-            'Improved customer satisfaction scores',
-            'Implemented new water treatment technology',
-            'Enhanced environmental protection measures',
-            'Optimized operational efficiency',
-            'Upgraded distribution network',
-            'Reduced energy consumption',
-            'Improved water quality metrics'
-        ], k=random.randint(3, 5))
-    
-    def _generate_improvement_areas(self):
-        """Generate areas for improvement"""
-        return random.sample([
-            'Customer response times',
-            'Water pressure management',
-            'Infrastructure maintenance',
-            'Energy efficiency',
-            'Waste reduction',
-            'Employee training',
-            'Digital transformation',
-            'Environmental impact'
-        ], k=random.randint(2, 4))
-    
-    def _generate_project_benefits(self):
-        """Generate project benefits for CAPEX projects"""
-        return random.sample([
-            'Improved operational efficiency',
-            'Enhanced safety measures',
-            'Reduced maintenance costs',
-            'Better environmental compliance',
-            'Increased capacity',
-            'Improved customer service',
-            'Cost savings',
-            'Technology advancement'
-        ], k=random.randint(3, 5))
-    
-    def _generate_project_milestones(self):
-        """Generate project milestones"""
-        return random.sample([
-            'Project planning completed',
-            'Design phase completed',
-            'Equipment procurement',
-            'Installation completed',
-            'Testing phase',
-            'Staff training',
-            'Commissioning',
-            'Project handover'
-        ], k=random.randint(4, 6))
-    
-    def _generate_stakeholders(self):
-        """Generate project stakeholders"""
-        return random.sample([
-            'Operations Team',
-            'Maintenance Team',
-            'Safety Department',
-            'Environmental Team',
-            'Customer Service',
-            'Regulatory Bodies',
-            'Local Community',
-            'Contractors'
-        ], k=random.randint(3, 5))
-    
-    def _generate_key_findings(self):
-        """Generate key findings for pulse surveys"""
-        return random.sample([
-            'High employee engagement in safety initiatives',
-            'Strong team collaboration',
-            'Good work-life balance',
-            'Effective leadership communication',
-            'Opportunities for skill development',
-            'Positive workplace culture',
-            'Well-maintained facilities',
-            'Clear career progression paths'
-        ], k=random.randint(3, 5))
-    
-    def _generate_action_items(self):
-        """Generate action items for pulse surveys"""
-        return random.sample([
-            'Enhance training programs',
-            'Improve communication channels',
-            'Implement flexible working arrangements',
-            'Strengthen recognition programs',
-            'Develop leadership skills',
-            'Address workload concerns',
-            'Enhance workplace safety',
-            'Improve career development opportunities'
-        ], k=random.randint(2, 4))
-    
-    def _generate_employee_feedback(self):
-        """Generate employee feedback for pulse surveys"""
-        return random.sample([
-            'Great team environment',
-            'Good work-life balance',
-            'Clear communication from management',
-            'Opportunities for growth',
-            'Strong safety culture',
-            'Well-organized workplace',
-            'Supportive colleagues',
-            'Challenging and rewarding work'
-        ], k=random.randint(4, 6))
+    def generate_pulse_survey_data(self, since=None):
+        """Generate employee pulse survey data, only for survey dates after ``since`` if given"""
+        # One survey per department on each survey date, as a (date x department x measure) score cube
+        dates = pd.DatetimeIndex(step_dates(self.start_date, self.end_date, self.survey_interval_days, after=since))
+        shape = (len(dates), len(DEPARTMENTS), len(PULSE_MEASURES))
+        n = len(dates) * len(DEPARTMENTS)
+        
+        survey_numbers = np.arange(self.pulse_survey_counter + 1, self.pulse_survey_counter + n + 1)
+        self.pulse_survey_counter += n
+        
+        base_scores = self.rng.uniform(0.70, 0.90, size=shape) + self.engagement_offset
+        season_factor = self._season_factors(dates, 1.05, 0.95)
+        scores = np.round(base_scores * season_factor[:, None, None] * self.rng.uniform(0.95, 1.05, size=shape), 3)
+        scores = scores.reshape(n, len(PULSE_MEASURES))
+        
+        pulse_data = {
+            'survey_id': [f"PULSE-{number:06d}" for number in survey_numbers],
+            'survey_date': np.repeat(dates, len(DEPARTMENTS)),
+            'department': pd.Categorical.from_codes(np.tile(np.arange(len(DEPARTMENTS)), len(dates)), DEPARTMENTS),
+            'response_rate': self.rng.uniform(0.75, 0.95, size=n).round(3)
+        }
+        for position, measure in enumerate(PULSE_MEASURES):
+            pulse_data[f'{measure}_score'] = scores[:, position]
+        pulse_data.update({
+            'overall_score': scores.mean(axis=1).round(3),
+            'key_findings': self._sample_text_lists('key_findings', n),
+            'action_items': self._sample_text_lists('action_items', n),
+            'employee_feedback': self._sample_text_lists('employee_feedback', n)
+        })
+        
+        df = apply_schema(pd.DataFrame(pulse_data), 'pulse_surveys')
+        self.write_output(df, 'pulse_surveys', since)
+        return df
     
-    def generate_all_data(self):
-        """Generate all metrics data"""
+    def generate_all_data(self, workers=1, incremental=False):
+        """Generate all metrics data, one shard per table, or per table and utility
+
+        With ``incremental`` and a checkpoint from an earlier run, only rows after
+        each table's watermark are generated and appended to the existing files.
+        With more than one utility, each table is a dataset partitioned by utility_id.
+        """
+        tables = {
+            'ofwat_results': ('generate_ofwat_results', None),
+            'capex_projects': ('generate_capex_data', 'capex_counter'),
+            'pulse_surveys': ('generate_pulse_survey_data', 'pulse_survey_counter')
+        }
+        checkpoint = Checkpoint(self.output_dir)
+        incremental = incremental and checkpoint.exists
+        since = {table: checkpoint.watermark(table) if incremental else None for table in tables}
+        
         print("\n=== Starting Water Utilities Metrics Generation ===")
         print(f"Start Date: {self.start_date.strftime('%Y-%m-%d')}")
         print(f"End Date: {self.end_date.strftime('%Y-%m-%d')}")
-        print(f"Output Directory: {self.output_dir.absolute()}\n")
-        
-        print("1. Generating Ofwat results...")
-        ofwat_df = self.generate_ofwat_results()
-        print(f"   ✓ Generated {len(ofwat_df)} quarterly records")
-        print(f"   ✓ Saved to: {self.output_dir / 'ofwat_results.csv'}")
+        print(f"Output Directory: {self.output_dir.absolute()}")
+        print(f"Utilities: {self.num_utilities}")
+        print(f"Workers: {workers}")
+        if incremental:
+            print("Incremental: appending rows after the last run's watermarks")
+        print()
         
-        print("\n2. Generating CAPEX data...")
-        capex_df = self.generate_capex_data()
-        print(f"   ✓ Generated {len(capex_df)} project records")
-        print(f"   ✓ Saved to: {self.output_dir / 'capex_projects.csv'}")
+        print("Generating Ofwat results, CAPEX data and pulse survey data...")
+        if self.num_utilities > 1:
+            rows = self.run_utilities(tables, checkpoint, incremental=incremental, workers=workers)
+            outputs = {table: self.output_dir / table for table in tables}
+        else:
+            for table, (_, counter) in tables.items():
+                if counter and since[table] is not None:
+                    setattr(self, counter, checkpoint.counter(table))
+            frames = self.run_shards(
+                [
+                    (shard_key(table, since=since[table]), method, (since[table],))
+                    for table, (method, _) in tables.items()
+                ],
+                workers=workers
+            )
+            rows = {table: len(df) for table, df in zip(tables, frames)}
+            outputs = {table: self.output_dir / f'{table}.csv' for table in tables}
+            for table, (_, counter) in tables.items():
+                checkpoint.set_watermark(table, self.end_date)
+                if counter:
+                    checkpoint.set_counter(table, getattr(self, counter) + rows[table])
+        checkpoint.save()
         
-        print("\n3. Generating pulse survey data...")
-        pulse_df = self.generate_pulse_survey_data()
-        print(f"   ✓ Generated {len(pulse_df)} survey records")
-        print(f"   ✓ Saved to: {self.output_dir / 'pulse_surveys.csv'}")
+        print(f"1. ✓ Generated {rows['ofwat_results']} quarterly records")
+        print(f"   ✓ Saved to: {outputs['ofwat_results']}")
+        print(f"2. ✓ Generated {rows['capex_projects']} project records")
+        print(f"   ✓ Saved to: {outputs['capex_projects']}")
+        print(f"3. ✓ Generated {rows['pulse_surveys']} survey records")
+        print(f"   ✓ Saved to: {outputs['pulse_surveys']}")
         
         print("\n=== Data Generation Summary ===")
-        print(f"Total Ofwat Records: {len(ofwat_df)}")
-        print(f"Total CAPEX Projects: {len(capex_df)}")
-        print(f"Total Pulse Surveys: {len(pulse_df)}")
+        print(f"Total Ofwat Records: {rows['ofwat_results']}")
+        print(f"Total CAPEX Projects: {rows['capex_projects']}")
+        print(f"Total Pulse Surveys: {rows['pulse_surveys']}")
         print(f"\nAll files have been saved to: {self.output_dir.absolute()}")
         print("=== Generation Complete ===\n")
 
 if __name__ == "__main__":
-    generator = WaterUtilitiesMetricsGenerator()
-    generator.generate_all_data() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Generate water utilities metrics data")
+    parser.add_argument('--seed', type=int, default=RANDOM_SEED, help="Master random seed")
+    parser.add_argument('--workers', type=int, default=1, help="Worker processes, one table (and utility) per shard")
+    parser.add_argument('--scale', type=float, default=1.0, help="Multiplier for the number of CAPEX projects")
+    parser.add_argument('--incremental', action='store_true', help="Append only rows after the last run's watermarks")
+    parser.add_argument('--utilities', type=int, default=1, help="Number of utilities; more than one writes datasets partitioned by utility_id")
+    parser.add_argument('--format', choices=['parquet', 'csv'], default='parquet', help="File format of utility partitions")
+    parser.add_argument('--survey-interval-days', type=int, default=30, help="Days between pulse surveys, down to 1 for daily")
+    args = parser.parse_args()
+    
+    generator = WaterUtilitiesMetricsGenerator(seed=args.seed, scale=args.scale, num_utilities=args.utilities,
+                                               file_format=args.format, survey_interval_days=args.survey_interval_days)
+    generator.generate_all_data(workers=args.workers, incremental=args.incremental)
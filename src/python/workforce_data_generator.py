@@ -1,25 +1,67 @@
 import pandas as pd
 import numpy as np
-from faker import Faker
 from datetime import datetime, timedelta
-import random
-import yaml
 from pathlib import Path
 import json
 from scipy import stats
+import argparse
+from sharding import ShardedGeneratorMixin
+from hierarchy import assign_parents
+from incremental import Checkpoint, shard_key, write_table
+from schemas import apply_schema, read_table
+from id_factory import IdFactory
+from generator_config import load_config
 
-# Set random seeds for reproducibility
+# Master seed for reproducibility; each department shard derives its own seed from it
 RANDOM_SEED = 42
-np.random.seed(RANDOM_SEED)
-random.seed(RANDOM_SEED)
-fake = Faker()
-Faker.seed(RANDOM_SEED)
 
-class WorkforceDataGenerator:
-    def __init__(self):
+# Settings workforce_config.yaml must define, checked once when the file is first loaded
+CONFIG_REQUIRED = ('departments', 'locations.facilities.water_utilities')
+
+# Employees drawn per role at scale 1
+EMPLOYEES_PER_ROLE = (3, 15)
+
+# Employee and emergency contact phone numbers, one random digit per '#'
+PHONE_PATTERN = '###-###-####'
+
+TRAINING_TYPES = ['Safety Training', 'Technical Skills', 'Leadership Development',
+                  'Compliance Training', 'Equipment Operation', 'Emergency Response']
+TRAINING_PROVIDERS = ['Internal Training', 'External Vendor', 'Industry Association',
+                      'Technical Institute', 'Online Platform']
+TRAINING_STATUSES = ['Completed', 'In Progress', 'Scheduled']
+
+LEAVE_TYPES = ['Vacation', 'Sick Leave', 'Personal Leave', 'Family Leave', 'Emergency Leave']
+LEAVE_STATUSES = ['Approved', 'Pending', 'Rejected']
+LEAVE_REASONS = ['Family Emergency', 'Medical Treatment', 'Vacation', 'Personal Matters', 'Mental Health']
+
+# Review scores, each rated 1-5
+REVIEW_RATINGS = ['overall_rating', 'technical_skills', 'communication', 'leadership',
+                  'safety_compliance', 'attendance']
+REVIEW_COMMENTS = [
+    'Excellent performance in all areas',
+    'Strong technical skills, needs improvement in communication',
+    'Consistently meets expectations',
+    'Shows great leadership potential',
+    'Needs improvement in attendance'
+]
+REVIEW_GOALS = ['Complete advanced certification', 'Improve team communication', 'Reduce maintenance downtime',
+                'Implement new safety procedures', 'Mentor junior staff']
+
+class WorkforceDataGenerator(ShardedGeneratorMixin):
+    fake_pool_kinds = ('first_name', 'last_name', 'email', 'name')
+
+    def __init__(self, seed=RANDOM_SEED, scale=1.0, num_employees=None):
         self.start_date = datetime(2019, 1, 1)
         self.end_date = datetime.now()
+        self.scale = scale
         self.config = self._load_config()
+        if num_employees is not None:
+            # Scale every role's headcount so the expected total matches the target
+            self.scale = num_employees / (np.mean(EMPLOYEES_PER_ROLE) * self.num_roles)
+        
+        # Per-instance random sources (self.random, self.rng, self.fake, self.fake_pool)
+        self.init_random_state(seed)
+        self.ids = IdFactory(seed)
         
         # Create output directory
         self.output_dir = Path('workforce_data')
@@ -32,66 +74,103 @@ class WorkforceDataGenerator:
         self.performance_counter = 0
         
     def _load_config(self):
-        """Load configuration from YAML file"""
-        with open('workforce_config.yaml', 'r') as f:
-            return yaml.safe_load(f)
+        """Load the validated configuration, parsed once per version of the YAML file"""
+        return load_config('workforce_config.yaml', required=CONFIG_REQUIRED)
     
-    def generate_employee_data(self):
+    @property
+    def num_roles(self):
+        return sum(len(roles) for roles in self.config['departments'].values())
+    
+    def estimate_rows(self):
+        """Expected rows per output table at the current scale, without generating anything"""
+        num_employees = self.expected_scaled_count(*EMPLOYEES_PER_ROLE) * self.num_roles
+        # Hire dates fall uniformly 1-10 years before end_date, with one review per full year
+        reviews_per_employee = np.mean(np.arange(365, 365 * 10 + 1) // 365)
+        return {
+            'employees.csv': num_employees,
+            'training_records.csv': num_employees * (2 + 6) / 2,
+            'leave_records.csv': num_employees * (1 + 4) / 2,
+            'performance_reviews.csv': num_employees * reviews_per_employee
+        }
+    
+    def generate_employee_data(self, departments=None, save=True):
         """Generate employee master data"""
         employees = []
-        departments = self.config['departments']
+        domains = []
+        if departments is None:
+            departments = list(self.config['departments'])
         
-        for department, roles in departments.items():
-            for role in roles:
+        for department in departments:
+            for role in self.config['departments'][department]:
                 # Generate multiple employees for each role
-                num_employees = random.randint(3, 15)
+                num_employees = self.scaled_count(self.random.randint(*EMPLOYEES_PER_ROLE))
+                
+                # Draw the fake fields for every employee in this role at once
+                hire_dates = self.fake_pool.dates_between(
+                    self.end_date - timedelta(days=365 * 10),
+                    self.end_date - timedelta(days=365),
+                    num_employees, self.rng
+                ).tolist()
+                first_names = self.fake_pool.draw('first_name', num_employees, self.rng).tolist()
+                last_names = self.fake_pool.draw('last_name', num_employees, self.rng).tolist()
+                # Pools hold far fewer values than large headcounts, so emails are built on the
+                # employee ID and phone numbers drawn digit by digit to keep them unique
+                domains += [email.split('@')[-1] for email in self.fake_pool.draw('email', num_employees, self.rng)]
+                phones = self.fake_pool.bothify(PHONE_PATTERN, num_employees, self.rng).tolist()
+                contact_names = self.fake_pool.draw('name', num_employees, self.rng).tolist()
+                contact_phones = self.fake_pool.bothify(PHONE_PATTERN, num_employees, self.rng).tolist()
                 
-                for _ in range(num_employees):
+                for i in range(num_employees):
                     self.employee_counter += 1
                     employee_id = f"EMP-{department[:2].upper()}-{self.employee_counter:06d}"
                     
                     # Generate employee data
-                    hire_date = fake.date_between(start_date='-10y', end_date='-1y')
+                    hire_date = hire_dates[i]
                     salary = self._generate_salary(role)
                     
                     employee = {
                         'employee_id': employee_id,
-                        'first_name': fake.first_name(),
-                        'last_name': fake.last_name(),
-                        'email': fake.email(),
-                        'phone': fake.phone_number(),
+                        'first_name': first_names[i],
+                        'last_name': last_names[i],
+                        'email': None,  # Built below, once every employee has an ID
+                        'phone': phones[i],
                         'department': department,
                         'role': role,
                         'hire_date': hire_date,
-                        'employment_status': random.choice(['Active', 'Active', 'Active', 'On Leave']),
+                        'employment_status': self.random.choice(['Active', 'Active', 'Active', 'On Leave']),
                         'salary': salary,
-                        'bonus_target': round(salary * random.uniform(0.05, 0.15), 2),
+                        'bonus_target': round(salary * self.random.uniform(0.05, 0.15), 2),
                         'certifications': self._generate_certifications(department),
                         'skills': self._generate_skills(department),
                         'location': self._generate_location(),
                         'manager_id': None,  # Will be updated later
                         'emergency_contact': {
-                            'name': fake.name(),
-                            'relationship': random.choice(['Spouse', 'Parent', 'Sibling', 'Friend']),
-                            'phone': fake.phone_number()
+                            'name': contact_names[i],
+                            'relationship': self.random.choice(['Spouse', 'Parent', 'Sibling', 'Friend']),
+                            'phone': contact_phones[i]
                         }
                     }
                     
                     employees.append(employee)
         
-        # Establish manager-employee relationships
-        for employee in employees:
-            if random.random() < 0.8:  # 80% chance of having a manager
-                potential_managers = [
-                    e for e in employees 
-                    if e['employee_id'] != employee['employee_id'] and 
-                    e['department'] == employee['department']
-                ]
-                if potential_managers:
-                    employee['manager_id'] = random.choice(potential_managers)['employee_id']
+        # Establish manager-employee relationships within each department
+        org_chart = self.config.get('org_chart', {})
+        manager_ids = assign_parents(
+            [employee['employee_id'] for employee in employees],
+            [employee['department'] for employee in employees],
+            self.random,
+            parent_probability=org_chart.get('manager_probability', 0.8),
+            max_depth=org_chart.get('max_depth'),
+            max_children=org_chart.get('max_children')
+        )
+        for employee, manager_id in zip(employees, manager_ids):
+            employee['manager_id'] = manager_id
         
         df = pd.DataFrame(employees)
-        df.to_csv(self.output_dir / 'employees.csv', index=False)
+        df['email'] = self._emails(df, domains)
+        df = apply_schema(df, 'employees')
+        if save:
+            df.to_csv(self.output_dir / 'employees.csv', index=False)
         return df
     
     def _generate_salary(self, role):
@@ -114,34 +193,34 @@ class WorkforceDataGenerator:
         }
         
         salary_range = base_salaries.get(role, (40000, 80000))
-        return round(random.uniform(salary_range[0], salary_range[1]), 2)
+        return round(self.random.uniform(salary_range[0], salary_range[1]), 2)
     
     def _generate_certifications(self, department):
         """Generate relevant certifications based on department"""
         certs = []
         if department == 'Operations':
-            certs.extend(random.sample([
+            certs.extend(self.random.sample([
                 'Water Treatment Operator License',
                 'Wastewater Treatment Operator License',
                 'HACCP Certification',
                 'OSHA Safety Certification',
                 'First Aid/CPR'
-            ], k=random.randint(2, 4)))
+            ], k=self.random.randint(2, 4)))
         elif department == 'Maintenance':
-            certs.extend(random.sample([
+            certs.extend(self.random.sample([
                 'HVAC Certification',
                 'Electrical License',
                 'Plumbing License',
                 'Welding Certification',
                 'OSHA Safety Certification'
-            ], k=random.randint(2, 4)))
+            ], k=self.random.randint(2, 4)))
         elif department == 'Safety':
-            certs.extend(random.sample([
+            certs.extend(self.random.sample([
                 'OSHA Safety Professional',
                 'First Aid Instructor',
                 'Hazardous Materials Handler',
                 'Emergency Response Coordinator'
-            ], k=random.randint(2, 3)))
+            ], k=self.random.randint(2, 3)))
         
         return json.dumps(certs)
     
@@ -149,210 +228,260 @@ class WorkforceDataGenerator:
         """Generate relevant skills based on department"""
         skills = []
         if department == 'Operations':
-            skills.extend(random.sample([
+            skills.extend(self.random.sample([
                 'Process Control',
                 'Water Quality Analysis',
                 'Equipment Operation',
                 'Troubleshooting',
                 'Safety Procedures'
-            ], k=random.randint(3, 5)))
+            ], k=self.random.randint(3, 5)))
         elif department == 'Maintenance':
-            skills.extend(random.sample([
+            skills.extend(self.random.sample([
                 'Equipment Repair',
                 'Preventive Maintenance',
                 'Mechanical Systems',
                 'Electrical Systems',
                 'Hydraulic Systems'
-            ], k=random.randint(3, 5)))
+            ], k=self.random.randint(3, 5)))
         elif department == 'Safety':
-            skills.extend(random.sample([
+            skills.extend(self.random.sample([
                 'Risk Assessment',
                 'Safety Training',
                 'Incident Investigation',
                 'Compliance Management',
                 'Emergency Response'
-            ], k=random.randint(3, 5)))
+            ], k=self.random.randint(3, 5)))
         
         return json.dumps(skills)
     
+    def _window_counts(self, low, high, hire_dates, since):
+        """Records per employee; incremental runs scale the usual count to each employee's new window"""
+        if since is None:
+            return self.rng.integers(low, high + 1, size=len(hire_dates))
+        history_days = np.maximum((since - hire_dates).days.to_numpy(), 1)
+        window_days = max((self.end_date - since).days, 0)
+        return self.rng.poisson((low + high) / 2 * window_days / history_days)
+    
     def _generate_location(self):
         """Generate location data for an employee"""
-        facilities = self.config['locations']['facilities']['water_utilities']
-        facility = random.choice(facilities)
-        area = random.choice(facility['areas'])
+        facilities = self.config.lookup('locations.facilities.water_utilities')
+        facility = self.random.choice(facilities)
+        area = self.random.choice(facility['areas'])
         
         return {
             'facility_name': facility['name'],
             'area': area,
             'location_code': f"{facility['name'][:3].upper()}-{area[:3].upper()}",
-            'lat': facility['lat'] + random.uniform(-0.01, 0.01),
-            'lon': facility['lon'] + random.uniform(-0.01, 0.01)
+            'lat': facility['lat'] + self.random.uniform(-0.01, 0.01),
+            'lon': facility['lon'] + self.random.uniform(-0.01, 0.01)
         }
     
-    def generate_training_data(self, employees_df):
-        """Generate training and development data"""
-        training_records = []
+    def generate_training_data(self, employees_df, save=True, since=None):
+        """Generate training and development data, only after ``since`` if given"""
+        # Draw every employee's record count, then all records at once in employee order
+        hire_dates = pd.DatetimeIndex(employees_df['hire_date'])
+        rows = np.repeat(np.arange(len(employees_df)), self._window_counts(2, 6, hire_dates, since))
+        n = len(rows)
+        start_dates = self.fake_pool.dates_between(
+            hire_dates[rows] if since is None else since + timedelta(days=1),
+            self.end_date, n, self.rng
+        )
         
-        for _, employee in employees_df.iterrows():
-            # Generate multiple training records per employee
-            num_trainings = random.randint(2, 6)
-            
-            for _ in range(num_trainings):
-                self.training_counter += 1
-                training_id = f"TRN-{self.training_counter:06d}"
-                
-                # Generate training data
-                training_date = fake.date_between(
-                    start_date=employee['hire_date'],
-                    end_date=self.end_date
-                )
-                
-                training = {
-                    'training_id': training_id,
-                    'employee_id': employee['employee_id'],
-                    'training_type': random.choice([
-                        'Safety Training',
-                        'Technical Skills',
-                        'Leadership Development',
-                        'Compliance Training',
-                        'Equipment Operation',
-                        'Emergency Response'
-                    ]),
-                    'provider': random.choice([
-                        'Internal Training',
-                        'External Vendor',
-                        'Industry Association',
-                        'Technical Institute',
-                        'Online Platform'
-                    ]),
-                    'start_date': training_date,
-                    'end_date': training_date + timedelta(days=random.randint(1, 5)),
-                    'status': random.choice(['Completed', 'In Progress', 'Scheduled']),
-                    'score': random.randint(70, 100) if random.random() < 0.8 else None,
-                    'certification_earned': random.choice([True, False]),
-                    'cost': round(random.uniform(500, 5000), 2)
-                }
-                
-                training_records.append(training)
+        training_data = {
+            'training_id': self._sequential_ids('TRN', self.training_counter, n),
+            'employee_id': employees_df['employee_id'].to_numpy()[rows],
+            'training_type': self.rng.choice(TRAINING_TYPES, size=n),
+            'provider': self.rng.choice(TRAINING_PROVIDERS, size=n),
+            'start_date': start_dates,
+            'end_date': start_dates + self.rng.integers(1, 6, size=n).astype('timedelta64[D]'),
+            'status': self.rng.choice(TRAINING_STATUSES, size=n),
+            'score': pd.Series(self.rng.integers(70, 101, size=n)).where(self.rng.random(n) < 0.8),
+            'certification_earned': self.rng.random(n) < 0.5,
+            'cost': self.rng.uniform(500, 5000, size=n).round(2)
+        }
+        self.training_counter += n
         
-        df = pd.DataFrame(training_records)
-        df.to_csv(self.output_dir / 'training_records.csv', index=False)
+        df = apply_schema(pd.DataFrame(training_data), 'training_records')
+        if save:
+            df.to_csv(self.output_dir / 'training_records.csv', index=False)
         return df
     
-    def generate_leave_data(self, employees_df):
-        """Generate leave and attendance data"""
-        leave_records = []
+    def generate_leave_data(self, employees_df, approver_ids=None, save=True, since=None):
+        """Generate leave and attendance data, only after ``since`` if given"""
+        if approver_ids is None:
+            approver_ids = employees_df['employee_id']
         
-        for _, employee in employees_df.iterrows():
-            # Generate multiple leave records per employee
-            num_leaves = random.randint(1, 4)
-            
-            for _ in range(num_leaves):
-                self.leave_counter += 1
-                leave_id = f"LEV-{self.leave_counter:06d}"
-                
-                # Generate leave data
-                leave_start = fake.date_between(
-                    start_date=employee['hire_date'],
-                    end_date=self.end_date
-                )
-                
-                leave = {
-                    'leave_id': leave_id,
-                    'employee_id': employee['employee_id'],
-                    'leave_type': random.choice([
-                        'Vacation',
-                        'Sick Leave',
-                        'Personal Leave',
-                        'Family Leave',
-                        'Emergency Leave'
-                    ]),
-                    'start_date': leave_start,
-                    'end_date': leave_start + timedelta(days=random.randint(1, 14)),
-                    'status': random.choice(['Approved', 'Pending', 'Rejected']),
-                    'reason': random.choice([
-                        'Family Emergency',
-                        'Medical Treatment',
-                        'Vacation',
-                        'Personal Matters',
-                        'Mental Health'
-                    ]),
-                    'approved_by': random.choice(employees_df['employee_id'].tolist())
-                }
-                
-                leave_records.append(leave)
+        hire_dates = pd.DatetimeIndex(employees_df['hire_date'])
+        rows = np.repeat(np.arange(len(employees_df)), self._window_counts(1, 4, hire_dates, since))
+        n = len(rows)
+        start_dates = self.fake_pool.dates_between(
+            hire_dates[rows] if since is None else since + timedelta(days=1),
+            self.end_date, n, self.rng
+        )
         
-        df = pd.DataFrame(leave_records)
-        df.to_csv(self.output_dir / 'leave_records.csv', index=False)
+        leave_data = {
+            'leave_id': self._sequential_ids('LEV', self.leave_counter, n),
+            'employee_id': employees_df['employee_id'].to_numpy()[rows],
+            'leave_type': self.rng.choice(LEAVE_TYPES, size=n),
+            'start_date': start_dates,
+            'end_date': start_dates + self.rng.integers(1, 15, size=n).astype('timedelta64[D]'),
+            'status': self.rng.choice(LEAVE_STATUSES, size=n),
+            'reason': self.rng.choice(LEAVE_REASONS, size=n),
+            'approved_by': self.rng.choice(np.asarray(approver_ids), size=n)
+        }
+        self.leave_counter += n
+        
+        df = apply_schema(pd.DataFrame(leave_data), 'leave_records')
+        if save:
+            df.to_csv(self.output_dir / 'leave_records.csv', index=False)
         return df
     
-    def generate_performance_data(self, employees_df):
-        """Generate performance review data"""
-        performance_records = []
+    def generate_performance_data(self, employees_df, reviewer_ids=None, save=True, since=None):
+        """Generate performance review data, only for review years completed after ``since`` if given"""
+        if reviewer_ids is None:
+            reviewer_ids = employees_df['employee_id']
         
-        for _, employee in employees_df.iterrows():
-            # Generate annual performance reviews
-            years_employed = (self.end_date - pd.to_datetime(employee['hire_date'])).days / 365
-            num_reviews = int(years_employed)
-            
-            for year in range(num_reviews):
-                self.performance_counter += 1
-                review_id = f"PERF-{self.performance_counter:06d}"
-                
-                # Generate review data
-                review_date = pd.to_datetime(employee['hire_date']) + timedelta(days=365 * year)
-                
-                performance = {
-                    'review_id': review_id,
-                    'employee_id': employee['employee_id'],
-                    'review_date': review_date,
-                    'reviewer_id': random.choice(employees_df['employee_id'].tolist()),
-                    'overall_rating': random.randint(1, 5),
-                    'technical_skills': random.randint(1, 5),
-                    'communication': random.randint(1, 5),
-                    'leadership': random.randint(1, 5),
-                    'safety_compliance': random.randint(1, 5),
-                    'attendance': random.randint(1, 5),
-                    'bonus_awarded': random.choice([True, False]),
-                    'bonus_amount': round(random.uniform(1000, 10000), 2) if random.random() < 0.7 else 0,
-                    'comments': random.choice([
-                        'Excellent performance in all areas',
-                        'Strong technical skills, needs improvement in communication',
-                        'Consistently meets expectations',
-                        'Shows great leadership potential',
-                        'Needs improvement in attendance'
-                    ]),
-                    'goals_set': json.dumps(random.sample([
-                        'Complete advanced certification',
-                        'Improve team communication',
-                        'Reduce maintenance downtime',
-                        'Implement new safety procedures',
-                        'Mentor junior staff'
-                    ], k=random.randint(2, 4)))
-                }
-                
-                performance_records.append(performance)
+        # One annual review per full year employed, from the first year after ``since``
+        hire_dates = pd.DatetimeIndex(employees_df['hire_date'])
+        num_reviews = ((self.end_date - hire_dates).days.to_numpy() / 365).astype(int)
+        first_review = np.zeros_like(num_reviews) if since is None else \
+            ((since - hire_dates).days.to_numpy() / 365).astype(int)
+        counts = np.maximum(num_reviews - first_review, 0)
+        rows = np.repeat(np.arange(len(employees_df)), counts)
+        n = len(rows)
+        years = first_review[rows] + np.arange(n) - np.repeat(np.cumsum(counts) - counts, counts)
+        
+        ratings = self.rng.integers(1, 6, size=(n, len(REVIEW_RATINGS)))
+        performance_data = {
+            'review_id': self._sequential_ids('PERF', self.performance_counter, n),
+            'employee_id': employees_df['employee_id'].to_numpy()[rows],
+            'review_date': hire_dates[rows] + pd.to_timedelta(years * 365, unit='D'),
+            'reviewer_id': self.rng.choice(np.asarray(reviewer_ids), size=n),
+            **{rating: ratings[:, position] for position, rating in enumerate(REVIEW_RATINGS)},
+            'bonus_awarded': self.rng.random(n) < 0.5,
+            'bonus_amount': np.where(self.rng.random(n) < 0.7, self.rng.uniform(1000, 10000, size=n).round(2), 0.0),
+            'comments': self.rng.choice(REVIEW_COMMENTS, size=n),
+            'goals_set': self._sample_goals(n)
+        }
+        self.performance_counter += n
         
-        df = pd.DataFrame(performance_records)
-        df.to_csv(self.output_dir / 'performance_reviews.csv', index=False)
+        df = apply_schema(pd.DataFrame(performance_data), 'performance_reviews')
+        if save:
+            df.to_csv(self.output_dir / 'performance_reviews.csv', index=False)
         return df
     
-    def generate_all_data(self):
-        """Generate all workforce data"""
-        print("Generating employee data...")
-        employees_df = self.generate_employee_data()
+    def _sample_goals(self, size):
+        """JSON lists of 2-4 distinct review goals for many reviews"""
+        # Ordering random keys gives a uniform permutation per row; keep its first k entries
+        order = np.argsort(self.rng.random((size, len(REVIEW_GOALS))), axis=1)[:, :4]
+        k = self.rng.integers(2, 5, size=size)
+        quoted = np.array([json.dumps(goal) for goal in REVIEW_GOALS])
+        text = np.full(size, '[')
+        for position in range(order.shape[1]):
+            entry = quoted[order[:, position]]
+            if position > 0:
+                entry = np.char.add(', ', entry)
+            text = np.char.add(text, np.where(position < k, entry, ''))
+        return np.char.add(text, ']')
+    
+    def _emails(self, employees, domains):
+        """Addresses such as 'jane.smith.op000123@example.com' for EMP-OP-000123, unique through the employee ID"""
+        names = (employees['first_name'] + '.' + employees['last_name']).str.lower()
+        names = names.str.replace(r'[^a-z.]', '', regex=True)
+        ids = employees['employee_id'].str[4:].str.replace('-', '', regex=False).str.lower()
+        return (names + '.' + ids).to_numpy(dtype=object) + '@' + np.asarray(domains, dtype=object)
+    
+    def _sequential_ids(self, prefix, start, size):
+        """IDs such as 'TRN-000001' numbered on from ``start``"""
+        return self.ids.sequential(f'{prefix}-', size, width=6, start=start)
+    
+    def _generate_department_history(self, department_employees, all_employee_ids, since=None):
+        """Generate training, leave and performance records for one department, after per-table watermarks"""
+        since = since or {}
+        return (
+            self.generate_training_data(department_employees, save=False, since=since.get('training_records')),
+            self.generate_leave_data(department_employees, approver_ids=all_employee_ids, save=False,
+                                     since=since.get('leave_records')),
+            self.generate_performance_data(department_employees, reviewer_ids=all_employee_ids, save=False,
+                                           since=since.get('performance_reviews'))
+        )
+    
+    def _renumber_employees(self, department_frames):
+        """Assign global employee IDs across department shards and remap managers"""
+        counter = 0
+        for frame in department_frames:
+            numbers = pd.Series(np.arange(counter + 1, counter + len(frame) + 1), index=frame.index)
+            new_ids = 'EMP-' + frame['department'].str[:2].str.upper() + '-' + numbers.astype(str).str.zfill(6)
+            id_map = pd.Series(new_ids.to_numpy(), index=frame['employee_id'].to_numpy())
+            frame['employee_id'] = new_ids
+            frame['manager_id'] = frame['manager_id'].map(id_map)
+            # Emails carry the employee ID, so they are rebuilt on the global one
+            frame['email'] = self._emails(frame, frame['email'].str.split('@').str[-1])
+            counter += len(frame)
+        self.employee_counter = counter
+        return apply_schema(pd.concat(department_frames, ignore_index=True), 'employees')
+    
+    def _renumber(self, frames, column, prefix, start=0):
+        """Concatenate shard frames and assign sequential IDs in shard order, after ``start``"""
+        df = pd.concat(frames, ignore_index=True)
+        df[column] = self._sequential_ids(prefix, start, len(df))
+        return df
+    
+    def generate_all_data(self, workers=1, incremental=False):
+        """Generate all workforce data, one shard per department
+
+        With ``incremental`` and a checkpoint from an earlier run, the existing
+        employees are kept and only training, leave and review records dated
+        after the last run are appended.
+        """
+        departments = list(self.config['departments'])
+        history_tables = [('training_records', 'training_id', 'TRN'),
+                          ('leave_records', 'leave_id', 'LEV'),
+                          ('performance_reviews', 'review_id', 'PERF')]
+        checkpoint = Checkpoint(self.output_dir)
+        incremental = incremental and checkpoint.exists
+        since = {table: checkpoint.watermark(table) if incremental else None for table, _, _ in history_tables}
         
-        print("Generating training records...")
-        training_df = self.generate_training_data(employees_df)
+        if incremental:
+            print(f"Incremental: reusing employees, appending records after {since['training_records']}")
+            employees_df = read_table(self.output_dir / 'employees.csv', 'employees')
+        else:
+            print(f"Generating employee data for {len(departments)} departments with {workers} worker(s)...")
+            employee_frames = self.run_shards(
+                [((department, 'employees'), 'generate_employee_data', ([department], False))
+                 for department in departments],
+                workers=workers
+            )
+            employees_df = self._renumber_employees(employee_frames)
+            employees_df.to_csv(self.output_dir / 'employees.csv', index=False)
         
-        print("Generating leave records...")
-        leave_df = self.generate_leave_data(employees_df)
+        print("Generating training, leave and performance records...")
+        all_employee_ids = employees_df['employee_id'].to_numpy()
+        history = self.run_shards(
+            [(shard_key(department, 'history', since=since.get('training_records')), '_generate_department_history',
+              (employees_df[employees_df['department'] == department], all_employee_ids, since))
+             for department in departments],
+            workers=workers
+        )
         
-        print("Generating performance reviews...")
-        performance_df = self.generate_performance_data(employees_df)
+        for position, (table, column, prefix) in enumerate(history_tables):
+            counter = checkpoint.counter(table) if incremental else 0
+            df = apply_schema(self._renumber([h[position] for h in history], column, prefix, start=counter), table)
+            write_table(df, self.output_dir / f'{table}.csv', append=incremental, engine='pyarrow')
+            checkpoint.set_watermark(table, self.end_date)
+            checkpoint.set_counter(table, counter + len(df))
+        checkpoint.save()
         
         print("Data generation complete! Files saved in 'workforce_data' directory.")
 
 if __name__ == "__main__":
-    generator = WorkforceDataGenerator()
-    generator.generate_all_data() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Generate workforce data")
+    parser.add_argument('--seed', type=int, default=RANDOM_SEED, help="Master random seed")
+    parser.add_argument('--workers', type=int, default=1, help="Worker processes, one department per shard")
+    parser.add_argument('--scale', type=float, default=1.0, help="Multiplier for the number of employees")
+    parser.add_argument('--employees', type=int, help="Target headcount, e.g. 100000, overriding --scale")
+    parser.add_argument('--incremental', action='store_true', help="Append only records after the last run's watermarks")
+    args = parser.parse_args()
+    
+    generator = WorkforceDataGenerator(seed=args.seed, scale=args.scale, num_employees=args.employees)
+    generator.generate_all_data(workers=args.workers, incremental=args.incremental)
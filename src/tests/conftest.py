@@ -0,0 +1,25 @@
+import sys
+from pathlib import Path
+import pytest
+
+# The generators are plain scripts in src/python, imported by module name
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'python'))
+
+
+def pytest_addoption(parser):
+    parser.addoption('--run-benchmarks', action='store_true', help="Run the generator benchmarks")
+    parser.addoption('--update-benchmark-baselines', action='store_true',
+                     help="Record benchmark results as the new baselines instead of checking them")
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', "benchmark: generator throughput benchmark, run with --run-benchmarks")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--run-benchmarks') or config.getoption('--update-benchmark-baselines'):
+        return
+    skip = pytest.mark.skip(reason="benchmarks run with --run-benchmarks")
+    for item in items:
+        if 'benchmark' in item.keywords:
+            item.add_marker(skip)
@@ -0,0 +1,192 @@
+import json
+import logging
+import time
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import pytest
+from data_cleaning import DataCleaner
+
+# Inputs and the values clean_numeric returned for them before it was vectorized
+GOLDEN_PATH = Path(__file__).resolve().parent / 'clean_numeric_golden.json'
+
+# Time allowed to clean a 10M-row column in the benchmark below
+TEN_MILLION_ROW_SECONDS = 30.0
+
+
+@pytest.fixture(scope='module')
+def golden():
+    return json.loads(GOLDEN_PATH.read_text())
+
+
+@pytest.fixture(scope='module')
+def cleaner():
+    return DataCleaner()
+
+
+def test_clean_numeric_matches_golden(golden, cleaner):
+    for case in golden:
+        assert cleaner.clean_numeric(case['value']) == case['expected'], case['value']
+
+
+def test_clean_numeric_column_matches_golden(golden, cleaner):
+    values = pd.Series([case['value'] for case in golden], dtype=object)
+    expected = pd.Series([case['expected'] for case in golden], dtype=float)
+    pd.testing.assert_series_equal(cleaner.clean_numeric_column(values), expected)
+
+
+def test_clean_numeric_column_matches_golden_strings(golden, cleaner):
+    cases = [case for case in golden if isinstance(case['value'], str)]
+    values = pd.Series([case['value'] for case in cases]).astype('str')
+    expected = pd.Series([case['expected'] for case in cases], dtype=float)
+    pd.testing.assert_series_equal(cleaner.clean_numeric_column(values), expected)
+
+
+def test_clean_numeric_column_matches_apply_on_random_strings(cleaner):
+    rng = np.random.default_rng(0)
+    alphabet = np.array(list('0000123456789...---$, ab\t'))
+    lengths = rng.integers(0, 10, 20_000)
+    values = pd.Series([''.join(rng.choice(alphabet, length)) for length in lengths]).astype('str')
+    pd.testing.assert_series_equal(cleaner.clean_numeric_column(values), values.apply(cleaner.clean_numeric))
+
+
+@pytest.mark.parametrize('values', [
+    pd.Series([1, 2, 3]),
+    pd.Series([1.5, np.nan, -2.0], name='amount'),
+    pd.Series([True, False]),
+    pd.Series([1, None], dtype='Int64'),
+    pd.Series([np.nan, np.nan]),
+    pd.Series(['n/a', None], dtype=object),
+    pd.Series([], dtype=object)
+])
+def test_clean_numeric_column_matches_apply_on_other_columns(values, cleaner):
+    pd.testing.assert_series_equal(cleaner.clean_numeric_column(values), values.apply(cleaner.clean_numeric))
+
+
+def test_clean_numeric_column_keeps_a_repeated_index(cleaner):
+    values = pd.Series(['$1,234.5', '17-', '3.14.15', '--000173'], index=[0, 0, 1, 1]).astype('str')
+    pd.testing.assert_series_equal(cleaner.clean_numeric_column(values), values.apply(cleaner.clean_numeric))
+
+
+# Values covering each of clean_date's formats and the ones it cannot read
+DATE_CASES = [
+    '2024-01-05', '2024-1-5', '2024/01/05', '2024/1/5', '05/01/2024', '5/1/2024', '13/01/2024',
+    '01/13/2024', '1/13/2024', '31/12/1999', '12/31/1999', '2024-02-30', '2024-13-01', '0999-01-01',
+    '0999/1/1', '1/1/0999', '2024-01-05 10:30:00', '05/01/2024T10:30', ' 2024-01-05\t', '\u20032024-01-05',
+    '2024-01-05\u00a0x', '\u0662\u0660\u0662\u0664-\u0660\u0661-\u0660\u0661', '', ' ', '\t\n',
+    'n/a', '2024', '2024-01', '--', None
+]
+
+
+@pytest.mark.parametrize('values', [
+    pd.Series(DATE_CASES, dtype=object),
+    pd.Series(DATE_CASES).astype('str'),
+    pd.Series(DATE_CASES + [1.5, 20240105], dtype=object, index=[0] * (len(DATE_CASES) + 2)),
+    pd.Series([' ', ' ']),
+    pd.Series(['\u0662\u0660\u0662\u0664-\u0660\u0661-\u0660\u0661']),
+    pd.Series(['0999-01-01', '']),
+    pd.Series(['', '']),
+    pd.Series([None, None], dtype=object),
+    pd.Series([], dtype=object)
+])
+def test_clean_date_column_matches_apply(values, cleaner):
+    pd.testing.assert_series_equal(cleaner.clean_date_column(values), values.apply(cleaner.clean_date))
+
+
+def test_clean_date_column_matches_apply_on_random_strings(cleaner):
+    rng = np.random.default_rng(0)
+    alphabet = np.array(list('0000111223456789--//  :T\t'))
+    lengths = rng.integers(0, 14, 20_000)
+    values = pd.Series([''.join(rng.choice(alphabet, length)) for length in lengths]).astype('str')
+    pd.testing.assert_series_equal(cleaner.clean_date_column(values), values.apply(cleaner.clean_date))
+
+
+@pytest.mark.parametrize('values', [
+    pd.Series([' a  b', 'a b', None, np.nan, 'a b'], dtype=object, index=[3, 3, 1, 1, 0], name='text'),
+    pd.Series([' Open', 'Closed ', None, 'Open']).astype('str'),
+    pd.Series([0.0, -0.0, np.nan, 1.5, 0.0]),
+    pd.Series([1, True, 1.0], dtype=object),
+    pd.Series(pd.Categorical(['a', 'b', 'a'])),
+    pd.Series([], dtype=object)
+])
+def test_clean_distinct_matches_apply(values, cleaner):
+    valid = ['Open', 'a b']
+    for func in (cleaner.clean_text, cleaner.clean_categorical, lambda x: x if x in valid else 'Open'):
+        pd.testing.assert_series_equal(cleaner.clean_distinct(values, func), values.apply(func))
+        pd.testing.assert_series_equal(cleaner.clean_distinct(values, func, memo=True), values.apply(func))
+
+
+def test_clean_distinct_vectorized_matches_apply(cleaner):
+    values = pd.Series(['2024-01-05', '05/01/2024 10:00', None, '2024-01-05', 'n/a'] * 3)
+    pd.testing.assert_series_equal(cleaner.clean_distinct(values, cleaner.clean_date_column, vectorized=True),
+                                   values.apply(cleaner.clean_date))
+
+
+def test_clean_distinct_memo_is_shared_across_columns():
+    cleaner = DataCleaner(memo_size=2)
+    cleaner.clean_distinct(pd.Series(['a ', 'b ', 'a ']), cleaner.clean_text, memo=True)
+    cleaner.clean_distinct(pd.Series(['b ', 'c ']), cleaner.clean_text, memo=True)
+    info = cleaner.memoized(cleaner.clean_text).cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 3, 2)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """A few small files to clean, with columns that are missing throughout some row ranges"""
+    (tmp_path / 'water_utilities_metrics').mkdir()
+    (tmp_path / 'workforce_data').mkdir()
+    # ' ' and '1-2' fail to parse, and are logged, in more than one shard
+    pd.DataFrame({
+        'project_id': ['P1', 'P2', 'P3', 'P4', 'P5', 'P6', 'P7'],
+        'start_date': ['2024-01-05', ' ', None, None, 'n/a', ' ', '2024-13-01'],
+        'budget': ['1-2', None, None, '17-', '3.14.15', '1-2', '2-1']
+    }).to_csv(tmp_path / 'water_utilities_metrics' / 'capex_projects.csv', index=False)
+    pd.DataFrame({
+        'leave_date': [None, None, '2023/12/01'],
+        'days': [1, 2, None]
+    }).to_csv(tmp_path / 'workforce_data' / 'leave_records.csv', index=False)
+    (tmp_path / 'workforce_data' / 'broken.csv').write_text('')
+    return tmp_path
+
+
+def test_clean_all_data_in_parallel_matches_sequential(data_dir, caplog):
+    with caplog.at_level(logging.INFO):
+        sequential = DataCleaner().clean_all_data(str(data_dir))
+        sequential_log = [record.getMessage() for record in caplog.records]
+        caplog.clear()
+        cleaner = DataCleaner()
+        parallel = cleaner.clean_all_data(str(data_dir), workers=2, shard_rows=2)
+        parallel_log = [record.getMessage() for record in caplog.records]
+
+    assert list(parallel) == list(sequential) == list(cleaner.timings)
+    for key in sequential:
+        pd.testing.assert_frame_equal(parallel[key], sequential[key])
+    assert any(message.startswith('Error cleaning numeric value 1-2') for message in parallel_log)
+    assert any(message.startswith('Error cleaning date') for message in parallel_log)
+    # Messages in the same order, apart from the timings
+    assert [message.split(' in ')[0] for message in parallel_log] == \
+        [message.split(' in ')[0] for message in sequential_log]
+
+
+def test_stream_all_data_writes_what_save_cleaned_data_writes(data_dir, tmp_path):
+    cleaner = DataCleaner()
+    cleaner.clean_all_data(str(data_dir))
+    cleaner.save_cleaned_data(str(tmp_path / 'saved'))
+    streamer = DataCleaner()
+    streamer.stream_all_data(str(data_dir), str(tmp_path / 'streamed'), chunk_rows=2)
+
+    assert sorted(streamer.timings) == sorted(cleaner.cleaned_data)
+    for key in cleaner.cleaned_data:
+        assert (tmp_path / 'streamed' / key).read_text() == (tmp_path / 'saved' / key).read_text()
+    assert not (tmp_path / 'streamed' / 'workforce_data' / 'broken.csv').exists()
+
+
+@pytest.mark.benchmark
+def test_clean_numeric_column_ten_million_rows(cleaner):
+    samples = ['1234.5', '$1,234.56', '--000173', '-0042', '17-', '3.14.15', '-2019-6061', 'n/a', '']
+    values = pd.Series(np.random.default_rng(0).choice(samples, 10_000_000)).astype('str')
+    start = time.perf_counter()
+    cleaned = cleaner.clean_numeric_column(values)
+    elapsed = time.perf_counter() - start
+    assert cleaned.notna().any()
+    assert elapsed < TEN_MILLION_ROW_SECONDS, f"10M rows took {elapsed:.1f}s"
@@ -0,0 +1,58 @@
+import os
+from pathlib import Path
+import pytest
+from generator_benchmark import (BENCHMARK_SCALES, DEFAULT_BASELINE, DEFAULT_THRESHOLD, benchmark_key,
+                                 find_regression, load_baselines, run_benchmark, save_baselines)
+
+CONFIG_DIR = Path(__file__).resolve().parents[1] / 'data' / 'raw'
+
+# Allowed drop in rows/sec, overridable for noisy machines
+THRESHOLD = float(os.environ.get('BENCHMARK_THRESHOLD', DEFAULT_THRESHOLD))
+
+
+def _result(rows_per_second, name='workforce', scale=0.05):
+    return {'generator': name, 'scale': scale, 'rows_per_second': rows_per_second}
+
+
+def test_no_regression_within_threshold():
+    baselines = {benchmark_key('workforce', 0.05): _result(1000.0)}
+    assert find_regression(_result(800.0), baselines, threshold=0.25) is None
+    assert find_regression(_result(1500.0), baselines, threshold=0.25) is None
+
+
+def test_regression_beyond_threshold():
+    baselines = {benchmark_key('workforce', 0.05): _result(1000.0)}
+    message = find_regression(_result(700.0), baselines, threshold=0.25)
+    assert message is not None and message.startswith('workforce@0.05')
+
+
+def test_no_regression_without_baseline():
+    assert find_regression(_result(1.0), {}, threshold=0.25) is None
+
+
+def test_save_baselines_keeps_other_entries(tmp_path):
+    path = tmp_path / 'baselines.json'
+    save_baselines([_result(10.0, scale=0.01)], path)
+    save_baselines([_result(20.0, scale=0.05)], path)
+    save_baselines([_result(30.0, scale=0.01)], path)
+    baselines = load_baselines(path)
+    assert baselines[benchmark_key('workforce', 0.01)]['rows_per_second'] == 30.0
+    assert baselines[benchmark_key('workforce', 0.05)]['rows_per_second'] == 20.0
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('name,scale', [(name, scale) for name, scales in BENCHMARK_SCALES.items()
+                                        for scale in scales])
+def test_generator_throughput(name, scale, request):
+    result = run_benchmark(name, scale, CONFIG_DIR)
+    assert result['rows'] > 0
+    assert all(table['bytes'] > 0 for table in result['tables'].values() if table['rows'])
+
+    if request.config.getoption('--update-benchmark-baselines'):
+        save_baselines([result], DEFAULT_BASELINE)
+        return
+    baselines = load_baselines(DEFAULT_BASELINE)
+    if benchmark_key(name, scale) not in baselines:
+        pytest.skip(f"no baseline for {benchmark_key(name, scale)}; record one with --update-benchmark-baselines")
+    regression = find_regression(result, baselines, THRESHOLD)
+    assert regression is None, regression
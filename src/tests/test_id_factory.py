@@ -0,0 +1,43 @@
+import pytest
+from id_factory import IdFactory
+
+
+@pytest.mark.parametrize('length', [1, 8, 15, 16])
+def test_random_ids_are_distinct_and_full_width(length):
+    size = min(16 ** length, 50_000)
+    ids = IdFactory(42).random('SERIAL_', size, length)
+    assert len(set(ids)) == size
+    assert {len(value) for value in ids} == {len('SERIAL_') + length}
+
+
+def test_random_ids_repeat_with_the_seed():
+    assert list(IdFactory(42).random('TECH_', 1000, 16)) == list(IdFactory(42).random('TECH_', 1000, 16))
+    assert list(IdFactory(42).random('TECH_', 1000)) != list(IdFactory(43).random('TECH_', 1000))
+
+
+def test_random_ids_reject_lengths_out_of_range():
+    with pytest.raises(ValueError):
+        IdFactory().random('X_', 1, 17)
+    with pytest.raises(ValueError):
+        IdFactory().random('X_', 17, 1)
+
+
+def test_sequential_ids_continue_per_prefix_across_calls():
+    ids = IdFactory(42)
+    assert list(ids.sequential('WO_', 2)) == ['WO_00000001', 'WO_00000002']
+    assert list(ids.sequential('SECT_', 1)) == ['SECT_00000001']
+    assert list(ids.sequential('WO_', 2)) == ['WO_00000003', 'WO_00000004']
+
+
+def test_sequential_ids_pad_to_width_and_widen_past_it():
+    ids = IdFactory(42)
+    assert list(ids.sequential('TRN-', 3, width=2)) == ['TRN-01', 'TRN-02', 'TRN-03']
+    issued = ids.sequential('TRN-', 97, width=2)
+    assert issued[-1] == 'TRN-100'
+    assert {len(value) for value in issued} == {len('TRN-100')}
+
+
+def test_sequential_ids_number_on_from_start():
+    ids = IdFactory(42)
+    assert list(ids.sequential('LEV-', 2, width=6, start=41)) == ['LEV-000042', 'LEV-000043']
+    assert list(ids.sequential('LEV-', 1, width=6)) == ['LEV-000044']
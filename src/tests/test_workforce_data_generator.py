@@ -0,0 +1,22 @@
+import contextlib
+import io
+from pathlib import Path
+from generation_planner import _working_dir
+from workforce_data_generator import WorkforceDataGenerator
+
+CONFIG_DIR = Path(__file__).resolve().parents[1] / 'data' / 'raw'
+
+
+def test_employee_emails_are_unique_and_carry_the_employee_id():
+    with _working_dir(CONFIG_DIR), contextlib.redirect_stdout(io.StringIO()):
+        generator = WorkforceDataGenerator(scale=3)
+        # One shard per department, as generate_all_data runs them, each numbering its own employees
+        employees = generator._renumber_employees(generator.run_shards(
+            [((department, 'employees'), 'generate_employee_data', ([department], False))
+             for department in generator.config['departments']]
+        ))
+
+    assert employees['email'].is_unique
+    suffixes = employees['email'].str.extract(r'\.([a-z]{2}\d{6})@', expand=False)
+    expected = employees['employee_id'].str[4:].str.replace('-', '').str.lower()
+    assert (suffixes == expected).all()